@@ -8,6 +8,9 @@ Platforms:
 - Binary Sensor: Health monitoring (update status)
 - Button: Manual data refresh
 
+Services (services.py): get_forecast and get_quotes return the full data of
+an entry, which is kept out of the recorder.
+
 Last updated: 2025-11-27
 """
 from __future__ import annotations
@@ -17,11 +20,14 @@ from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_MODE, DOMAIN, MODE_EXTERNAL
+from .const import CONF_DEFERRED_STARTUP, CONF_MODE, DOMAIN, FORECAST_CACHE, MODE_EXTERNAL
 from .coordinator import MeteocatCoordinator
+from .services import async_setup_services
+from .startup import async_defer_first_refresh
 
 if TYPE_CHECKING:
     from .api import MeteocatAPI
@@ -33,6 +39,12 @@ PLATFORMS: list[Platform] = [Platform.WEATHER, Platform.SENSOR, Platform.BUTTON,
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Meteocat (Community Edition) services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Meteocat (Community Edition) from a config entry.
     
@@ -46,6 +58,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     DO NOT add any additional update calls here, as they would waste API quota.
     Updates will automatically happen at the configured times (default 06:00 and 14:00).
     
+    With the deferred startup option (and Home Assistant still starting), the
+    entry starts from its last saved data and both steps run once Home
+    Assistant has started (startup.py).
+    
     Test Coverage: test_no_duplicate_updates_on_ha_restart in test_scheduled_updates.py
     """
     
@@ -63,17 +79,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await hass.config_entries.async_update_entry(entry, options=new_options)
         _LOGGER.info("Migrated API key from options to data for entry %s", entry.title)
     
-    # ⚠️ CRITICAL: First refresh - this is the ONLY manual update call
-    # All future updates will be scheduled automatically
-    await coordinator.async_config_entry_first_refresh()
-    
-    # ⚠️ CRITICAL: Schedule future updates at configured times
-    # This MUST be called to enable scheduled updates
-    coordinator._schedule_next_update()
+    # Entities start from the last saved data, no network call during startup.
+    # Without saved data (first start with the option) the first refresh is not
+    # deferred: the sensors created from the data need it
+    deferred = (
+        (entry.options or {}).get(CONF_DEFERRED_STARTUP) is True
+        and hass.state is not CoreState.running
+        and await coordinator.async_restore_snapshot()
+    )
+    if not deferred:
+        # ⚠️ CRITICAL: First refresh - this is the ONLY manual update call
+        # All future updates will be scheduled automatically
+        await coordinator.async_config_entry_first_refresh()
+        
+        # ⚠️ CRITICAL: Schedule future updates at configured times
+        # This MUST be called to enable scheduled updates
+        coordinator._schedule_next_update()
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
+    if deferred:
+        # First refresh and scheduling, batched with the other entries
+        async_defer_first_refresh(hass, coordinator)
+    
     # Load all platforms for both modes (External and Local)
     # Weather entity is now supported in both modes
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -115,5 +144,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, platforms):
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            # Last entry gone: drop the shared forecasts
+            hass.data.pop(FORECAST_CACHE, None)
     
     return unload_ok
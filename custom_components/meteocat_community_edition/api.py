@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import date, datetime, timezone
 from typing import Any
 
 import aiohttp
@@ -18,6 +18,7 @@ from .const import (
     ENDPOINT_QUOTES,
     ENDPOINT_XEMA_MEASUREMENTS,
     ENDPOINT_XEMA_STATIONS,
+    ENDPOINT_XEMA_VARIABLES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,13 +29,26 @@ RETRY_BACKOFF_FACTOR = 2  # Exponential backoff: 1s, 2s, 4s
 
 
 class MeteocatAPIError(Exception):
-    """Base exception for Meteocat API errors."""
+    """Base exception for Meteocat API errors.
+
+    ``status`` holds the HTTP status code when the error came from a response,
+    or None for network errors and timeouts.
+    """
+
+    def __init__(self, message: str = "", status: int | None = None) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.status = status
 
 
 class MeteocatAuthError(MeteocatAPIError):
     """Exception for authentication errors (401, 403)."""
 
 
+class MeteocatConnectionError(MeteocatAPIError):
+    """Exception for network errors and timeouts (no response)."""
+
+
 class MeteocatAPI:
     """Class to interact with Meteocat API."""
 
@@ -84,7 +98,8 @@ class MeteocatAPI:
                         )
                         raise MeteocatAuthError(
                             f"Authentication failed with status {response.status}. "
-                            "Please check your API key."
+                            "Please check your API key.",
+                            status=response.status,
                         )
                     
                     # Handle rate limiting (429) - retry with backoff
@@ -97,7 +112,10 @@ class MeteocatAPI:
                             )
                             await asyncio.sleep(retry_after)
                             return await self._request(method, endpoint, params, retry_count + 1)
-                        raise MeteocatAPIError(f"Rate limit exceeded for {endpoint} after {MAX_RETRIES} retries")
+                        raise MeteocatAPIError(
+                            f"Rate limit exceeded for {endpoint} after {MAX_RETRIES} retries",
+                            status=429,
+                        )
                     
                     response.raise_for_status()
                     
@@ -122,6 +140,26 @@ class MeteocatAPI:
         except MeteocatAuthError:
             # Re-raise auth errors without retry
             raise
+        except aiohttp.ClientResponseError as err:
+            # Client errors (4xx) are permanent, retrying would only waste quota
+            if err.status < 500:
+                raise MeteocatAPIError(
+                    f"Error {err.status} from Meteocat API for {endpoint}: {err.message}",
+                    status=err.status,
+                ) from err
+            if retry_count < MAX_RETRIES:
+                backoff_time = RETRY_BACKOFF_FACTOR ** retry_count
+                _LOGGER.warning(
+                    "Server error %s for %s. Retrying in %d seconds (attempt %d/%d)",
+                    err.status, endpoint, backoff_time, retry_count + 1, MAX_RETRIES
+                )
+                await asyncio.sleep(backoff_time)
+                return await self._request(method, endpoint, params, retry_count + 1)
+            _LOGGER.error("Server error %s for %s after %d retries", err.status, endpoint, MAX_RETRIES)
+            raise MeteocatAPIError(
+                f"Error connecting to Meteocat API: {err.status}, message={err.message}",
+                status=err.status,
+            ) from err
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             # Retry on network errors with exponential backoff
             if retry_count < MAX_RETRIES:
@@ -136,7 +174,7 @@ class MeteocatAPI:
             # Max retries exceeded
             error_msg = f"Timeout connecting to Meteocat API" if isinstance(err, asyncio.TimeoutError) else f"Error connecting to Meteocat API: {err}"
             _LOGGER.error("%s after %d retries", error_msg, MAX_RETRIES)
-            raise MeteocatAPIError(error_msg) from err
+            raise MeteocatConnectionError(error_msg) from err
 
     async def get_comarques(self) -> list[dict[str, Any]]:
         """Get list of comarques (counties)."""
@@ -159,15 +197,31 @@ class MeteocatAPI:
         ]
 
     async def get_station_measurements(
-        self, station_code: str
+        self, station_code: str, day: date | None = None
     ) -> dict[str, Any]:
-        """Get current measurements for a station."""
+        """Get measurements for a station (current UTC day unless a day is given)."""
         _LOGGER.debug("Fetching measurements for station %s", station_code)
         # API requires date: /xema/v1/estacions/mesurades/{codi}/{any}/{mes}/{dia}
-        now = datetime.now()
+        # XEMA days are UTC days, not local ones
+        now = day or datetime.now(timezone.utc)
         endpoint = f"/xema/v1/estacions/mesurades/{station_code}/{now.year}/{now.month:02d}/{now.day:02d}"
         return await self._request("GET", endpoint)
 
+    async def get_variable_measurements(
+        self, variable_code: int, day: date | None = None
+    ) -> list[dict[str, Any]]:
+        """Get the measurements of a variable for every station (current UTC day unless a day is given)."""
+        _LOGGER.debug("Fetching measurements of variable %s", variable_code)
+        # /xema/v1/variables/mesurades/{codi_variable}/{any}/{mes}/{dia}
+        now = day or datetime.now(timezone.utc)
+        endpoint = f"{ENDPOINT_XEMA_MEASUREMENTS}/{variable_code}/{now.year}/{now.month:02d}/{now.day:02d}"
+        return await self._request("GET", endpoint)
+
+    async def get_variables_metadata(self) -> list[dict[str, Any]]:
+        """Get the name, unit and decimals of every XEMA variable."""
+        _LOGGER.debug("Fetching XEMA variables metadata")
+        return await self._request("GET", ENDPOINT_XEMA_VARIABLES)
+
     async def get_municipalities(self) -> list[dict[str, Any]]:
         """Get list of municipalities."""
         _LOGGER.debug("Fetching municipalities list")
@@ -33,6 +33,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTRIBUTION,
+    CONF_COMARCA_NAME,
     CONF_MODE,
     CONF_MUNICIPALITY_CODE,
     CONF_STATION_CODE,
@@ -41,12 +42,22 @@ from .const import (
     DOMAIN,
     MODE_EXTERNAL,
     MODE_LOCAL,
+    MODE_MULTI,
 )
 from .coordinator import MeteocatCoordinator
+from .entity import MeteocatStaleDataMixin
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _hourly_forecast_idle(coordinator: MeteocatCoordinator) -> bool:
+    """Return True if an on-demand hourly forecast is not fetched for lack of consumers."""
+    return (
+        getattr(coordinator, "hourly_forecast_on_demand", False) is True
+        and not coordinator.hourly_forecast_wanted
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -63,6 +74,9 @@ async def async_setup_entry(
         station_name = entry.data.get(CONF_STATION_NAME, f"Estació {station_code}")
         entity_name = station_name
         entity_name_with_code = f"{station_name} {station_code}"
+    elif mode == MODE_MULTI:
+        entity_name = entry.data.get(CONF_COMARCA_NAME) or entry.title
+        entity_name_with_code = entity_name
     else:
         municipality_code = entry.data.get(CONF_MUNICIPALITY_CODE, "")
         entity_name = entry.data.get(CONF_MUNICIPALITY_NAME, f"Municipi {municipality_code}")
@@ -81,12 +95,12 @@ async def async_setup_entry(
     ])
 
 
-class MeteocatUpdateStatusBinarySensor(CoordinatorEntity[MeteocatCoordinator], BinarySensorEntity):
+class MeteocatUpdateStatusBinarySensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], BinarySensorEntity):
     """Binary sensor for monitoring update status.
     
     Reports whether there are problems with data updates by checking ALL
     API calls based on the configured mode:
-    - MODE_EXTERNAL: Checks measurements data
+    - MODE_EXTERNAL / MODE_MULTI: Checks measurements data
     - MODE_LOCAL: Checks forecast and forecast_hourly data
     
     The sensor:
@@ -106,6 +120,10 @@ class MeteocatUpdateStatusBinarySensor(CoordinatorEntity[MeteocatCoordinator], B
 
     _attr_attribution = ATTRIBUTION
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    # Error details are only useful live and change on every update
+    _unrecorded_attributes = MeteocatStaleDataMixin._unrecorded_attributes | frozenset(
+        {"last_success", "error", "failed_count"}
+    )
 
     def __init__(
         self,
@@ -143,6 +161,8 @@ class MeteocatUpdateStatusBinarySensor(CoordinatorEntity[MeteocatCoordinator], B
         # Set device info to group with other entities
         if mode == MODE_EXTERNAL:
             model = "Estació Externa"
+        elif mode == MODE_MULTI:
+            model = "Estacions XEMA"
         else:
             model = "Estació Local"
         
@@ -170,8 +190,8 @@ class MeteocatUpdateStatusBinarySensor(CoordinatorEntity[MeteocatCoordinator], B
         # Track failed API calls
         failed_calls = []
         
-        # For MODE_EXTERNAL: check measurements (always required)
-        if self._mode == MODE_EXTERNAL:
+        # For MODE_EXTERNAL / MODE_MULTI: check measurements (always required)
+        if self._mode in (MODE_EXTERNAL, MODE_MULTI):
             measurements = self.coordinator.data.get("measurements")
             if measurements is None or (isinstance(measurements, (list, dict)) and len(measurements) == 0):
                 failed_calls.append("measurements")
@@ -188,8 +208,8 @@ class MeteocatUpdateStatusBinarySensor(CoordinatorEntity[MeteocatCoordinator], B
                 if forecast is None or (isinstance(forecast, (list, dict)) and len(forecast) == 0):
                     failed_calls.append("forecast")
             
-            # Check hourly forecast (only if enabled)
-            if self.coordinator.enable_forecast_hourly:
+            # Check hourly forecast (only if enabled and in use)
+            if self.coordinator.enable_forecast_hourly and not _hourly_forecast_idle(self.coordinator):
                 forecast_hourly = self.coordinator.data.get("forecast_hourly")
                 if forecast_hourly is None or (isinstance(forecast_hourly, (list, dict)) and len(forecast_hourly) == 0):
                     failed_calls.append("forecast_hourly")
@@ -224,8 +244,8 @@ class MeteocatUpdateStatusBinarySensor(CoordinatorEntity[MeteocatCoordinator], B
             else:
                 failed_calls = []
                 
-                # Check measurements (MODE_EXTERNAL only)
-                if self._mode == MODE_EXTERNAL:
+                # Check measurements (MODE_EXTERNAL / MODE_MULTI only)
+                if self._mode in (MODE_EXTERNAL, MODE_MULTI):
                     measurements = self.coordinator.data.get("measurements")
                     if measurements is None:
                         failed_calls.append("measurements (API call failed)")
@@ -242,7 +262,7 @@ class MeteocatUpdateStatusBinarySensor(CoordinatorEntity[MeteocatCoordinator], B
                         elif isinstance(forecast, (list, dict)) and len(forecast) == 0:
                             failed_calls.append("forecast (empty/quota exhausted)")
                     
-                    if self.coordinator.enable_forecast_hourly:
+                    if self.coordinator.enable_forecast_hourly and not _hourly_forecast_idle(self.coordinator):
                         forecast_hourly = self.coordinator.data.get("forecast_hourly")
                         if forecast_hourly is None:
                             failed_calls.append("forecast_hourly (API call failed)")
@@ -257,6 +277,7 @@ class MeteocatUpdateStatusBinarySensor(CoordinatorEntity[MeteocatCoordinator], B
         else:
             attrs["status"] = "ok"
         
+        attrs.update(self._stale_data_attributes())
         return attrs
 
     @property
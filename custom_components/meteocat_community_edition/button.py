@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, CONF_MODE, DOMAIN, MODE_LOCAL, MODE_EXTERNAL
+from .const import ATTRIBUTION, CONF_COMARCA_NAME, CONF_MODE, DOMAIN, MODE_LOCAL, MODE_EXTERNAL, MODE_MULTI
 from .coordinator import MeteocatCoordinator
 
 
@@ -28,6 +28,9 @@ async def async_setup_entry(
         station_name = entry.data.get(CONF_STATION_NAME, f"Station {station_code}")
         entity_name = station_name
         device_name = f"{station_name} {station_code}"
+    elif mode == MODE_MULTI:
+        entity_name = entry.data.get(CONF_COMARCA_NAME) or entry.title
+        device_name = entity_name
     else:  # MODE_LOCAL
         municipality_code = entry.data.get("municipality_code")
         entity_name = entry.data.get(CONF_MUNICIPALITY_NAME, f"Municipality {municipality_code}")
@@ -43,6 +46,11 @@ async def async_setup_entry(
         buttons.append(
             MeteocatRefreshForecastButton(coordinator, entry, entity_name, device_name, mode)
         )
+    elif mode == MODE_MULTI:
+        # Multi-station mode: measurements only
+        buttons.append(
+            MeteocatRefreshMeasurementsButton(coordinator, entry, entity_name, device_name, mode)
+        )
     else:
         # Local mode: One button (Forecast)
         buttons.append(
@@ -81,14 +89,14 @@ class MeteocatRefreshMeasurementsButton(CoordinatorEntity[MeteocatCoordinator],
             station_code = entry.data.get("station_code", "").lower()
             code_lower = station_code.replace(" ", "_")
             self.entity_id = f"button.{base_name}_{code_lower}_refresh_measurements"
-        else:  # Should not happen for measurements button, but safe fallback
+        else:  # MODE_MULTI
             self.entity_id = f"button.{base_name}_refresh_measurements"
         # Set device info to group with sensors and weather entity
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": device_name,
             "manufacturer": "Meteocat Edició Comunitària",
-            "model": "Estació Externa",
+            "model": "Estacions XEMA" if mode == MODE_MULTI else "Estació Externa",
         }
 
     @property
@@ -11,6 +11,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import MeteocatAPI, MeteocatAPIError
@@ -23,12 +24,22 @@ from .const import (
     CONF_MUNICIPALITY_CODE,
     CONF_MUNICIPALITY_NAME,
     CONF_STATION_CODE,
+    CONF_STATION_CODES,
     CONF_STATION_NAME,
     CONF_UPDATE_TIME_1,
     CONF_UPDATE_TIME_2,
     CONF_UPDATE_TIME_3,
     CONF_ENABLE_FORECAST_DAILY,
     CONF_ENABLE_FORECAST_HOURLY,
+    CONF_QUOTA_PLANNER,
+    CONF_UPDATE_STAGGER_WINDOW,
+    CONF_HISTORY_WINDOW,
+    CONF_RETRY_MAX_ATTEMPTS,
+    CONF_STATION_FAILOVER,
+    CONF_HOURLY_FORECAST_ON_DEMAND,
+    CONF_DEFERRED_STARTUP,
+    CONF_STALE_DATA_MAX_AGE,
+    CONF_COMPACT_FORECAST_ATTRIBUTES,
     CONF_SENSOR_TEMPERATURE,
     CONF_SENSOR_HUMIDITY,
     CONF_SENSOR_PRESSURE,
@@ -43,13 +54,24 @@ from .const import (
     CONF_SENSOR_DEW_POINT,
     CONF_SENSOR_APPARENT_TEMPERATURE,
     DEFAULT_API_BASE_URL,
+    DEFAULT_HISTORY_WINDOW,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_STALE_DATA_MAX_AGE,
+    DEFAULT_UPDATE_STAGGER_WINDOW,
     DEFAULT_UPDATE_TIME_1,
     DEFAULT_UPDATE_TIME_2,
     DOMAIN,
+    MAX_HISTORY_WINDOW,
+    MAX_RETRY_MAX_ATTEMPTS,
+    MAX_STALE_DATA_MAX_AGE,
+    MAX_UPDATE_STAGGER_WINDOW,
+    MIN_HISTORY_WINDOW,
     MODE_LOCAL,
     MODE_LOCAL_LABEL,
     MODE_EXTERNAL,
     MODE_EXTERNAL_LABEL,
+    MODE_MULTI,
+    MODE_MULTI_LABEL,
     METEOCAT_CONDITION_MAP,
 )
 
@@ -454,6 +476,7 @@ class MeteocatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         external_label = MODE_EXTERNAL_LABEL
         local_label = MODE_LOCAL_LABEL
+        multi_label = MODE_MULTI_LABEL
 
         return self.async_show_form(
             step_id="mode",
@@ -462,6 +485,7 @@ class MeteocatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_MODE, default=MODE_EXTERNAL): vol.In({
                         MODE_EXTERNAL: external_label,
                         MODE_LOCAL: local_label,
+                        MODE_MULTI: multi_label,
                     }),
                 }
             ),
@@ -487,7 +511,7 @@ class MeteocatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 session = async_get_clientsession(self.hass)
                 api = MeteocatAPI(self.api_key, session, self.api_base_url)
                 
-                if self.mode == MODE_EXTERNAL:
+                if self.mode in (MODE_EXTERNAL, MODE_MULTI):
                     # Fetch stations for selected comarca
                     _LOGGER.debug("Fetching stations for comarca: %s", self.comarca_code)
                     self._stations = await api.get_stations_by_comarca(self.comarca_code)
@@ -497,6 +521,8 @@ class MeteocatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         errors["base"] = "no_stations"
                     else:
                         _LOGGER.debug("Found %d stations for comarca: %s", len(self._stations), self.comarca_code)
+                        if self.mode == MODE_MULTI:
+                            return await self.async_step_stations()
                         return await self.async_step_station()
                 else:
                     # Fetch municipalities for selected comarca
@@ -606,6 +632,65 @@ class MeteocatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_stations(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the station selection step of a multi-station entry."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            station_codes = sorted(user_input.get(CONF_STATION_CODES) or [])
+            
+            if not station_codes:
+                errors["base"] = "no_stations_selected"
+            else:
+                # Check if the same selection is already configured
+                await self.async_set_unique_id(f"multi_{'_'.join(station_codes)}")
+                self._abort_if_unique_id_configured()
+                
+                # Station metadata saved to entry.data to avoid API calls during runtime
+                stations_data = {
+                    station.get("codi"): station
+                    for station in self._stations
+                    if station.get("codi") in station_codes
+                }
+                
+                _LOGGER.info(
+                    "Creating multi-station entry for %s with %d stations",
+                    self.comarca_name,
+                    len(station_codes),
+                )
+                return self.async_create_entry(
+                    title=f"{self.comarca_name} ({len(station_codes)})",
+                    data={
+                        CONF_API_KEY: self.api_key,
+                        CONF_MODE: MODE_MULTI,
+                        CONF_STATION_CODES: station_codes,
+                        CONF_COMARCA_CODE: self.comarca_code,
+                        CONF_COMARCA_NAME: self.comarca_name,
+                        "_stations_data": stations_data,
+                    },
+                    options={
+                        CONF_API_BASE_URL: self.api_base_url,
+                    },
+                )
+
+        # Create station options (all selected by default)
+        station_options = OrderedDict(
+            (station.get("codi"), f"{station.get('nom')} ({station.get('codi')})")
+            for station in sorted(self._stations, key=lambda x: x.get("nom", "").lower())
+        )
+
+        return self.async_show_form(
+            step_id="stations",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_STATION_CODES, default=list(station_options)): cv.multi_select(station_options),
+                }
+            ),
+            errors=errors,
+        )
+
     async def async_step_municipality(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -930,13 +1015,15 @@ class MeteocatOptionsFlow(config_entries.OptionsFlow):
             elif not isinstance(enable_hourly, bool):
                 enable_hourly = bool(enable_hourly)
             
-            time_errors = validate_update_times(time1, time2, time3)
-            errors.update(time_errors)
-            
-            # Validate forecast selection
+            # Multi-station entries have no forecast: no update times nor forecast options
             mode = self.updated_data.get(CONF_MODE)
-            if enable_daily is False and enable_hourly is False:
-                errors["base"] = "must_select_one_forecast"
+            if mode != MODE_MULTI:
+                time_errors = validate_update_times(time1, time2, time3)
+                errors.update(time_errors)
+                
+                # Validate forecast selection
+                if enable_daily is False and enable_hourly is False:
+                    errors["base"] = "must_select_one_forecast"
             
             if not errors:
                 # Ensure API key is preserved in data
@@ -948,11 +1035,38 @@ class MeteocatOptionsFlow(config_entries.OptionsFlow):
                     # Update local state
                     self.updated_data[CONF_API_KEY] = api_key
                     self.updated_options[CONF_API_KEY] = api_key
-                    self.updated_options[CONF_UPDATE_TIME_1] = time1
-                    self.updated_options[CONF_UPDATE_TIME_2] = time2
-                    self.updated_options[CONF_UPDATE_TIME_3] = time3
-                    self.updated_options[CONF_ENABLE_FORECAST_DAILY] = enable_daily
-                    self.updated_options[CONF_ENABLE_FORECAST_HOURLY] = enable_hourly
+                    if mode != MODE_MULTI:
+                        self.updated_options[CONF_UPDATE_TIME_1] = time1
+                        self.updated_options[CONF_UPDATE_TIME_2] = time2
+                        self.updated_options[CONF_UPDATE_TIME_3] = time3
+                        self.updated_options[CONF_ENABLE_FORECAST_DAILY] = enable_daily
+                        self.updated_options[CONF_ENABLE_FORECAST_HOURLY] = enable_hourly
+                        self.updated_options[CONF_HOURLY_FORECAST_ON_DEMAND] = bool(
+                            user_input.get(CONF_HOURLY_FORECAST_ON_DEMAND, False)
+                        )
+                        self.updated_options[CONF_COMPACT_FORECAST_ATTRIBUTES] = bool(
+                            user_input.get(CONF_COMPACT_FORECAST_ATTRIBUTES, False)
+                        )
+                    self.updated_options[CONF_QUOTA_PLANNER] = bool(user_input.get(CONF_QUOTA_PLANNER, False))
+                    self.updated_options[CONF_UPDATE_STAGGER_WINDOW] = user_input.get(
+                        CONF_UPDATE_STAGGER_WINDOW, DEFAULT_UPDATE_STAGGER_WINDOW
+                    )
+                    self.updated_options[CONF_RETRY_MAX_ATTEMPTS] = user_input.get(
+                        CONF_RETRY_MAX_ATTEMPTS, DEFAULT_RETRY_MAX_ATTEMPTS
+                    )
+                    self.updated_options[CONF_DEFERRED_STARTUP] = bool(
+                        user_input.get(CONF_DEFERRED_STARTUP, False)
+                    )
+                    self.updated_options[CONF_STALE_DATA_MAX_AGE] = user_input.get(
+                        CONF_STALE_DATA_MAX_AGE, DEFAULT_STALE_DATA_MAX_AGE
+                    )
+                    if mode == MODE_EXTERNAL:
+                        self.updated_options[CONF_HISTORY_WINDOW] = user_input.get(
+                            CONF_HISTORY_WINDOW, DEFAULT_HISTORY_WINDOW
+                        )
+                        self.updated_options[CONF_STATION_FAILOVER] = bool(
+                            user_input.get(CONF_STATION_FAILOVER, False)
+                        )
                     
                     if mode == MODE_LOCAL:
                         return await self.async_step_local_sensors()
@@ -975,45 +1089,49 @@ class MeteocatOptionsFlow(config_entries.OptionsFlow):
         if not isinstance(current_enable_hourly, bool):
             current_enable_hourly = False  # Default
 
-        # Build schema
-        schema_dict = {
-            vol.Required(
-                CONF_UPDATE_TIME_1,
-                default=self.updated_options.get(
-                    CONF_UPDATE_TIME_1, self.updated_data.get(
-                        CONF_UPDATE_TIME_1, DEFAULT_UPDATE_TIME_1
-                    )
-                ),
-            ): str,
+        # Build schema (multi-station entries have no forecast: no update times nor forecast options)
+        schema_dict = {}
+        if mode != MODE_MULTI:
+            schema_dict.update(self._forecast_options_schema(current_enable_daily, current_enable_hourly))
+        schema_dict.update({
             vol.Optional(
-                CONF_UPDATE_TIME_2,
+                CONF_QUOTA_PLANNER,
+                default=self.updated_options.get(CONF_QUOTA_PLANNER, False),
+            ): bool,
+            vol.Optional(
+                CONF_UPDATE_STAGGER_WINDOW,
                 default=self.updated_options.get(
-                    CONF_UPDATE_TIME_2, self.updated_data.get(
-                        CONF_UPDATE_TIME_2, DEFAULT_UPDATE_TIME_2
-                    )
+                    CONF_UPDATE_STAGGER_WINDOW, DEFAULT_UPDATE_STAGGER_WINDOW
                 ),
-            ): str,
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_UPDATE_STAGGER_WINDOW)),
             vol.Optional(
-                CONF_UPDATE_TIME_3,
+                CONF_RETRY_MAX_ATTEMPTS,
                 default=self.updated_options.get(
-                    CONF_UPDATE_TIME_3, self.updated_data.get(
-                        CONF_UPDATE_TIME_3
-                    )
-                ) or vol.UNDEFINED,
-            ): str,
-            vol.Required(
-                CONF_ENABLE_FORECAST_DAILY,
-                default=self.updated_options.get(
-                    CONF_ENABLE_FORECAST_DAILY, current_enable_daily
+                    CONF_RETRY_MAX_ATTEMPTS, DEFAULT_RETRY_MAX_ATTEMPTS
                 ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_RETRY_MAX_ATTEMPTS)),
+            vol.Optional(
+                CONF_DEFERRED_STARTUP,
+                default=self.updated_options.get(CONF_DEFERRED_STARTUP, False),
             ): bool,
-            vol.Required(
-                CONF_ENABLE_FORECAST_HOURLY,
+            vol.Optional(
+                CONF_STALE_DATA_MAX_AGE,
                 default=self.updated_options.get(
-                    CONF_ENABLE_FORECAST_HOURLY, current_enable_hourly
+                    CONF_STALE_DATA_MAX_AGE, DEFAULT_STALE_DATA_MAX_AGE
                 ),
-            ): bool,
-        }
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_STALE_DATA_MAX_AGE)),
+        })
+
+        # Rolling history of station readings only applies to external mode
+        if mode == MODE_EXTERNAL:
+            schema_dict[vol.Optional(
+                CONF_HISTORY_WINDOW,
+                default=self.updated_options.get(CONF_HISTORY_WINDOW, DEFAULT_HISTORY_WINDOW),
+            )] = vol.All(vol.Coerce(int), vol.Range(min=MIN_HISTORY_WINDOW, max=MAX_HISTORY_WINDOW))
+            schema_dict[vol.Optional(
+                CONF_STATION_FAILOVER,
+                default=self.updated_options.get(CONF_STATION_FAILOVER, False),
+            )] = bool
 
         # Add mapping type selector for local mode
         if mode == MODE_LOCAL:
@@ -1044,6 +1162,55 @@ class MeteocatOptionsFlow(config_entries.OptionsFlow):
             errors=errors,
         )
 
+    def _forecast_options_schema(self, enable_daily: bool, enable_hourly: bool) -> dict[Any, Any]:
+        """Return the update times and forecast options of the init step."""
+        return {
+            vol.Required(
+                CONF_UPDATE_TIME_1,
+                default=self.updated_options.get(
+                    CONF_UPDATE_TIME_1, self.updated_data.get(
+                        CONF_UPDATE_TIME_1, DEFAULT_UPDATE_TIME_1
+                    )
+                ),
+            ): str,
+            vol.Optional(
+                CONF_UPDATE_TIME_2,
+                default=self.updated_options.get(
+                    CONF_UPDATE_TIME_2, self.updated_data.get(
+                        CONF_UPDATE_TIME_2, DEFAULT_UPDATE_TIME_2
+                    )
+                ),
+            ): str,
+            vol.Optional(
+                CONF_UPDATE_TIME_3,
+                default=self.updated_options.get(
+                    CONF_UPDATE_TIME_3, self.updated_data.get(
+                        CONF_UPDATE_TIME_3
+                    )
+                ) or vol.UNDEFINED,
+            ): str,
+            vol.Required(
+                CONF_ENABLE_FORECAST_DAILY,
+                default=self.updated_options.get(
+                    CONF_ENABLE_FORECAST_DAILY, enable_daily
+                ),
+            ): bool,
+            vol.Required(
+                CONF_ENABLE_FORECAST_HOURLY,
+                default=self.updated_options.get(
+                    CONF_ENABLE_FORECAST_HOURLY, enable_hourly
+                ),
+            ): bool,
+            vol.Optional(
+                CONF_HOURLY_FORECAST_ON_DEMAND,
+                default=self.updated_options.get(CONF_HOURLY_FORECAST_ON_DEMAND, False),
+            ): bool,
+            vol.Optional(
+                CONF_COMPACT_FORECAST_ATTRIBUTES,
+                default=self.updated_options.get(CONF_COMPACT_FORECAST_ATTRIBUTES, False),
+            ): bool,
+        }
+
     async def async_step_local_sensors(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -13,6 +13,7 @@ CONF_API_KEY: Final = "api_key"
 CONF_MODE: Final = "mode"
 CONF_STATION_CODE: Final = "station_code"
 CONF_STATION_NAME: Final = "station_name"
+CONF_STATION_CODES: Final = "station_codes"
 CONF_MUNICIPALITY_CODE: Final = "municipality_code"
 CONF_MUNICIPALITY_NAME: Final = "municipality_name"
 CONF_COMARCA_CODE: Final = "comarca_code"
@@ -23,6 +24,15 @@ CONF_UPDATE_TIME_2: Final = "update_time_2"
 CONF_UPDATE_TIME_3: Final = "update_time_3"
 CONF_ENABLE_FORECAST_DAILY: Final = "enable_forecast_daily"
 CONF_ENABLE_FORECAST_HOURLY: Final = "enable_forecast_hourly"
+CONF_QUOTA_PLANNER: Final = "quota_planner"
+CONF_UPDATE_STAGGER_WINDOW: Final = "update_stagger_window"
+CONF_HISTORY_WINDOW: Final = "history_window"
+CONF_RETRY_MAX_ATTEMPTS: Final = "retry_max_attempts"
+CONF_STATION_FAILOVER: Final = "station_failover"
+CONF_HOURLY_FORECAST_ON_DEMAND: Final = "hourly_forecast_on_demand"
+CONF_DEFERRED_STARTUP: Final = "deferred_startup"
+CONF_STALE_DATA_MAX_AGE: Final = "stale_data_max_age"
+CONF_COMPACT_FORECAST_ATTRIBUTES: Final = "compact_forecast_attributes"
 
 # Local Sensors Configuration
 CONF_SENSOR_TEMPERATURE: Final = "sensor_temperature"
@@ -42,16 +52,85 @@ CONF_SENSOR_APPARENT_TEMPERATURE: Final = "sensor_apparent_temperature"
 # Configuration modes
 MODE_EXTERNAL: Final = "external"
 MODE_LOCAL: Final = "local"
+MODE_MULTI: Final = "multi"
 
 # Mode labels (used in config flow)
 MODE_EXTERNAL_LABEL: Final = "Externa"
 MODE_LOCAL_LABEL: Final = "Local"
+MODE_MULTI_LABEL: Final = "Diverses estacions"
 
 # Update times (defaults)
 DEFAULT_UPDATE_TIME_1: Final = "06:00"
 DEFAULT_UPDATE_TIME_2: Final = "14:00"
 UPDATE_TIMES: Final = ["06:00", "14:00"]
 
+# Per-entry update offset window (minutes) to spread requests to api.meteo.cat.
+# Opt-in: 0 keeps the exact update times of existing entries
+DEFAULT_UPDATE_STAGGER_WINDOW: Final = 0
+MAX_UPDATE_STAGGER_WINDOW: Final = 30
+
+# Rolling in-memory history of station readings (hours)
+DEFAULT_HISTORY_WINDOW: Final = 24
+MIN_HISTORY_WINDOW: Final = 24
+MAX_HISTORY_WINDOW: Final = 168
+
+# Rolling precipitation sums (minutes), ending at the newest reading or, once
+# readings are late, at the current time less the publication delay. Unknown
+# until the history reaches back the whole window
+PRECIPITATION_WINDOWS: Final = (30, 60, 180, 1440)
+
+# Retry policy after a failed refresh (capped exponential backoff with jitter)
+DEFAULT_RETRY_MAX_ATTEMPTS: Final = 3  # Retries per scheduled slot
+MAX_RETRY_MAX_ATTEMPTS: Final = 6
+RETRY_BASE_DELAY: Final = 60  # Seconds before the first retry
+RETRY_MAX_DELAY: Final = 900  # Cap of the backoff (seconds)
+RETRY_SCHEDULE_GUARD: Final = 120  # No retry this close (seconds) to the next scheduled update
+RETRYABLE_STATUS_CODES: Final = frozenset({429, 500, 502, 503, 504})
+
+# Refresh timing diagnostics
+REFRESH_TRACE_HISTORY: Final = 20  # Refresh traces kept per entry
+SLOW_REFRESH_THRESHOLD: Final = 10  # Seconds, slower refreshes are logged
+
+# Backfill of missed readings into long-term statistics
+BACKFILL_MAX_REQUESTS: Final = 2  # Extra measurement calls allowed per refresh
+BACKFILL_MAX_DAYS: Final = 3  # Older gaps are not recovered
+
+# Measurements are served as a rolling window merged across UTC days
+MEASUREMENTS_WINDOW_HOURS: Final = 24
+MEASUREMENTS_DAY_OVERLAP: Final = 2  # Hours into the UTC day that still need the previous day's tail
+
+# Failover to a neighbouring station when a variable stops reporting
+FAILOVER_STALE_AFTER: Final = 2  # Hours without readings before a variable is replaced
+FAILOVER_MAX_DISTANCE: Final = 25  # km
+FAILOVER_MAX_CANDIDATES: Final = 5
+FAILOVER_MAX_CALLS: Final = 3  # Bulk variable calls per refresh, the rest wait for the next one
+STATION_INDEX_MAX_AGE: Final = 7  # Days before the shared station list is fetched again
+
+# Forecasts shared by every entry (hass.data key)
+FORECAST_CACHE: Final = f"{DOMAIN}_forecast_cache"
+
+# Hourly forecast on demand: hours a consumer keeps it fetched (longer than the
+# longest gap between refreshes, as subscribers are only seen on refreshes)
+HOURLY_FORECAST_DEMAND_TTL: Final = 25
+
+# Deferred startup: entities start from the last snapshot, refreshes run once HA has started
+STARTUP_REFRESH_CONCURRENCY: Final = 2  # Entries refreshed at the same time
+SNAPSHOT_SAVE_DELAY: Final = 60  # Seconds
+STARTUP_QUEUE: Final = f"{DOMAIN}_startup_queue"  # hass.data key
+
+# Serve stale: entities keep the last good data after failed refreshes (minutes, 0 = off)
+DEFAULT_STALE_DATA_MAX_AGE: Final = 0
+MAX_STALE_DATA_MAX_AGE: Final = 1440
+
+# Compact (columnar) forecast attributes, capped well below the 16 KB recorder limit
+FORECAST_ATTRIBUTE_MAX_BYTES: Final = 8192
+
+# Services (responses read from the last update, no API call)
+SERVICE_GET_FORECAST: Final = "get_forecast"
+SERVICE_GET_QUOTES: Final = "get_quotes"
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
+ATTR_FORECAST_TYPE: Final = "type"
+
 # Events
 EVENT_DATA_UPDATED: Final = f"{DOMAIN}_data_updated"
 EVENT_NEXT_UPDATE_CHANGED: Final = f"{DOMAIN}_next_update_changed"
@@ -104,9 +183,16 @@ XEMA_VARIABLES: Final = {
     "solar_radiation": 36,  # Radiació solar (W/m²)
 }
 
+# Forecast variables read by the entities, the rest of the payload is dropped
+FORECAST_DAILY_VARIABLES: Final = ("tmin", "tmax", "estatCel", "estat", "precipitacio")
+FORECAST_HOURLY_VARIABLES: Final = (
+    "temp", "temperatura", "estatCel", "estat", "precipitacio", "precipitació", "humitat", "velVent"
+)
+
 # API Endpoints
 ENDPOINT_XEMA_STATIONS: Final = "/xema/v1/estacions/metadades"
 ENDPOINT_XEMA_MEASUREMENTS: Final = "/xema/v1/variables/mesurades"
+ENDPOINT_XEMA_VARIABLES: Final = "/xema/v1/variables/mesurades/metadades"
 ENDPOINT_MUNICIPALITIES: Final = "/referencia/v1/municipis"
 ENDPOINT_FORECAST_MUNICIPAL: Final = "/pronostic/v1/municipal"
 ENDPOINT_FORECAST_HOURLY: Final = "/pronostic/v1/municipalHoraria"
@@ -16,6 +16,8 @@ Quota Usage (with default 06:00 and 14:00 updates):
 - 2 scheduled updates per day per configured instance
 - MODE_EXTERNAL: Queries XEMA and Forecast plans per update
 - MODE_LOCAL: Queries Forecast plan per update
+- MODE_MULTI: Queries XEMA plan once per variable per update, whatever the number of stations
+- Forecasts are shared by every entry of the same municipality (forecast_cache.py)
 - Station data cached in entry.data to save 1 API call per HA restart
 - Municipality/comarca/province names from config (no API calls needed)
 
@@ -27,6 +29,7 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime, time, timedelta
 import logging
+import random
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -35,6 +38,7 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -44,19 +48,35 @@ except ImportError:
     # Fallback for potential future aiohttp changes
     from aiohttp.client_exceptions import ClientError, ServerTimeoutError
 
-from .api import MeteocatAPI, MeteocatAPIError, MeteocatAuthError
+from .api import MeteocatAPI, MeteocatAPIError, MeteocatAuthError, MeteocatConnectionError
 from .const import (
+    BACKFILL_MAX_DAYS,
+    BACKFILL_MAX_REQUESTS,
     CONF_API_BASE_URL,
     CONF_API_KEY,
+    CONF_DEFERRED_STARTUP,
     CONF_MODE,
     CONF_MUNICIPALITY_CODE,
     CONF_STATION_CODE,
+    CONF_STATION_CODES,
+    CONF_STATION_FAILOVER,
+    CONF_STATION_NAME,
     CONF_UPDATE_TIME_1,
     CONF_UPDATE_TIME_2,
     CONF_UPDATE_TIME_3,
     CONF_ENABLE_FORECAST_DAILY,
     CONF_ENABLE_FORECAST_HOURLY,
+    CONF_HISTORY_WINDOW,
+    CONF_HOURLY_FORECAST_ON_DEMAND,
+    CONF_QUOTA_PLANNER,
+    CONF_RETRY_MAX_ATTEMPTS,
+    CONF_STALE_DATA_MAX_AGE,
+    CONF_UPDATE_STAGGER_WINDOW,
     DEFAULT_API_BASE_URL,
+    DEFAULT_HISTORY_WINDOW,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_STALE_DATA_MAX_AGE,
+    DEFAULT_UPDATE_STAGGER_WINDOW,
     DEFAULT_UPDATE_TIME_1,
     DEFAULT_UPDATE_TIME_2,
     DOMAIN,
@@ -68,8 +88,53 @@ from .const import (
     EVENT_ATTR_TIMESTAMP,
     EVENT_DATA_UPDATED,
     EVENT_NEXT_UPDATE_CHANGED,
+    FAILOVER_MAX_CALLS,
+    FAILOVER_MAX_CANDIDATES,
+    FAILOVER_MAX_DISTANCE,
+    FAILOVER_STALE_AFTER,
+    FORECAST_DAILY_VARIABLES,
+    FORECAST_HOURLY_VARIABLES,
+    HOURLY_FORECAST_DEMAND_TTL,
+    MAX_HISTORY_WINDOW,
+    PRECIPITATION_WINDOWS,
+    MAX_RETRY_MAX_ATTEMPTS,
+    MAX_STALE_DATA_MAX_AGE,
+    MAX_UPDATE_STAGGER_WINDOW,
+    MEASUREMENTS_DAY_OVERLAP,
+    MEASUREMENTS_WINDOW_HOURS,
+    MIN_HISTORY_WINDOW,
     MODE_EXTERNAL,
     MODE_LOCAL,
+    MODE_MULTI,
+    REFRESH_TRACE_HISTORY,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_SCHEDULE_GUARD,
+    RETRYABLE_STATUS_CODES,
+    SLOW_REFRESH_THRESHOLD,
+    SNAPSHOT_SAVE_DELAY,
+    STATION_INDEX_MAX_AGE,
+    XEMA_VARIABLES,
+)
+from .forecast_cache import get_forecast_cache
+from .history import ReadingHistory
+from .statistics import async_import_readings, dedupe_readings
+from .timing import RefreshTrace, RefreshTraces
+from .utils import (
+    build_station_index,
+    build_variable_index,
+    derive_station_metrics,
+    index_quota_plans,
+    calculate_update_plan,
+    extract_readings,
+    get_latest_reading_time,
+    get_planned_update_times,
+    get_update_offset,
+    merge_measurements,
+    nearest_stations,
+    parse_reading_time,
+    project_forecast,
+    project_measurements,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -83,6 +148,8 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry = entry
         self.mode = entry.data.get(CONF_MODE, MODE_EXTERNAL)
         self.station_code = entry.data.get(CONF_STATION_CODE)
+        # Multi-station mode: one coordinator serves every selected station
+        self.station_codes: list[str] = list(entry.data.get(CONF_STATION_CODES) or [])
         self.municipality_code = entry.data.get(CONF_MUNICIPALITY_CODE)
         
         # If municipality code is not set (external mode), try to get it from station_municipality_code
@@ -103,6 +170,64 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.enable_forecast_hourly = entry_options.get(CONF_ENABLE_FORECAST_HOURLY, entry.data.get(CONF_ENABLE_FORECAST_HOURLY, False))
         if self.enable_forecast_hourly is None:
             self.enable_forecast_hourly = False
+        # Hourly forecast on demand: fetched only while the weather entity is asked for it
+        self.hourly_forecast_on_demand = entry_options.get(CONF_HOURLY_FORECAST_ON_DEMAND, False) is True
+        self._hourly_demand_until: datetime | None = None
+        self._hourly_forecast_slot: datetime | None = None
+        
+        # Quota planner: derive the schedule from the remaining quota
+        self.quota_planner = entry_options.get(CONF_QUOTA_PLANNER, False) is True
+        self.planned_measurement_interval: int | None = None
+        self.planned_forecast_times: list[str] | None = None
+        
+        # Deterministic per-entry offset so entries don't all hit the API at once
+        stagger_window = entry_options.get(CONF_UPDATE_STAGGER_WINDOW, DEFAULT_UPDATE_STAGGER_WINDOW)
+        if not isinstance(stagger_window, int) or isinstance(stagger_window, bool):
+            stagger_window = DEFAULT_UPDATE_STAGGER_WINDOW
+        self.update_stagger_window = max(0, min(MAX_UPDATE_STAGGER_WINDOW, stagger_window))
+        self.update_offset = timedelta(
+            seconds=get_update_offset(entry.entry_id, self.update_stagger_window)
+        )
+        
+        # Rolling window of station readings, merged from every measurements fetch
+        history_window = entry_options.get(CONF_HISTORY_WINDOW, DEFAULT_HISTORY_WINDOW)
+        if not isinstance(history_window, int) or isinstance(history_window, bool):
+            history_window = DEFAULT_HISTORY_WINDOW
+        self.history = ReadingHistory(
+            max(MIN_HISTORY_WINDOW, min(MAX_HISTORY_WINDOW, history_window)),
+            dt_util.DEFAULT_TIME_ZONE,
+            {XEMA_VARIABLES["precipitation"]: PRECIPITATION_WINDOWS},
+        )
+        
+        # Retry policy: attempts allowed per scheduled slot after a temporary failure
+        retry_max_attempts = entry_options.get(CONF_RETRY_MAX_ATTEMPTS, DEFAULT_RETRY_MAX_ATTEMPTS)
+        if not isinstance(retry_max_attempts, int) or isinstance(retry_max_attempts, bool):
+            retry_max_attempts = DEFAULT_RETRY_MAX_ATTEMPTS
+        self.retry_max_attempts = max(0, min(MAX_RETRY_MAX_ATTEMPTS, retry_max_attempts))
+        self.retry_attempts = 0
+        
+        # Serve stale: entities keep the last good data after failed refreshes
+        stale_data_max_age = entry_options.get(CONF_STALE_DATA_MAX_AGE, DEFAULT_STALE_DATA_MAX_AGE)
+        if not isinstance(stale_data_max_age, int) or isinstance(stale_data_max_age, bool):
+            stale_data_max_age = DEFAULT_STALE_DATA_MAX_AGE
+        self.stale_data_max_age = timedelta(
+            minutes=max(0, min(MAX_STALE_DATA_MAX_AGE, stale_data_max_age))
+        )
+        self._stale_expiry_remover = None
+        
+        # Failover: serve stale variables from the nearest working station
+        self.station_failover = entry_options.get(CONF_STATION_FAILOVER, False) is True
+        self._failover_candidates: list[dict[str, Any]] | None = None
+        # Bulk payloads by variable code, reused within the same UTC hour
+        self._failover_payloads: dict[int, Any] = {}
+        self._failover_payloads_slot: datetime | None = None
+        
+        # XEMA variable names, units and decimals (see async_get_variable_metadata)
+        self._variable_metadata: dict[int, dict[str, Any]] | None = None
+        
+        # Deferred startup: entities start from the last saved data
+        self.deferred_startup = entry_options.get(CONF_DEFERRED_STARTUP, False) is True
+        self._snapshot_store: Store | None = None
         
         # Get API base URL from options or use default
         api_base_url = entry_options.get(CONF_API_BASE_URL, DEFAULT_API_BASE_URL)
@@ -138,11 +263,34 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.last_measurements_update: datetime | None = None
         self.next_forecast_update: datetime | None = None
         
+        # Backfill: timestamp of the newest reading already imported into statistics
+        self.last_ingested_reading: datetime | None = None
+        self._backfill_store: Store | None = None
+        
+        # Multi-station mode: per-station lookup into the shared snapshot
+        self._station_index: dict[str, list[dict[str, Any]]] = {}
+        self._station_index_source: Any = None
+        
+        # Quota plans by name, once per quotes payload (see get_quota_plan)
+        self._quota_plans: dict[str, dict[str, Any]] = {}
+        self._quota_plans_source: Any = None
+        self._quota_plan_names: frozenset[str] = frozenset()
+        
+        # Dew point, heat index... of the latest readings, once per measurements payload
+        self._derived_metrics: dict[str, float] = {}
+        self._derived_metrics_source: Any = None
+        
+        # Phase timings of the last refreshes (diagnostics)
+        self.refresh_traces = RefreshTraces(REFRESH_TRACE_HISTORY)
+        self._listeners_trace: RefreshTrace | None = None
+        
         name = f"{DOMAIN}_{entry.entry_id}"
         if self.mode == MODE_EXTERNAL and self.station_code:
             name = f"{DOMAIN}_{self.station_code}"
         elif self.mode == MODE_LOCAL:
             name = f"{DOMAIN}_forecast_{entry.entry_id}"
+        elif self.mode == MODE_MULTI:
+            name = f"{DOMAIN}_multi_{entry.entry_id}"
 
         super().__init__(
             hass,
@@ -160,13 +308,22 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         now = dt_util.now()
         
-        if self.mode == MODE_EXTERNAL:
-            # External Mode: Hourly updates
+        if self.mode in (MODE_EXTERNAL, MODE_MULTI):
+            # External/Multi Mode: Hourly updates (or the planner interval)
             # Schedule for the next hour top (e.g. 10:00, 11:00)
-            next_update = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            # shifted by this entry's offset within the stagger window
+            interval = self.planned_measurement_interval or 1
+            hour_start = now.replace(minute=0, second=0, microsecond=0)
+            next_update = hour_start + self.update_offset
+            if next_update <= now:
+                next_update = hour_start + timedelta(hours=interval) + self.update_offset
             
             # Calculate next forecast update for display/logic
             self.next_forecast_update = self._get_next_scheduled_time(now)
+            
+            # With a sparser planned cadence, never skip a forecast slot
+            if interval > 1 and self.next_forecast_update and self.next_forecast_update < next_update:
+                next_update = self.next_forecast_update
         else:
             # Local Mode: Scheduled times only
             next_update = self._get_next_scheduled_time(now)
@@ -190,13 +347,21 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             next_update - now,
         )
 
-    def _get_next_scheduled_time(self, now: datetime) -> datetime | None:
-        """Calculate the next scheduled time based on config."""
-        today = now.date()
+    def get_forecast_update_times(self) -> list[str]:
+        """Return the forecast update times in use (planned or configured)."""
+        if self.quota_planner and self.planned_forecast_times:
+            return list(self.planned_forecast_times)
         
         update_times_list = [self.update_time_1, self.update_time_2]
         if self.update_time_3 and self.update_time_3.strip():
             update_times_list.append(self.update_time_3)
+        return update_times_list
+
+    def _get_next_scheduled_time(self, now: datetime) -> datetime | None:
+        """Calculate the next scheduled time based on config."""
+        today = now.date()
+        
+        update_times_list = self.get_forecast_update_times()
             
         update_datetimes = [
             dt_util.as_local(
@@ -208,8 +373,8 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         next_time = None
         for update_dt in sorted(update_datetimes):
-            if update_dt > now:
-                next_time = update_dt
+            if update_dt + self.update_offset > now:
+                next_time = update_dt + self.update_offset
                 break
         
         if next_time is None:
@@ -218,13 +383,18 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if sorted_times:
                 next_time = dt_util.as_local(
                     datetime.combine(tomorrow, time.fromisoformat(sorted_times[0]))
-                )
+                ) + self.update_offset
         
         return next_time
 
     async def _async_scheduled_update(self, now: datetime) -> None:
         """Handle scheduled update."""
         _LOGGER.info("Running scheduled update at %s", now)
+        # A new slot starts: drop any pending retry and reset the attempts
+        if self._retry_remover:
+            self._retry_remover()
+            self._retry_remover = None
+        self.retry_attempts = 0
         self._schedule_next_update()
         await self.async_request_refresh()
 
@@ -236,36 +406,79 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if self._retry_remover:
             self._retry_remover()
             self._retry_remover = None
+        if self._stale_expiry_remover:
+            self._stale_expiry_remover()
+            self._stale_expiry_remover = None
 
     @callback
     def _is_retryable_error(self, error: Exception) -> bool:
         """Determine if an error is temporary and should trigger a retry."""
         if isinstance(error, MeteocatAuthError):
             return False
-        if isinstance(error, (ServerTimeoutError, ClientError)):
+        if isinstance(error, (ServerTimeoutError, ClientError, asyncio.TimeoutError)):
+            return True
+        if isinstance(error, MeteocatConnectionError):
             return True
         if isinstance(error, MeteocatAPIError):
-            error_msg = str(error).lower()
-            if any(code in error_msg for code in ['500', '502', '503']):
-                return True
-            if any(code in error_msg for code in ['404', '400']):
-                return False
+            return error.status in RETRYABLE_STATUS_CODES
         return False
 
-    async def _schedule_retry_update(self, delay_seconds: int = 60) -> None:
-        """Schedule a retry update after a delay."""
+    def _get_retry_delay(self, attempt: int) -> float:
+        """Return the delay before a retry: capped exponential backoff with jitter.
+        
+        The jitter spreads the delay over [delay/2, delay] so entries that failed
+        together during an incident don't retry in lockstep.
+        """
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _schedule_retry_update(self, delay_seconds: float | None = None) -> bool:
+        """Schedule a retry update after a delay.
+        
+        Returns False (and schedules nothing) when the attempts of this slot are
+        exhausted or the retry would run too close to the next scheduled update.
+        """
         if self._retry_remover:
             self._retry_remover()
             self._retry_remover = None
         
+        if self.retry_attempts >= self.retry_max_attempts:
+            _LOGGER.info(
+                "Not retrying: %d of %d attempts used for this update slot",
+                self.retry_attempts,
+                self.retry_max_attempts,
+            )
+            return False
+        
+        attempt = self.retry_attempts + 1
+        if delay_seconds is None:
+            delay_seconds = self._get_retry_delay(attempt)
         retry_time = dt_util.utcnow() + timedelta(seconds=delay_seconds)
-        _LOGGER.info("Scheduling retry update in %d seconds at %s", delay_seconds, retry_time)
+        
+        if self.next_scheduled_update is not None and retry_time >= (
+            self.next_scheduled_update - timedelta(seconds=RETRY_SCHEDULE_GUARD)
+        ):
+            _LOGGER.info(
+                "Not retrying: the scheduled update at %s will refresh the data",
+                self.next_scheduled_update,
+            )
+            return False
+        
+        self.retry_attempts = attempt
+        _LOGGER.info(
+            "Scheduling retry %d/%d in %d seconds at %s",
+            attempt,
+            self.retry_max_attempts,
+            delay_seconds,
+            retry_time,
+        )
         
         self._retry_remover = async_track_point_in_utc_time(
             self.hass,
             self._async_retry_update,
             retry_time,
         )
+        return True
 
     async def _async_retry_update(self, now: datetime) -> None:
         """Handle retry update after a temporary failure."""
@@ -277,6 +490,52 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._is_retry_update = False
             self._retry_remover = None
 
+    @property
+    def serve_stale(self) -> bool:
+        """Return True if entities keep the last good data after failed refreshes."""
+        return self.stale_data_max_age > timedelta(0)
+
+    @property
+    def data_age(self) -> timedelta | None:
+        """Return the time since the data was last fetched successfully."""
+        if self.last_successful_update_time is None:
+            return None
+        return dt_util.utcnow() - self.last_successful_update_time
+
+    @property
+    def serving_stale_data(self) -> bool:
+        """Return True while the last good data stands in for failed refreshes."""
+        if not self.serve_stale or self.last_update_success or not self.data:
+            return False
+        age = self.data_age
+        return age is not None and age <= self.stale_data_max_age
+
+    @callback
+    def _schedule_stale_expiry(self) -> None:
+        """Update the entities when the last good data gets too old to serve."""
+        if self._stale_expiry_remover:
+            self._stale_expiry_remover()
+            self._stale_expiry_remover = None
+        if not self.serve_stale or self.last_successful_update_time is None:
+            return
+        expiry = self.last_successful_update_time + self.stale_data_max_age
+        if expiry <= dt_util.utcnow():
+            return
+        self._stale_expiry_remover = async_track_point_in_utc_time(
+            self.hass, self._async_stale_data_expired, expiry
+        )
+
+    @callback
+    def _async_stale_data_expired(self, now: datetime) -> None:
+        """Make the entities unavailable once the last good data has expired."""
+        self._stale_expiry_remover = None
+        _LOGGER.warning(
+            "No successful update of %s for %s, entities are now unavailable",
+            self.name,
+            self.stale_data_max_age,
+        )
+        self.async_update_listeners()
+
     def _fire_events(self, current_next_update: datetime | None) -> None:
         """Fire events after update."""
         # Fire event if next update time changed
@@ -331,6 +590,63 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         self.hass.bus.fire(EVENT_DATA_UPDATED, event_data)
 
+    def get_station_variables(self, station_code: str) -> list[dict[str, Any]]:
+        """Return the measured variables of one station of the snapshot.
+        
+        The station index is rebuilt once per new measurements payload, so
+        each entity of a multi-station entry does a dict lookup instead of
+        scanning every station.
+        """
+        measurements = self.data.get("measurements") if self.data else None
+        if measurements is not self._station_index_source:
+            self._station_index_source = measurements
+            self._station_index = {
+                station.get("codi"): station.get("variables", []) or []
+                for station in (measurements if isinstance(measurements, list) else [])
+                if isinstance(station, dict)
+            }
+        return self._station_index.get(station_code, [])
+
+    def get_quota_plan(self, plan_name: str) -> dict[str, Any] | None:
+        """Return a plan of the last quotes payload by name.
+        
+        The index is rebuilt once per new quotes payload, so the quota
+        sensors do a dict lookup instead of scanning the plans on every
+        state write. A change in the set of plans (Meteocat removed or
+        renamed one) is detected there: sensors of a plan that is gone have
+        no value until the entry is reloaded.
+        """
+        quotes = self.data.get("quotes") if self.data else None
+        if quotes is not self._quota_plans_source:
+            self._quota_plans_source = quotes
+            self._quota_plans = index_quota_plans(quotes)
+            names = frozenset(self._quota_plans)
+            if names and names != self._quota_plan_names:
+                if self._quota_plan_names:
+                    _LOGGER.warning(
+                        "Quota plans of %s changed (removed: %s, added: %s), reload the entry to update its sensors",
+                        self.name,
+                        ", ".join(sorted(self._quota_plan_names - names)) or "-",
+                        ", ".join(sorted(names - self._quota_plan_names)) or "-",
+                    )
+                self._quota_plan_names = names
+        return self._quota_plans.get(plan_name)
+
+    def get_derived_metrics(self) -> dict[str, float]:
+        """Return the metrics derived from the latest readings of the station.
+        
+        Computed in one pass when a new measurements payload arrives, so the
+        derived sensors only do a dict lookup on each state write.
+        """
+        measurements = self.data.get("measurements") if self.data else None
+        if measurements is not self._derived_metrics_source:
+            self._derived_metrics_source = measurements
+            station = measurements[0] if isinstance(measurements, list) and measurements else {}
+            self._derived_metrics = derive_station_metrics(
+                station.get("variables") if isinstance(station, dict) else None
+            )
+        return self._derived_metrics
+
     async def async_refresh_measurements(self) -> None:
         """Force refresh of measurements only."""
         self._force_measurements = True
@@ -341,6 +657,42 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._force_forecast = True
         await self.async_request_refresh()
 
+    @property
+    def hourly_forecast_wanted(self) -> bool:
+        """Return True if the hourly forecast has to be fetched on refreshes."""
+        if not self.enable_forecast_hourly:
+            return False
+        if not self.hourly_forecast_on_demand:
+            return True
+        return self._hourly_demand_until is not None and dt_util.utcnow() < self._hourly_demand_until
+
+    async def async_request_hourly_forecast(self) -> None:
+        """Record a consumer of the hourly forecast.
+        
+        Called whenever the weather entity is asked for its hourly forecast
+        (subscribed cards on every refresh, service calls). Demand lasts
+        HOURLY_FORECAST_DEMAND_TTL hours. When it resumes after an idle
+        period the forecast is fetched right away, once per forecast slot.
+        """
+        if not self.enable_forecast_hourly or not self.hourly_forecast_on_demand:
+            return
+        
+        self._hourly_demand_until = dt_util.utcnow() + timedelta(hours=HOURLY_FORECAST_DEMAND_TTL)
+        slot = self._get_forecast_slot()
+        if not self.municipality_code or self._hourly_forecast_slot == slot:
+            return
+        
+        try:
+            forecast_hourly = await self._async_get_forecast(
+                "hourly", self.api.get_hourly_forecast, slot
+            )
+        except (MeteocatAPIError, ClientError, ServerTimeoutError, asyncio.TimeoutError) as err:
+            # The slot is left unset so the next request tries again
+            _LOGGER.warning("Error fetching hourly forecast on demand: %s", err)
+            return
+        self._hourly_forecast_slot = slot
+        self.async_set_updated_data({**(self.data or {}), "forecast_hourly": forecast_hourly})
+
     def _should_fetch_forecast(self) -> bool:
         """Check if forecast should be fetched based on current time."""
         # Always fetch on first refresh or if missing data
@@ -348,11 +700,10 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.debug("Fetching forecast because data is missing or first refresh")
             return True
             
-        now = dt_util.now()
+        # Compare against the unshifted slot so the stagger offset never changes the hour
+        now = dt_util.now() - self.update_offset
         
-        update_times = [self.update_time_1, self.update_time_2]
-        if self.update_time_3:
-            update_times.append(self.update_time_3)
+        update_times = self.get_forecast_update_times()
             
         for time_str in update_times:
             if not time_str:
@@ -369,7 +720,549 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         _LOGGER.debug("Not fetching forecast. Hour %s does not match any update time %s", now.hour, update_times)
         return False
 
+    def _count_entries_sharing_key(self) -> int:
+        """Return how many config entries share this entry's API key."""
+        api_key = self.entry.data.get(CONF_API_KEY)
+        try:
+            return max(1, sum(
+                1
+                for other in self.hass.config_entries.async_entries(DOMAIN)
+                if other.data.get(CONF_API_KEY) == api_key
+            ))
+        except (AttributeError, TypeError):
+            return 1
+
+    def _count_municipalities_sharing_key(self) -> int:
+        """Return how many unique forecast municipalities share this entry's API key."""
+        api_key = self.entry.data.get(CONF_API_KEY)
+        try:
+            municipalities = {
+                other.data.get(CONF_MUNICIPALITY_CODE)
+                or other.data.get("station_municipality_code")
+                or other.entry_id
+                for other in self.hass.config_entries.async_entries(DOMAIN)
+                if other.data.get(CONF_API_KEY) == api_key
+                and other.data.get(CONF_MODE, MODE_EXTERNAL) != MODE_MULTI
+            }
+        except (AttributeError, TypeError):
+            return 1
+        return max(1, len(municipalities))
+
+    def _get_forecast_slot(self) -> datetime | None:
+        """Return the last forecast update time reached (the freshness slot)."""
+        # Unshifted, like _should_fetch_forecast: staggered entries share the slot
+        now = dt_util.now() - self.update_offset
+        slots = []
+        for time_str in self.get_forecast_update_times():
+            try:
+                update_time = time.fromisoformat(time_str)
+            except (TypeError, ValueError):
+                continue
+            slot = now.replace(
+                hour=update_time.hour, minute=update_time.minute, second=0, microsecond=0
+            )
+            if slot > now:
+                slot -= timedelta(days=1)
+            slots.append(slot)
+        return max(slots, default=None)
+
+    def _async_get_forecast(
+        self, forecast_type: str, fetch: Any, slot: datetime | None
+    ) -> Any:
+        """Get a forecast through the cache shared by every entry.
+
+        The payload is projected once, before it is cached, so every entry
+        sharing it only holds the fields the entities read.
+        """
+        municipality_code = self.municipality_code
+        variable_names = (
+            FORECAST_HOURLY_VARIABLES if forecast_type == "hourly" else FORECAST_DAILY_VARIABLES
+        )
+
+        async def _async_fetch() -> Any:
+            return project_forecast(await fetch(municipality_code), variable_names)
+
+        return get_forecast_cache(self.hass).async_get(
+            municipality_code,
+            forecast_type,
+            slot,
+            _async_fetch,
+        )
+
+    def _update_quota_plan(self, quotes: dict[str, Any] | None) -> None:
+        """Re-plan the update schedule from the latest quota consumption."""
+        if not quotes or not isinstance(quotes, dict):
+            return
+        
+        forecast_calls = int(bool(self.enable_forecast_daily)) + int(bool(self.enable_forecast_hourly))
+        plan = calculate_update_plan(
+            quotes.get("plans", []),
+            dt_util.now(),
+            entries_sharing_key=self._count_entries_sharing_key(),
+            forecast_calls_per_update=forecast_calls,
+            forecast_entries_sharing_key=self._count_municipalities_sharing_key(),
+            fetch_measurements=self.mode in (MODE_EXTERNAL, MODE_MULTI),
+            measurement_calls_per_update=len(XEMA_VARIABLES) if self.mode == MODE_MULTI else 1,
+        )
+        
+        measurement_interval = plan["measurement_interval"] if self.mode in (MODE_EXTERNAL, MODE_MULTI) else None
+        forecast_times = get_planned_update_times(
+            self.update_time_1, plan["forecast_updates_per_day"]
+        )
+        
+        if (
+            measurement_interval == self.planned_measurement_interval
+            and forecast_times == self.planned_forecast_times
+        ):
+            return
+        
+        _LOGGER.info(
+            "Quota planner: measurements every %s h, forecast at %s",
+            measurement_interval,
+            ", ".join(forecast_times),
+        )
+        self.planned_measurement_interval = measurement_interval
+        self.planned_forecast_times = forecast_times
+        
+        # Feed the new plan straight into the scheduler (setup schedules the first one)
+        if self._scheduled_update_remover:
+            self._schedule_next_update()
+
+    async def _async_fetch_measurements(self) -> Any:
+        """Fetch the current UTC day and merge it into the rolling window.
+        
+        Right after UTC midnight the day payload holds only a few readings.
+        The previous day's tail is kept from the last payload, and that day
+        is fetched again only when readings of it may still be missing. The
+        local day (CET/CEST) starts before UTC midnight: after a restart the
+        previous day is also fetched for its first readings.
+        """
+        latest = self.history.latest
+        measurements = await self.api.get_station_measurements(self.station_code)
+        
+        previous = self.data.get("measurements") if self.data else None
+        if not isinstance(measurements, list):
+            return measurements
+        if isinstance(previous, list):
+            # Failover values belong to another station, never merge them back
+            previous = [
+                {**station, "variables": [
+                    variable for variable in station.get("variables", [])
+                    if "source_station" not in variable
+                ]}
+                for station in previous if isinstance(station, dict)
+            ]
+        
+        now = dt_util.utcnow()
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if latest is not None:
+            # Readings arrive every 30 minutes: is the last one of the previous day known?
+            fetch_previous_day = latest + timedelta(minutes=30) < day_start
+        else:
+            # Nothing known yet: needed while the day payload is nearly empty, or
+            # when the local day (daily totals and aggregates) started before it
+            readings = extract_readings(measurements)
+            local_day_start = dt_util.start_of_local_day(dt_util.as_local(now).date())
+            fetch_previous_day = bool(readings) and (
+                local_day_start < min(timestamp for values in readings.values() for timestamp, _ in values)
+                or all(
+                    values[-1][0] < day_start + timedelta(hours=MEASUREMENTS_DAY_OVERLAP)
+                    for values in readings.values()
+                )
+            )
+        
+        if fetch_previous_day:
+            previous_day = (day_start - timedelta(days=1)).date()
+            try:
+                previous_measurements = await self.api.get_station_measurements(
+                    self.station_code, previous_day
+                )
+            except MeteocatAuthError:
+                raise
+            except (MeteocatAPIError, ClientError, ServerTimeoutError, asyncio.TimeoutError) as err:
+                _LOGGER.warning("Error fetching measurements for %s: %s", previous_day, err)
+            else:
+                previous = merge_measurements(
+                    previous, previous_measurements, MEASUREMENTS_WINDOW_HOURS
+                )
+        
+        return merge_measurements(previous, measurements, MEASUREMENTS_WINDOW_HOURS)
+
+    async def _async_fetch_multi_measurements(self) -> list[dict[str, Any]]:
+        """Fetch every station of a multi-station entry in bulk.
+        
+        One call per variable returns the readings of all XEMA stations, so
+        the number of calls does not grow with the number of stations. The
+        payloads are regrouped per station (same shape as the station
+        endpoint) and merged into the rolling window.
+        """
+        variable_codes = list(XEMA_VARIABLES.values())
+        results = await asyncio.gather(
+            *(self.api.get_variable_measurements(code) for code in variable_codes),
+            return_exceptions=True,
+        )
+        
+        selected = set(self.station_codes)
+        stations: list[dict[str, Any]] = []
+        errors: list[BaseException] = []
+        for code, result in zip(variable_codes, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, MeteocatAuthError):
+                    raise result
+                _LOGGER.warning("Error fetching measurements of variable %s: %s", code, result)
+                errors.append(result)
+                continue
+            if isinstance(result, list):
+                stations.extend(
+                    station for station in result
+                    if isinstance(station, dict) and station.get("codi") in selected
+                )
+        
+        if len(errors) == len(results):
+            # Nothing fetched: let the caller keep the old data and retry
+            raise errors[0]
+        
+        previous = self.data.get("measurements") if self.data else None
+        return merge_measurements(previous, stations, MEASUREMENTS_WINDOW_HOURS)
+
+    async def _async_get_failover_candidates(self) -> list[dict[str, Any]]:
+        """Return the stations nearest to the configured one.
+        
+        The station list is shared by every entry in a Store and fetched
+        again at most every STATION_INDEX_MAX_AGE days, so failover does not
+        cost a stations call per refresh.
+        """
+        if self._failover_candidates is not None:
+            return self._failover_candidates
+        
+        coordinates = self.station_data.get("coordenades") or {}
+        try:
+            latitude = float(coordinates["latitud"])
+            longitude = float(coordinates["longitud"])
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Station %s has no coordinates, failover disabled", self.station_code)
+            return []
+        
+        store = Store(self.hass, 1, f"{DOMAIN}.station_index")
+        stored = await store.async_load() or {}
+        index = stored.get("stations") or []
+        updated = parse_reading_time(stored.get("updated"))
+        if updated is None or dt_util.utcnow() - updated > timedelta(days=STATION_INDEX_MAX_AGE):
+            try:
+                index = build_station_index(await self.api.get_stations())
+            except MeteocatAuthError:
+                raise
+            except (MeteocatAPIError, ClientError, ServerTimeoutError, asyncio.TimeoutError) as err:
+                # Keep using the old index, if any
+                _LOGGER.warning("Error fetching the station list for failover: %s", err)
+            else:
+                await store.async_save({"updated": dt_util.utcnow().isoformat(), "stations": index})
+        
+        candidates = nearest_stations(
+            index, latitude, longitude,
+            FAILOVER_MAX_CANDIDATES, FAILOVER_MAX_DISTANCE, exclude=self.station_code,
+        )
+        if index:
+            self._failover_candidates = candidates
+        return candidates
+
+    async def async_get_variable_metadata(self) -> dict[int, dict[str, Any]]:
+        """Return the name, unit and decimals of each XEMA variable by code.
+        
+        The metadata is shared by every entry in a Store and kept forever:
+        variables are almost never added, so it costs a single API call per
+        installation. An empty dict is returned (and not stored) when the
+        fetch fails, so the next setup tries again.
+        """
+        if self._variable_metadata is not None:
+            return self._variable_metadata
+        
+        store = Store(self.hass, 1, f"{DOMAIN}.variable_metadata")
+        stored = await store.async_load() or {}
+        index = build_variable_index(stored.get("variables"))
+        if not index:
+            try:
+                index = build_variable_index(await self.api.get_variables_metadata())
+            except MeteocatAuthError:
+                raise
+            except (MeteocatAPIError, ClientError, ServerTimeoutError, asyncio.TimeoutError) as err:
+                _LOGGER.warning("Error fetching the XEMA variables metadata: %s", err)
+                return {}
+            if index:
+                await store.async_save({"variables": list(index.values())})
+        
+        self._variable_metadata = index
+        return index
+
+    async def _async_apply_failover(self, measurements: Any) -> Any:
+        """Replace stale variables with readings of the nearest working station.
+        
+        Only the variables behind the XEMA sensor entities are replaced. A
+        variable is stale when its newest reading is older than
+        FAILOVER_STALE_AFTER hours. Each stale variable costs one bulk call
+        (all stations at once), cached for the rest of the UTC hour and
+        limited to FAILOVER_MAX_CALLS per refresh; the nearest candidate with
+        a fresh reading is used and tagged with its source station.
+        """
+        if not isinstance(measurements, list):
+            return measurements
+        
+        station = next(
+            (item for item in measurements
+             if isinstance(item, dict) and item.get("codi") == self.station_code),
+            None,
+        )
+        variables = {
+            variable.get("codi"): variable
+            for variable in (station or {}).get("variables", [])
+            if isinstance(variable, dict)
+        }
+        # Variables the station is known to report, all of them if none is known yet
+        reported = set(variables) | set(self.history.variables)
+        expected = [
+            code for code in XEMA_VARIABLES.values()
+            if not reported or code in reported
+        ]
+        
+        now = dt_util.utcnow()
+        threshold = now - timedelta(hours=FAILOVER_STALE_AFTER)
+        stale = [
+            code for code in expected
+            if (latest := get_latest_reading_time(variables.get(code))) is None or latest < threshold
+        ]
+        if not stale:
+            return measurements
+        
+        candidates = await self._async_get_failover_candidates()
+        if not candidates:
+            return measurements
+        
+        slot = now.replace(minute=0, second=0, microsecond=0)
+        if self._failover_payloads_slot != slot:
+            self._failover_payloads = {}
+            self._failover_payloads_slot = slot
+        
+        to_fetch = [code for code in stale if code not in self._failover_payloads]
+        if len(to_fetch) > FAILOVER_MAX_CALLS:
+            _LOGGER.debug(
+                "Failover limited to %d calls, variables %s wait for the next refresh",
+                FAILOVER_MAX_CALLS, to_fetch[FAILOVER_MAX_CALLS:],
+            )
+            to_fetch = to_fetch[:FAILOVER_MAX_CALLS]
+        
+        results = await asyncio.gather(
+            *(self.api.get_variable_measurements(code) for code in to_fetch),
+            return_exceptions=True,
+        )
+        for code, result in zip(to_fetch, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, MeteocatAuthError):
+                    raise result
+                # Not cached: the next refresh tries again
+                _LOGGER.warning("Error fetching failover measurements of variable %s: %s", code, result)
+                continue
+            self._failover_payloads[code] = result
+        
+        replacements: dict[Any, dict[str, Any]] = {}
+        for code in stale:
+            result = self._failover_payloads.get(code)
+            if not isinstance(result, list):
+                continue
+            payload = {
+                item.get("codi"): item for item in result if isinstance(item, dict)
+            }
+            for candidate in candidates:
+                variable = next(
+                    (item for item in payload.get(candidate["codi"], {}).get("variables", [])
+                     if isinstance(item, dict) and item.get("codi") == code),
+                    None,
+                )
+                latest = get_latest_reading_time(variable)
+                if latest is not None and latest >= threshold:
+                    replacements[code] = {
+                        **variable,
+                        "source_station": candidate["codi"],
+                        "source_station_name": candidate.get("nom"),
+                        "source_distance_km": candidate["distance_km"],
+                    }
+                    _LOGGER.info(
+                        "Variable %s of station %s is stale, using %s (%s km)",
+                        code, self.station_code, candidate["codi"], candidate["distance_km"],
+                    )
+                    break
+        
+        if not replacements:
+            return measurements
+        
+        variables.update(replacements)
+        patched = {**(station or {"codi": self.station_code}), "variables": list(variables.values())}
+        if station is None:
+            return [patched, *measurements]
+        return [patched if item is station else item for item in measurements]
+
+    async def _async_backfill_measurements(self, measurements: Any) -> None:
+        """Import readings missed while Home Assistant was down or refreshes failed.
+        
+        Gaps between the last ingested reading and the current payload are
+        recovered by fetching the covering UTC day(s), oldest first, limited
+        to BACKFILL_MAX_REQUESTS calls per refresh. Remaining days are picked
+        up on the next refresh.
+        """
+        if "recorder" not in self.hass.config.components:
+            return
+        
+        if self._backfill_store is None:
+            self._backfill_store = Store(self.hass, 1, f"{DOMAIN}.{self.entry.entry_id}.backfill")
+            stored = await self._backfill_store.async_load() or {}
+            self.last_ingested_reading = parse_reading_time(stored.get("last_reading"))
+        
+        readings = extract_readings(measurements)
+        payload_times = [values[0][0] for values in readings.values() if values]
+        if not payload_times:
+            return
+        payload_start = min(payload_times)
+        latest = max(values[-1][0] for values in readings.values() if values)
+        since = self.last_ingested_reading
+        
+        if since is not None and since >= latest:
+            return
+        
+        if since is not None:
+            # Readings arrive every 30 minutes, the first missing one tells the first day to fetch
+            oldest_day = (dt_util.utcnow() - timedelta(days=BACKFILL_MAX_DAYS)).date()
+            day = max((since + timedelta(minutes=30)).date(), oldest_day)
+            requests = 0
+            while day < payload_start.date():
+                if requests >= BACKFILL_MAX_REQUESTS:
+                    _LOGGER.debug("Backfill budget exhausted, continuing from %s on next refresh", day)
+                    break
+                requests += 1
+                try:
+                    day_measurements = await self.api.get_station_measurements(self.station_code, day)
+                except MeteocatAuthError:
+                    raise
+                except (MeteocatAPIError, ClientError, ServerTimeoutError, asyncio.TimeoutError) as err:
+                    _LOGGER.warning("Error backfilling measurements for %s: %s", day, err)
+                    break
+                day_readings = extract_readings(day_measurements)
+                self.history.add_readings(day_readings)
+                for code, values in day_readings.items():
+                    # Keyed by timestamp: a reading in both payloads keeps the newest value
+                    readings[code] = dedupe_readings([*values, *readings.get(code, [])])
+                day += timedelta(days=1)
+            
+            if day < payload_start.date():
+                # Not caught up: only advance to what was recovered so far
+                latest = max(
+                    (timestamp for values in readings.values() for timestamp, _ in values
+                     if timestamp.date() < day),
+                    default=since,
+                )
+        
+        station_name = self.station_data.get("nom") or self.entry.data.get(CONF_STATION_NAME, self.station_code)
+        try:
+            async_import_readings(self.hass, self.station_code, station_name, readings, since)
+        except Exception as err:
+            _LOGGER.warning("Error importing measurement statistics: %s", err)
+            return
+        
+        self.last_ingested_reading = latest
+        self._backfill_store.async_delay_save(
+            lambda: {"last_reading": latest.isoformat()}, 10
+        )
+
+    def _get_snapshot_store(self) -> Store:
+        """Return the store holding the last successful data."""
+        if self._snapshot_store is None:
+            self._snapshot_store = Store(self.hass, 1, f"{DOMAIN}.{self.entry.entry_id}.snapshot")
+        return self._snapshot_store
+
+    @callback
+    def _async_save_snapshot(self, data: dict[str, Any]) -> None:
+        """Save the data of a successful refresh for the next startup."""
+        saved_at = dt_util.utcnow()
+        self._get_snapshot_store().async_delay_save(
+            lambda: {"saved_at": saved_at.isoformat(), "data": data}, SNAPSHOT_SAVE_DELAY
+        )
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last saved data so entities can start without a network refresh.
+        
+        The first refresh still runs (deferred until Home Assistant has
+        started) and fetches everything, as on a normal first refresh.
+        """
+        stored = await self._get_snapshot_store().async_load()
+        if not isinstance(stored, dict) or not isinstance(stored.get("data"), dict):
+            _LOGGER.debug("No saved data for %s, entities start empty", self.name)
+            return False
+        
+        data = stored["data"]
+        saved_at = parse_reading_time(stored.get("saved_at"))
+        self.last_successful_update_time = saved_at
+        if data.get("measurements") is not None:
+            self.last_measurements_update = saved_at
+            if self.mode == MODE_EXTERNAL:
+                self.history.add_readings(extract_readings(data["measurements"]))
+        if data.get("forecast") is not None or data.get("forecast_hourly") is not None:
+            self.last_forecast_update = saved_at
+        self.data = data
+        _LOGGER.debug("Restored data of %s saved at %s", self.name, saved_at)
+        return True
+
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch all data, recording the duration of each phase."""
+        trace = RefreshTrace()
+        success = False
+        try:
+            data = await self._async_fetch_data(trace)
+            success = True
+            if self.deferred_startup:
+                self._async_save_snapshot(data)
+            return data
+        finally:
+            if not success:
+                self._schedule_stale_expiry()
+            elif self._stale_expiry_remover:
+                self._stale_expiry_remover()
+                self._stale_expiry_remover = None
+            # Finished again once the listeners are updated (see _async_complete_trace)
+            trace.finish(success)
+            self.refresh_traces.append(trace)
+            self._listeners_trace = trace
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh data, completing the trace once the listeners are updated."""
+        await super()._async_refresh(*args, **kwargs)
+        # Listeners are not updated when a failure follows another failure
+        if (trace := getattr(self, "_listeners_trace", None)) is not None:
+            self._listeners_trace = None
+            self._async_complete_trace(trace)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the fan-out of the last refresh."""
+        trace = getattr(self, "_listeners_trace", None)
+        if trace is None:
+            super().async_update_listeners()
+            return
+        self._listeners_trace = None
+        with trace.phase("listeners"):
+            super().async_update_listeners()
+        self._async_complete_trace(trace)
+
+    @callback
+    def _async_complete_trace(self, trace: RefreshTrace) -> None:
+        """Stop the trace after the fan-out and report slow refreshes."""
+        trace.finish(trace.success)
+        if trace.total >= SLOW_REFRESH_THRESHOLD:
+            _LOGGER.warning(
+                "Slow refresh of %s took %.1f s: %s",
+                self.name,
+                trace.total,
+                trace.as_dict()["phases_ms"],
+            )
+
+    async def _async_fetch_data(self, trace: RefreshTrace) -> dict[str, Any]:
         """Fetch all data (External + Local)."""
         
         # Check forced update flags
@@ -387,7 +1280,7 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             fetch_measurements = False
             fetch_forecast = False
             
-            if self.mode == MODE_EXTERNAL:
+            if self.mode in (MODE_EXTERNAL, MODE_MULTI):
                 if force_measurements or force_forecast:
                     # Manual update via specific button
                     fetch_measurements = force_measurements
@@ -402,24 +1295,26 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 fetch_measurements = False
             
             if self.mode == MODE_EXTERNAL and self.station_code and fetch_measurements:
-                tasks["measurements"] = self.api.get_station_measurements(self.station_code)
+                tasks["measurements"] = self._async_fetch_measurements()
                 
                 entry_updates = {}
-                if not self.station_data:
-                    stations = await self.api.get_stations()
-                    for station in stations:
-                        if station.get("codi") == self.station_code:
-                            self.station_data = station
-                            break
-                    if self.station_data:
-                        entry_updates["_station_data"] = self.station_data
+                with trace.phase("station_lookup"):
+                    if not self.station_data:
+                        stations = await self.api.get_stations()
+                        for station in stations:
+                            if station.get("codi") == self.station_code:
+                                self.station_data = station
+                                break
+                        if self.station_data:
+                            entry_updates["_station_data"] = self.station_data
                 
-                if not self.municipality_code and self.station_data:
-                    self.municipality_code = await self.api.find_municipality_for_station(
-                        self.station_data
-                    )
-                    if self.municipality_code:
-                        entry_updates["station_municipality_code"] = self.municipality_code
+                with trace.phase("municipality_lookup"):
+                    if not self.municipality_code and self.station_data:
+                        self.municipality_code = await self.api.find_municipality_for_station(
+                            self.station_data
+                        )
+                        if self.municipality_code:
+                            entry_updates["station_municipality_code"] = self.municipality_code
                 
                 if entry_updates:
                     new_data = {**self.entry.data, **entry_updates}
@@ -429,20 +1324,27 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             data=new_data
                         )
             
+            if self.mode == MODE_MULTI and self.station_codes and fetch_measurements:
+                tasks["measurements"] = self._async_fetch_multi_measurements()
+            
             if self.municipality_code and fetch_forecast:
+                # Manual refreshes bypass the shared cache
+                current_slot = self._get_forecast_slot()
+                slot = None if force_forecast else current_slot
                 if self.enable_forecast_daily:
-                    tasks["forecast"] = self.api.get_municipal_forecast(
-                        self.municipality_code
+                    tasks["forecast"] = self._async_get_forecast(
+                        "daily", self.api.get_municipal_forecast, slot
                     )
-                if self.enable_forecast_hourly:
-                    tasks["forecast_hourly"] = self.api.get_hourly_forecast(
-                        self.municipality_code
+                if self.hourly_forecast_wanted:
+                    tasks["forecast_hourly"] = self._async_get_forecast(
+                        "hourly", self.api.get_hourly_forecast, slot
                     )
                 
                 # Update last forecast update time if we are attempting to fetch
                 self.last_forecast_update = dt_util.utcnow()
             
-            results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+            with trace.phase("fetch"):
+                results = await asyncio.gather(*tasks.values(), return_exceptions=True)
             
             # Initialize data with previous values if available to preserve forecast
             data: dict[str, Any] = self.data.copy() if self.data else {
@@ -451,6 +1353,7 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             }
             
             has_retryable_error = False
+            measurements_fetched = False
             for key, result in zip(tasks.keys(), results):
                 if isinstance(result, Exception):
                     _LOGGER.warning("Error fetching %s: %s", key, result)
@@ -460,87 +1363,122 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     if key not in data:
                         data[key] = None
                     
-                    if not self._is_retry_update and self._is_retryable_error(result):
+                    if self._is_retryable_error(result):
                         has_retryable_error = True
                 else:
                     data[key] = result
+                    if key == "forecast_hourly":
+                        # Fetched for this slot: no on-demand fetch until the next one
+                        self._hourly_forecast_slot = current_slot
                     if key == "measurements":
+                        # Only the variables and fields the entities read are kept. A single
+                        # station keeps every variable: it may have sensors for all of them
+                        data[key] = project_measurements(
+                            result, None if self.mode == MODE_EXTERNAL else XEMA_VARIABLES.values()
+                        )
                         self.last_measurements_update = dt_util.utcnow()
+                        measurements_fetched = True
+            
+            # History and backfill track a single station
+            if measurements_fetched and self.mode == MODE_EXTERNAL:
+                self.history.add_readings(extract_readings(data["measurements"]))
+            
+            with trace.phase("backfill"):
+                if measurements_fetched and self.mode == MODE_EXTERNAL and not self._is_retry_update:
+                    await self._async_backfill_measurements(data["measurements"])
             
-            if not self._is_retry_update:
-                # Only fetch quotes when fetching forecast or measurements to save quota
-                # OR if quotes are missing (e.g. failed previously)
-                should_fetch_quotes = fetch_forecast or fetch_measurements or not data.get("quotes")
+            with trace.phase("failover"):
+                # After history and backfill: neighbour readings never reach statistics
+                if (
+                    measurements_fetched
+                    and self.mode == MODE_EXTERNAL
+                    and self.station_failover
+                    and not self._is_retry_update
+                ):
+                    data["measurements"] = await self._async_apply_failover(data["measurements"])
+            
+            with trace.phase("quotes"):
+                if not self._is_retry_update:
+                    # Only fetch quotes when fetching forecast or measurements to save quota
+                    # OR if quotes are missing (e.g. failed previously)
+                    should_fetch_quotes = fetch_forecast or fetch_measurements or not data.get("quotes")
                 
-                if should_fetch_quotes:
-                    try:
-                        data["quotes"] = await self.api.get_quotes()
-                    except MeteocatAPIError as err:
-                        if "429" in str(err) or "Rate limit exceeded" in str(err):
-                            _LOGGER.warning("Quota exceeded (429). Setting remaining requests to 0.")
-                            # If we have previous quotes, use them as a template but set remaining to 0
-                            old_quotes = data.get("quotes")
-                            if old_quotes and isinstance(old_quotes, dict) and "plans" in old_quotes:
-                                new_plans = []
-                                for plan in old_quotes.get("plans", []):
-                                    new_plan = plan.copy()
-                                    new_plan["consultesRestants"] = 0
-                                    new_plans.append(new_plan)
-                                data["quotes"] = {
-                                    "client": old_quotes.get("client", {}),
-                                    "plans": new_plans
-                                }
+                    if should_fetch_quotes:
+                        try:
+                            data["quotes"] = await self.api.get_quotes()
+                        except MeteocatAPIError as err:
+                            if err.status == 429:
+                                _LOGGER.warning("Quota exceeded (429). Setting remaining requests to 0.")
+                                # If we have previous quotes, use them as a template but set remaining to 0
+                                old_quotes = data.get("quotes")
+                                if old_quotes and isinstance(old_quotes, dict) and "plans" in old_quotes:
+                                    new_plans = []
+                                    for plan in old_quotes.get("plans", []):
+                                        new_plan = plan.copy()
+                                        new_plan["consultesRestants"] = 0
+                                        new_plans.append(new_plan)
+                                    data["quotes"] = {
+                                        "client": old_quotes.get("client", {}),
+                                        "plans": new_plans
+                                    }
+                                else:
+                                    _LOGGER.warning("Quota exceeded and no previous data available to construct zero-quota state.")
+                                    if "quotes" not in data:
+                                        data["quotes"] = None
                             else:
-                                _LOGGER.warning("Quota exceeded and no previous data available to construct zero-quota state.")
+                                _LOGGER.warning("Error fetching quotes: %s", err)
+                                # Keep old quotes if available
                                 if "quotes" not in data:
                                     data["quotes"] = None
-                        else:
+                        except Exception as err:
                             _LOGGER.warning("Error fetching quotes: %s", err)
                             # Keep old quotes if available
                             if "quotes" not in data:
                                 data["quotes"] = None
-                    except Exception as err:
-                        _LOGGER.warning("Error fetching quotes: %s", err)
-                        # Keep old quotes if available
-                        if "quotes" not in data:
-                            data["quotes"] = None
-            else:
-                # On retry, don't fetch quotes to save calls, keep old
-                if "quotes" not in data:
-                    data["quotes"] = None
+                else:
+                    # On retry, don't fetch quotes to save calls, keep old
+                    if "quotes" not in data:
+                        data["quotes"] = None
             
-            if has_retryable_error:
-                _LOGGER.warning("Retryable error detected, scheduling retry in 60 seconds")
-                await self._schedule_retry_update(delay_seconds=60)
+            if has_retryable_error and await self._schedule_retry_update():
+                _LOGGER.warning("Retryable error detected, retry scheduled")
                 raise UpdateFailed("Temporary error - retry scheduled")
             
-            critical_fields = []
-            if self.mode == MODE_EXTERNAL and fetch_measurements:
-                critical_fields.append("measurements")
-            if self.municipality_code:
-                # Only check forecast if we tried to fetch it or if it's missing
-                if fetch_forecast or not data.get("forecast"):
-                    if self.enable_forecast_daily:
-                        critical_fields.append("forecast")
-                    if self.enable_forecast_hourly:
-                        critical_fields.append("forecast_hourly")
+            with trace.phase("validation"):
+                critical_fields = []
+                if self.mode in (MODE_EXTERNAL, MODE_MULTI) and fetch_measurements:
+                    critical_fields.append("measurements")
+                if self.municipality_code:
+                    # Only check forecast if we tried to fetch it or if it's missing
+                    if fetch_forecast or not data.get("forecast"):
+                        if self.enable_forecast_daily:
+                            critical_fields.append("forecast")
+                        # Skipped on purpose while nobody asks for it (on-demand mode)
+                        if self.hourly_forecast_wanted:
+                            critical_fields.append("forecast_hourly")
             
-            missing_data = [field for field in critical_fields if data.get(field) is None]
-            if missing_data:
-                error_msg = f"Missing critical data: {', '.join(missing_data)}"
-                if self._is_first_refresh:
-                    _LOGGER.warning(
-                        "%s - Setup will complete, data will be fetched on next scheduled update",
-                        error_msg
-                    )
-                else:
-                    _LOGGER.error(error_msg)
-                    raise UpdateFailed(error_msg)
+                missing_data = [field for field in critical_fields if data.get(field) is None]
+                if missing_data:
+                    error_msg = f"Missing critical data: {', '.join(missing_data)}"
+                    if self._is_first_refresh:
+                        _LOGGER.warning(
+                            "%s - Setup will complete, data will be fetched on next scheduled update",
+                            error_msg
+                        )
+                    else:
+                        _LOGGER.error(error_msg)
+                        raise UpdateFailed(error_msg)
+            
+            with trace.phase("quota_planner"):
+                if self.quota_planner:
+                    self._update_quota_plan(data.get("quotes"))
             
             self._is_first_refresh = False
-            self._fire_events(self.next_scheduled_update)
+            with trace.phase("events"):
+                self._fire_events(self.next_scheduled_update)
             
             self.last_successful_update_time = dt_util.utcnow()
+            self.retry_attempts = 0
             return data
         
         except MeteocatAuthError as err:
@@ -548,9 +1486,8 @@ class MeteocatCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
         
         except (MeteocatAPIError, ClientError, ServerTimeoutError, asyncio.TimeoutError) as err:
-            if not self._is_retry_update and self._is_retryable_error(err):
-                _LOGGER.warning("Retryable error: %s. Scheduling retry in 60 seconds", err)
-                await self._schedule_retry_update(delay_seconds=60)
+            if self._is_retryable_error(err) and await self._schedule_retry_update():
+                _LOGGER.warning("Retryable error: %s. Retry scheduled", err)
                 raise UpdateFailed(f"Temporary error - retry scheduled: {err}") from err
             raise UpdateFailed(f"Error communicating with Meteocat API: {err}") from err
 
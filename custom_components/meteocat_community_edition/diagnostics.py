@@ -0,0 +1,44 @@
+"""Diagnostics support for Meteocat (Community Edition)."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, DOMAIN
+from .coordinator import MeteocatCoordinator
+
+TO_REDACT = {CONF_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: MeteocatCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options or {}), TO_REDACT),
+        },
+        "coordinator": {
+            "mode": coordinator.mode,
+            "last_update_success": coordinator.last_update_success,
+            "last_successful_update_time": _isoformat(coordinator.last_successful_update_time),
+            "next_scheduled_update": _isoformat(coordinator.next_scheduled_update),
+            "next_forecast_update": _isoformat(coordinator.next_forecast_update),
+            "data_keys": sorted(coordinator.data) if coordinator.data else [],
+        },
+        "refresh_timing": {
+            "phases": coordinator.refresh_traces.summary(),
+            "traces": coordinator.refresh_traces.as_list(),
+        },
+    }
+
+
+def _isoformat(value: Any) -> str | None:
+    """Return a datetime as ISO string."""
+    return value.isoformat() if value is not None else None
@@ -0,0 +1,43 @@
+"""Shared entity helpers for Meteocat (Community Edition)."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .coordinator import MeteocatCoordinator
+
+
+class MeteocatStaleDataMixin:
+    """Serve the last good data of the coordinator after failed refreshes.
+
+    Mixed in before the coordinator entity base class. With the serve-stale
+    option, entities stay available until the data is older than the
+    configured maximum age and report how old it is.
+    """
+
+    coordinator: MeteocatCoordinator
+
+    # Changes on every write, only useful live
+    _unrecorded_attributes = frozenset({"data_age_seconds", "data_fetched_at"})
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last refresh worked or its data can still be served."""
+        return super().available or getattr(self.coordinator, "serving_stale_data", False) is True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the age of the data served."""
+        return self._stale_data_attributes()
+
+    def _stale_data_attributes(self) -> dict[str, Any]:
+        """Return the age and fetch time of the data, with the serve-stale option only."""
+        if getattr(self.coordinator, "serve_stale", False) is not True:
+            return {}
+        fetched_at = self.coordinator.last_successful_update_time
+        if fetched_at is None:
+            return {}
+        return {
+            "data_age_seconds": int(self.coordinator.data_age.total_seconds()),
+            "data_fetched_at": fetched_at.isoformat(),
+        }
@@ -0,0 +1,82 @@
+"""Shared forecast cache for Meteocat (Community Edition).
+
+Forecasts depend only on the municipality, so every entry (external
+stations mapped to a municipality, local entries, several stations in the
+same town) reads them through one cache kept in hass.data. A payload is
+reused by every entry, including the one that fetched it, until the
+forecast slot changes, and concurrent requests for the same municipality
+share a single API call.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import FORECAST_CACHE
+
+
+class ForecastCache:
+    """Forecast payloads keyed by municipality code and forecast type."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        # key -> (slot, payload)
+        self._cache: dict[tuple[str, str], tuple[datetime | None, Any]] = {}
+        self._pending: dict[tuple[str, str], asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached payloads."""
+        return len(self._cache)
+
+    async def async_get(
+        self,
+        municipality_code: str,
+        forecast_type: str,
+        slot: datetime | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the forecast, fetching it only when no fresh copy exists.
+
+        A cached payload is fresh for the forecast slot (last update time
+        reached) it was fetched in, whichever entry asks for it, so retries
+        within the slot do not call the API again. A slot of None (manual
+        refresh) always fetches.
+        """
+        key = (municipality_code, forecast_type)
+        cached = self._cache.get(key)
+        if cached is not None and slot is not None and cached[0] == slot:
+            return cached[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._async_store(key, slot, done))
+        # Another entry may be waiting for the same call
+        return await asyncio.shield(task)
+
+    def _async_store(
+        self,
+        key: tuple[str, str],
+        slot: datetime | None,
+        task: asyncio.Future[Any],
+    ) -> None:
+        """Keep a successful payload, errors are never cached."""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._cache[key] = (slot, task.result())
+
+
+def get_forecast_cache(hass: HomeAssistant) -> ForecastCache:
+    """Return the forecast cache shared by every entry."""
+    cache = hass.data.get(FORECAST_CACHE)
+    if not isinstance(cache, ForecastCache):
+        cache = ForecastCache()
+        hass.data[FORECAST_CACHE] = cache
+    return cache
@@ -0,0 +1,288 @@
+"""Rolling in-memory history of XEMA readings for Meteocat (Community Edition).
+
+Each variable keeps a fixed-size ring of half-hourly slots backed by
+``array('l')`` (timestamps, epoch seconds) and ``array('f')`` (values), so
+the memory used per station is constant whatever the number of refreshes.
+Daily min/max/mean and rolling sums are kept alongside, updated with each
+new reading.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timedelta, timezone, tzinfo
+
+from .const import DEFAULT_HISTORY_WINDOW
+
+# XEMA stations report semi-hourly readings
+SLOT_SECONDS = 1800
+
+# Marks a slot that holds no reading
+_EMPTY = 0
+
+# Readings are published up to an hour after the start of their slot
+READING_DELAY_SECONDS = 3600
+
+
+class VariableHistory:
+    """Ring buffer of readings for a single variable."""
+
+    __slots__ = ("capacity", "timestamps", "values")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty ring."""
+        self.capacity = capacity
+        self.timestamps = array("l", [_EMPTY]) * capacity
+        self.values = array("f", [0.0]) * capacity
+
+    def add(self, timestamp: int, value: float) -> bool:
+        """Store a reading in its slot. Return True if it was not stored yet."""
+        index = (timestamp // SLOT_SECONDS) % self.capacity
+        stored = self.timestamps[index]
+        if stored == timestamp:
+            # Same reading fetched again, keep the latest value (the API may correct it)
+            self.values[index] = value
+            return False
+        if stored > timestamp:
+            # The slot already holds a newer reading
+            return False
+        self.timestamps[index] = timestamp
+        self.values[index] = value
+        return True
+
+    def items(self, since: int = _EMPTY) -> list[tuple[int, float]]:
+        """Return the stored readings newer than ``since``, oldest first."""
+        return sorted(
+            (timestamp, self.values[index])
+            for index, timestamp in enumerate(self.timestamps)
+            if timestamp != _EMPTY and timestamp > since
+        )
+
+
+class DailyAggregate:
+    """Running min, max and mean of the readings of one day."""
+
+    __slots__ = ("day", "count", "total", "minimum", "minimum_time", "maximum", "maximum_time")
+
+    def __init__(self) -> None:
+        """Initialize an aggregate without readings."""
+        self.day: date | None = None
+        self.count = 0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.minimum_time: datetime | None = None
+        self.maximum = 0.0
+        self.maximum_time: datetime | None = None
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the readings of the day."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def add(self, day: date, timestamp: datetime, value: float) -> None:
+        """Account a new reading. A reading of a later day starts that day."""
+        if self.day is None or day > self.day:
+            self.day = day
+            self.count = 0
+            self.total = 0.0
+        elif day < self.day:
+            # Backfilled reading of a day already closed
+            return
+        self.count += 1
+        self.total += value
+        # The first time an extreme is reached is kept
+        if self.count == 1 or value < self.minimum:
+            self.minimum, self.minimum_time = value, timestamp
+        if self.count == 1 or value > self.maximum:
+            self.maximum, self.maximum_time = value, timestamp
+
+
+class WindowSum:
+    """Sum of the readings of a sliding window."""
+
+    __slots__ = ("seconds", "readings", "running", "first")
+
+    def __init__(self, minutes: int) -> None:
+        """Initialize an empty window."""
+        self.seconds = minutes * 60
+        self.readings: deque[tuple[int, float]] = deque()
+        self.running = 0.0
+        # Oldest reading ever added: the sums are partial until the window reaches it
+        self.first = _EMPTY
+
+    def add(self, timestamp: int, value: float) -> None:
+        """Add a new reading and drop the ones that left the window."""
+        if self.first == _EMPTY or timestamp < self.first:
+            self.first = timestamp
+        readings = self.readings
+        if not readings or timestamp > readings[-1][0]:
+            readings.append((timestamp, value))
+        elif timestamp > readings[-1][0] - self.seconds:
+            # Backfilled reading inside the window
+            readings.insert(bisect_right(readings, timestamp, key=lambda item: item[0]), (timestamp, value))
+        else:
+            return
+        self.running += value
+        self._expire(readings[-1][0])
+
+    def total(self, end: int) -> float | None:
+        """Return the sum of the window ending at ``end``, None without readings in it."""
+        self._expire(end)
+        if not self.readings:
+            return None
+        return self.running
+
+    def covers(self, end: int) -> bool:
+        """Return True if the readings reach back to the first slot of the window ending at ``end``."""
+        return self.first != _EMPTY and self.first <= end - self.seconds + SLOT_SECONDS
+
+    def _expire(self, end: int) -> None:
+        """Drop the readings that left the window ending at ``end``."""
+        readings = self.readings
+        start = end - self.seconds
+        while readings and readings[0][0] <= start:
+            self.running -= readings.popleft()[1]
+        if not readings:
+            # Reset the float error of the running sum
+            self.running = 0.0
+
+
+class ReadingHistory:
+    """Rolling window of readings per variable for one station."""
+
+    def __init__(
+        self,
+        window_hours: int = DEFAULT_HISTORY_WINDOW,
+        time_zone: tzinfo = timezone.utc,
+        sum_windows: Mapping[int, Iterable[int]] | None = None,
+    ) -> None:
+        """Initialize the history with a window in hours.
+
+        Daily aggregates start a new day at midnight of ``time_zone``.
+        ``sum_windows`` lists, per variable code, the rolling sums to keep
+        (minutes).
+        """
+        self.window_hours = window_hours
+        self.capacity = window_hours * 3600 // SLOT_SECONDS
+        self.time_zone = time_zone
+        self._variables: dict[int, VariableHistory] = {}
+        self._daily: dict[int, DailyAggregate] = {}
+        self._sums: dict[int, dict[int, WindowSum]] = {
+            code: {minutes: WindowSum(minutes) for minutes in windows}
+            for code, windows in (sum_windows or {}).items()
+        }
+        self._latest: int = _EMPTY
+
+    @property
+    def variables(self) -> list[int]:
+        """Return the variable codes with history."""
+        return sorted(self._variables)
+
+    @property
+    def latest(self) -> datetime | None:
+        """Return the timestamp of the newest reading."""
+        if self._latest == _EMPTY:
+            return None
+        return datetime.fromtimestamp(self._latest, tz=timezone.utc)
+
+    def add_readings(self, readings: dict[int, Iterable[tuple[datetime, float]]]) -> int:
+        """Merge parsed readings (see utils.extract_readings).
+
+        Readings already stored, or older than the window, are ignored, so
+        each reading is accounted once in the daily aggregates.
+        Returns the number of new readings.
+        """
+        added = 0
+        for code, values in readings.items():
+            for timestamp, value in values:
+                epoch = int(timestamp.timestamp())
+                if epoch <= self._latest - self.window_hours * 3600:
+                    continue
+                ring = self._variables.get(code)
+                if ring is None:
+                    ring = self._variables[code] = VariableHistory(self.capacity)
+                if ring.add(epoch, value):
+                    added += 1
+                    self._latest = max(self._latest, epoch)
+                    aggregate = self._daily.get(code)
+                    if aggregate is None:
+                        aggregate = self._daily[code] = DailyAggregate()
+                    aggregate.add(timestamp.astimezone(self.time_zone).date(), timestamp, value)
+                    for window in self._sums.get(code, {}).values():
+                        window.add(epoch, value)
+        return added
+
+    def window_total(self, code: int, minutes: int, now: datetime | None = None) -> float | None:
+        """Return a rolling sum kept for the variable, None without readings in it.
+
+        The window ends at the newest reading or, once the readings are late
+        at ``now``, at ``now`` less the publication delay: the sum decays
+        when the station stops reporting. Until the history reaches back the
+        whole window (e.g. after a restart) the sum would be partial, and
+        None is returned instead.
+        """
+        window = self._sums.get(code, {}).get(minutes)
+        if window is None:
+            return None
+        end = self._latest
+        if now is not None:
+            end = max(end, int(now.timestamp()) - READING_DELAY_SECONDS)
+        total = window.total(end)
+        if total is None or not window.covers(end):
+            return None
+        # Float error of the running sum is below the API precision
+        return max(0.0, round(total, 2))
+
+    def daily(self, code: int, day: date) -> DailyAggregate | None:
+        """Return the aggregate of a variable for ``day``, if it has readings of it."""
+        aggregate = self._daily.get(code)
+        if aggregate is None or aggregate.day != day or not aggregate.count:
+            return None
+        return aggregate
+
+    def get(self, code: int, hours: float | None = None) -> list[tuple[datetime, float]]:
+        """Return the readings of a variable within the last ``hours``."""
+        ring = self._variables.get(code)
+        if ring is None:
+            return []
+        since = self._window_start(hours)
+        # Values are stored as 32-bit floats; round back to the API precision
+        return [
+            (datetime.fromtimestamp(timestamp, tz=timezone.utc), round(value, 2))
+            for timestamp, value in ring.items(since)
+        ]
+
+    def total(self, code: int, hours: float | None = None) -> float | None:
+        """Return the sum of the readings (e.g. precipitation) in the window."""
+        values = [value for _, value in self.get(code, hours)]
+        if not values:
+            return None
+        return round(sum(values), 2)
+
+    def extremes(self, code: int, hours: float | None = None) -> tuple[float, float] | None:
+        """Return (min, max) of the readings in the window."""
+        values = [value for _, value in self.get(code, hours)]
+        if not values:
+            return None
+        return min(values), max(values)
+
+    def trend(self, code: int, hours: float = 3) -> float | None:
+        """Return the change per hour between the oldest and newest readings in the window."""
+        readings = self.get(code, hours)
+        if len(readings) < 2:
+            return None
+        (first_time, first_value), (last_time, last_value) = readings[0], readings[-1]
+        elapsed = (last_time - first_time) / timedelta(hours=1)
+        return (last_value - first_value) / elapsed
+
+    def _window_start(self, hours: float | None) -> int:
+        """Return the epoch before which readings are outside the window."""
+        if self._latest == _EMPTY:
+            return _EMPTY
+        if hours is None or hours > self.window_hours:
+            hours = self.window_hours
+        return self._latest - int(hours * 3600)
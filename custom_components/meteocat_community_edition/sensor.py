@@ -16,19 +16,26 @@ Last updated: 2025-11-27
 """
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
 import logging
+import math
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.const import (
+    UnitOfLength,
     UnitOfPrecipitationDepth,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfTime,
     PERCENTAGE,
     DEGREE,
 )
@@ -39,6 +46,7 @@ from homeassistant.core import HomeAssistant, callback, State, Event
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
 
 from .utils import (
     calculate_utci,
@@ -46,25 +54,34 @@ from .utils import (
     get_utci_icon,
     get_beaufort_value,
     get_beaufort_description_key,
+    convert_forecast_daily,
+    convert_forecast_hourly,
+    encode_forecast_columns,
+    parse_reading_time,
 )
 from .const import (
     ATTRIBUTION,
-    METEOCAT_CONDITION_MAP,
     CONF_COMARCA_NAME,
+    CONF_COMPACT_FORECAST_ATTRIBUTES,
     CONF_MODE,
     CONF_MUNICIPALITY_CODE,
     CONF_MUNICIPALITY_NAME,
     CONF_STATION_CODE,
+    CONF_STATION_CODES,
     CONF_STATION_NAME,
     CONF_SENSOR_TEMPERATURE,
     CONF_SENSOR_HUMIDITY,
     CONF_SENSOR_WIND_SPEED,
     DOMAIN,
+    FORECAST_ATTRIBUTE_MAX_BYTES,
     MODE_LOCAL,
     MODE_EXTERNAL,
+    MODE_MULTI,
+    PRECIPITATION_WINDOWS,
     XEMA_VARIABLES,
 )
 from .coordinator import MeteocatCoordinator
+from .entity import MeteocatStaleDataMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -124,6 +141,273 @@ SENSOR_TYPES: dict[int, dict[str, Any]] = {
 }
 
 
+# Daily aggregates of the readings: (variable code, statistic)
+DAILY_AGGREGATE_TYPES: tuple[tuple[int, str], ...] = (
+    (32, "min"),
+    (32, "max"),
+    (32, "mean"),
+    (33, "mean"),
+    (30, "max"),
+)
+
+
+# Metrics derived from the latest readings: key -> configuration and variables needed
+DERIVED_SENSOR_TYPES: dict[str, dict[str, Any]] = {
+    "dew_point": {
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "unit": UnitOfTemperature.CELSIUS,
+        "icon": "mdi:water-thermometer",
+        "variables": (32, 33),
+    },
+    "heat_index": {
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "unit": UnitOfTemperature.CELSIUS,
+        "icon": "mdi:sun-thermometer",
+        "variables": (32, 33),
+    },
+    "wind_chill": {
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "unit": UnitOfTemperature.CELSIUS,
+        "icon": "mdi:snowflake-thermometer",
+        "variables": (32, 30),
+    },
+    "absolute_humidity": {
+        # No device class: absolute humidity is newer than the oldest HA supported
+        "device_class": None,
+        "unit": "g/m\u00b3",
+        "icon": "mdi:water",
+        "variables": (32, 33),
+    },
+}
+
+@dataclass(frozen=True, kw_only=True)
+class MeteocatLocationSensorEntityDescription(SensorEntityDescription):
+    """Describes a location sensor of the station or municipality.
+
+    Values never change after setup: ``station_path`` is read from the station
+    metadata, ``data_key`` from the entry data. Optional sensors are only
+    created when the entry data holds a value.
+    """
+
+    station: bool = False
+    station_path: tuple[str, ...] | None = None
+    data_key: str | None = None
+    default: Any = None
+    optional: bool = False
+
+
+LOCATION_SENSOR_TYPES: tuple[MeteocatLocationSensorEntityDescription, ...] = (
+    MeteocatLocationSensorEntityDescription(
+        key="altitude",
+        name="Altitud",
+        station=True,
+        station_path=("altitud",),
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="m",
+        icon="mdi:elevation-rise",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="latitude",
+        translation_key="latitude",
+        has_entity_name=True,
+        station=True,
+        station_path=("coordenades", "latitud"),
+        native_unit_of_measurement="\u00b0",
+        icon="mdi:latitude",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="longitude",
+        translation_key="longitude",
+        has_entity_name=True,
+        station=True,
+        station_path=("coordenades", "longitud"),
+        native_unit_of_measurement="\u00b0",
+        icon="mdi:longitude",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="station_comarca_name",
+        name="Comarca",
+        station=True,
+        data_key=CONF_COMARCA_NAME,
+        default="",
+        icon="mdi:map",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="station_municipality_name",
+        name="Municipi",
+        station=True,
+        data_key="station_municipality_name",
+        default="",
+        optional=True,
+        icon="mdi:city",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="station_provincia_name",
+        name="Prov\u00edncia",
+        station=True,
+        data_key="station_provincia_name",
+        default="",
+        optional=True,
+        icon="mdi:map-marker-radius",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="municipality_name",
+        name="Municipi",
+        data_key=CONF_MUNICIPALITY_NAME,
+        default="",
+        icon="mdi:city",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="comarca_name",
+        name="Comarca",
+        data_key=CONF_COMARCA_NAME,
+        default="",
+        icon="mdi:map",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="provincia_name",
+        name="Prov\u00edncia",
+        data_key="provincia_name",
+        default="",
+        optional=True,
+        icon="mdi:map-marker-radius",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="municipality_latitude",
+        translation_key="latitude",
+        has_entity_name=True,
+        data_key="municipality_lat",
+        optional=True,
+        native_unit_of_measurement="\u00b0",
+        icon="mdi:latitude",
+    ),
+    MeteocatLocationSensorEntityDescription(
+        key="municipality_longitude",
+        translation_key="longitude",
+        has_entity_name=True,
+        data_key="municipality_lon",
+        optional=True,
+        native_unit_of_measurement="\u00b0",
+        icon="mdi:longitude",
+    ),
+)
+
+
+# Units of the XEMA variables metadata with a Home Assistant unit and device class.
+# Other units are shown as reported, without device class.
+VARIABLE_UNITS: dict[str, tuple[str, SensorDeviceClass | None]] = {
+    "\u00b0C": (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    "hPa": (UnitOfPressure.HPA, SensorDeviceClass.PRESSURE),
+    "m/s": (UnitOfSpeed.METERS_PER_SECOND, SensorDeviceClass.WIND_SPEED),
+    "W/m2": ("W/m\u00b2", SensorDeviceClass.IRRADIANCE),
+    "W/m\u00b2": ("W/m\u00b2", SensorDeviceClass.IRRADIANCE),
+    "cm": (UnitOfLength.CENTIMETERS, SensorDeviceClass.DISTANCE),
+    "%": (PERCENTAGE, None),
+    "\u00b0": (DEGREE, None),
+    "graus": (DEGREE, None),
+}
+
+
+def get_variable_sensor_config(variable_code: int, metadata: dict[str, Any]) -> dict[str, Any]:
+    """Return the sensor configuration of a variable outside SENSOR_TYPES."""
+    unit = metadata.get("unitat")
+    unit, device_class = VARIABLE_UNITS.get(unit, (unit, None))
+    return {
+        "key": f"variable_{variable_code}",
+        "name": metadata.get("nom") or f"Variable {variable_code}",
+        "device_class": device_class,
+        "unit": unit,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:chart-line",
+        "decimals": metadata.get("decimals"),
+    }
+
+
+def _get_update_offset_attributes(coordinator: MeteocatCoordinator) -> dict[str, Any]:
+    """Return the stagger offset applied to this entry's scheduled updates."""
+    update_offset = getattr(coordinator, "update_offset", None)
+    if not isinstance(update_offset, timedelta):
+        return {}
+    return {
+        "update_offset_seconds": int(update_offset.total_seconds()),
+        "update_stagger_window_minutes": getattr(coordinator, "update_stagger_window", None),
+    }
+
+
+def _get_entry_device_model(mode: str) -> str:
+    """Return the model of the entry device in the given mode."""
+    if mode == MODE_EXTERNAL:
+        return "Estaci\u00f3 XEMA"
+    if mode == MODE_MULTI:
+        return "Estacions XEMA"
+    return "Predicci\u00f3 Municipi"
+
+
+def _get_location_sensor_types(entry: ConfigEntry, station: bool) -> list[MeteocatLocationSensorEntityDescription]:
+    """Return the location sensors of the station or municipality of the entry."""
+    return [
+        description
+        for description in LOCATION_SENSOR_TYPES
+        if description.station is station
+        and (not description.optional or entry.data.get(description.data_key) not in (None, ""))
+    ]
+
+
+def _should_force_enable(unique_id: str) -> bool:
+    """Return whether a configuration sensor must not stay disabled."""
+    return (
+        unique_id.endswith("_municipality_name") or
+        unique_id.endswith("_comarca_name") or
+        unique_id.endswith("_provincia_name") or
+        "_update_time_" in unique_id or
+        "_station_municipality_name" in unique_id or
+        "_station_comarca_name" in unique_id or
+        "_station_provincia_name" in unique_id
+    )
+
+
+@callback
+def _async_update_registry_entries(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: MeteocatCoordinator, mode: str
+) -> None:
+    """Clean up and re-enable the registry entries of this config entry.
+    
+    Forecast sensors that are disabled or not supported in the current mode
+    are removed, and configuration sensors are force enabled so they do not
+    stick in disabled state after category changes. Both are done in one
+    pass over the entries of this config entry, read from the registry index
+    instead of scanning every entity of the installation.
+    """
+    registry = er.async_get(hass)
+    
+    # Sensors are only supported in LOCAL mode currently
+    removed_unique_ids = {
+        f"{entry.entry_id}_forecast_{forecast_type}"
+        for forecast_type in ("hourly", "daily")
+        if not (mode == MODE_LOCAL and getattr(coordinator, f"enable_forecast_{forecast_type}", False))
+    }
+    # Multi-station entries never fetch forecasts: no forecast quota or update times
+    removed_prefixes = (
+        (
+            f"{entry.entry_id}_quota_prediccio",
+            f"{entry.entry_id}_quota_dies_estimats_prediccio",
+            f"{entry.entry_id}_update_time_",
+        )
+        if mode == MODE_MULTI
+        else ()
+    )
+    
+    for reg_entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if reg_entity.domain != "sensor":
+            continue
+        if reg_entity.unique_id in removed_unique_ids or reg_entity.unique_id.startswith(removed_prefixes):
+            _LOGGER.debug("Removing disabled/unsupported forecast sensor: %s", reg_entity.entity_id)
+            registry.async_remove(reg_entity.entity_id)
+        elif reg_entity.disabled and _should_force_enable(reg_entity.unique_id):
+            registry.async_update_entity(reg_entity.entity_id, disabled_by=None)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -163,6 +447,45 @@ async def async_setup_entry(
                 MeteocatXemaSensor(coordinator, entry, entity_name, variable_code)
             )
         
+        # Add sensors for the other variables the station reports, named from the
+        # cached XEMA metadata (resolved once here, never on refreshes)
+        extra_variables = sorted(
+            code for code in available_variables
+            if isinstance(code, int) and code not in SENSOR_TYPES
+        )
+        if extra_variables:
+            variable_metadata = await coordinator.async_get_variable_metadata()
+            for variable_code in extra_variables:
+                metadata = variable_metadata.get(variable_code)
+                if metadata is None:
+                    _LOGGER.debug("No metadata for XEMA variable %s, sensor not created", variable_code)
+                    continue
+                entities.append(
+                    MeteocatXemaSensor(
+                        coordinator, entry, entity_name, variable_code,
+                        sensor_config=get_variable_sensor_config(variable_code, metadata),
+                    )
+                )
+        
+        # Add daily aggregates of the variables the station reports
+        for variable_code, statistic in DAILY_AGGREGATE_TYPES:
+            if variable_code in available_variables:
+                entities.append(
+                    MeteocatDailyAggregateSensor(coordinator, entry, entity_name, variable_code, statistic)
+                )
+        
+        # Add metrics derived from the latest readings
+        for key, derived_config in DERIVED_SENSOR_TYPES.items():
+            if all(code in available_variables for code in derived_config["variables"]):
+                entities.append(MeteocatDerivedSensor(coordinator, entry, entity_name, key))
+        
+        # Add rolling precipitation sums
+        if 35 in available_variables:
+            for minutes in PRECIPITATION_WINDOWS:
+                entities.append(
+                    MeteocatPrecipitationWindowSensor(coordinator, entry, entity_name, minutes)
+                )
+        
         # Add UTCI Sensor (External)
         entities.append(MeteocatUTCISensor(coordinator, entry, entity_name_with_code))
         # Add UTCI Literal Sensor (External)
@@ -173,6 +496,18 @@ async def async_setup_entry(
         if 30 in available_variables or "30" in available_variables:
             entities.append(MeteocatBeaufortSensor(coordinator, entry, entity_name_with_code))
             entities.append(MeteocatBeaufortDescriptionSensor(coordinator, entry, entity_name_with_code))
+    elif mode == MODE_MULTI:
+        entity_name = entry.data.get(CONF_COMARCA_NAME) or entry.title
+        entity_name_with_code = entity_name  # Entry-level (hub) device
+        
+        # One device per station, all fed from the shared coordinator snapshot
+        stations_data = entry.data.get("_stations_data", {})
+        for code in entry.data.get(CONF_STATION_CODES, []):
+            station_name = stations_data.get(code, {}).get("nom") or f"Estaci\u00f3 {code}"
+            for variable_code in SENSOR_TYPES:
+                entities.append(
+                    MeteocatXemaSensor(coordinator, entry, station_name, variable_code, code)
+                )
     else:
         entity_name = entry.data.get(CONF_MUNICIPALITY_NAME, f"Municipi {municipality_code}")
         entity_name_with_code = entity_name  # For device grouping
@@ -189,24 +524,6 @@ async def async_setup_entry(
             entities.append(MeteocatBeaufortSensor(coordinator, entry, entity_name_with_code))
             entities.append(MeteocatBeaufortDescriptionSensor(coordinator, entry, entity_name_with_code))
     
-    # Clean up forecast sensors if disabled or not supported in current mode
-    try:
-        registry = er.async_get(hass)
-        for forecast_type in ["hourly", "daily"]:
-            # Check if enabled config
-            is_enabled = getattr(coordinator, f"enable_forecast_{forecast_type}", False)
-            
-            # Sensors are only supported in LOCAL mode currently
-            should_exist = (mode == MODE_LOCAL) and is_enabled
-            
-            if not should_exist:
-                unique_id = f"{entry.entry_id}_forecast_{forecast_type}"
-                if entity_id := registry.async_get_entity_id("sensor", DOMAIN, unique_id):
-                    _LOGGER.debug("Removing disabled/unsupported forecast sensor: %s", entity_id)
-                    registry.async_remove(entity_id)
-    except Exception as err:
-        _LOGGER.warning("Error cleaning up disabled sensors: %s", err)
-
     # Add forecast sensors for local mode
     if mode == MODE_LOCAL:
         if coordinator.enable_forecast_hourly:
@@ -214,27 +531,11 @@ async def async_setup_entry(
         if coordinator.enable_forecast_daily:
             entities.append(MeteocatForecastSensor(coordinator, entry, entity_name_with_code, entity_name, "daily"))
             
-        # Add municipality info sensors
-        entities.extend([
-            MeteocatMunicipalityNameSensor(coordinator, entry, entity_name, entity_name_with_code, municipality_code),
-            MeteocatComarcaNameSensor(coordinator, entry, entity_name, entity_name_with_code, municipality_code),
-        ])
-        
-        # Add province name sensor if available
-        if entry.data.get("provincia_name"):
-            entities.append(
-                MeteocatProvinciaNameSensor(coordinator, entry, entity_name, entity_name_with_code, municipality_code)
-            )
-        
-        # Add coordinate sensors if data available
-        if entry.data.get("municipality_lat") is not None:
-            entities.append(
-                MeteocatMunicipalityLatitudeSensor(coordinator, entry, entity_name, entity_name_with_code, municipality_code)
-            )
-        if entry.data.get("municipality_lon") is not None:
-            entities.append(
-                MeteocatMunicipalityLongitudeSensor(coordinator, entry, entity_name, entity_name_with_code, municipality_code)
-            )
+        # Add municipality info sensors (province and coordinates if available)
+        entities.extend(
+            MeteocatLocationSensor(coordinator, entry, entity_name, entity_name_with_code, municipality_code, description)
+            for description in _get_location_sensor_types(entry, station=False)
+        )
     
     # Create quota sensors (for both modes)
     if coordinator.data and coordinator.data.get("quotes"):
@@ -253,6 +554,10 @@ async def async_setup_entry(
                     # Filter out XEMA plan in LOCAL mode (never used)
                     if mode == MODE_LOCAL and "xema" in plan_name:
                         continue
+                    
+                    # Filter out Predicci\u00f3 plan in MULTI mode (forecasts never fetched)
+                    if mode == MODE_MULTI and "predicci" in plan_name:
+                        continue
                         
                     entities.append(
                         MeteocatQuotaSensor(
@@ -278,14 +583,20 @@ async def async_setup_entry(
                         )
                     )
     
-    # Add update timestamp sensors (for both modes)
+    # Add update timestamp sensors (for all modes)
     entities.extend([
         MeteocatLastUpdateSensor(coordinator, entry, entity_name, entity_name_with_code, mode, station_code if mode == MODE_EXTERNAL else None),
         MeteocatNextUpdateSensor(coordinator, entry, entity_name, entity_name_with_code, mode, station_code if mode == MODE_EXTERNAL else None),
-        MeteocatUpdateTimeSensor(coordinator, entry, entity_name, entity_name_with_code, mode, 1, station_code if mode == MODE_EXTERNAL else None),
-        MeteocatUpdateTimeSensor(coordinator, entry, entity_name, entity_name_with_code, mode, 2, station_code if mode == MODE_EXTERNAL else None),
+        MeteocatRefreshDurationSensor(coordinator, entry, entity_name, entity_name_with_code, mode, station_code if mode == MODE_EXTERNAL else None),
     ])
     
+    # Add forecast update time sensors (multi-station entries never fetch forecasts)
+    if mode != MODE_MULTI:
+        entities.extend([
+            MeteocatUpdateTimeSensor(coordinator, entry, entity_name, entity_name_with_code, mode, 1, station_code if mode == MODE_EXTERNAL else None),
+            MeteocatUpdateTimeSensor(coordinator, entry, entity_name, entity_name_with_code, mode, 2, station_code if mode == MODE_EXTERNAL else None),
+        ])
+    
     # Add forecast update sensors (only for external mode)
     if mode == MODE_EXTERNAL:
         entities.extend([
@@ -294,75 +605,38 @@ async def async_setup_entry(
         ])
     
     # Add 3rd update time sensor if configured
-    if coordinator.update_time_3:
+    if coordinator.update_time_3 and mode != MODE_MULTI:
         entities.append(
             MeteocatUpdateTimeSensor(coordinator, entry, entity_name, entity_name_with_code, mode, 3, station_code if mode == MODE_EXTERNAL else None)
         )
     
-    # Add station location sensors (only for external mode)
+    # Add station location sensors (only for external mode): altitude, coordinates,
+    # comarca, and municipality and province names if available
     if mode == MODE_EXTERNAL:
-        entities.extend([
-            MeteocatAltitudeSensor(coordinator, entry, entity_name, entity_name_with_code, station_code),
-            MeteocatLatitudeSensor(coordinator, entry, entity_name, entity_name_with_code, station_code),
-            MeteocatLongitudeSensor(coordinator, entry, entity_name, entity_name_with_code, station_code),
-        ])
-        
-        # Add comarca name sensor (always available for stations)
-        entities.append(
-            MeteocatStationComarcaNameSensor(coordinator, entry, entity_name, entity_name_with_code, station_code)
+        entities.extend(
+            MeteocatLocationSensor(coordinator, entry, entity_name, entity_name_with_code, station_code, description)
+            for description in _get_location_sensor_types(entry, station=True)
         )
-        
-        # Add municipality name sensor if available
-        if entry.data.get("station_municipality_name"):
-            entities.append(
-                MeteocatStationMunicipalityNameSensor(coordinator, entry, entity_name, entity_name_with_code, station_code)
-            )
-        
-        # Add province name sensor if available
-        if entry.data.get("station_provincia_name"):
-            entities.append(
-                MeteocatStationProvinciaNameSensor(coordinator, entry, entity_name, entity_name_with_code, station_code)
-            )
-    
     
-    # Force enable configuration sensors that might be disabled in registry
-    # This prevents them from sticking in disabled state after category changes
+    # Remove unsupported forecast sensors and force enable configuration sensors
     # Use a try-except block to ensure we never block setup if registry operations fail
     try:
-        registry = er.async_get(hass)
-        
-        # Accessing registry entries safely
-        entry_entities = [
-            entity for entity in registry.entities.values() 
-            if entity.config_entry_id == entry.entry_id
-        ]
-        
-        for reg_entity in entry_entities:
-            if reg_entity.disabled: 
-                uid = reg_entity.unique_id
-                should_enable = (
-                    uid.endswith("_municipality_name") or
-                    uid.endswith("_comarca_name") or
-                    uid.endswith("_provincia_name") or
-                    "_update_time_" in uid or
-                    "_station_municipality_name" in uid or
-                    "_station_comarca_name" in uid or
-                    "_station_provincia_name" in uid
-                )
-                
-                if should_enable:
-                     registry.async_update_entity(reg_entity.entity_id, disabled_by=None)
+        _async_update_registry_entries(hass, entry, coordinator, mode)
     except Exception as ex:
-        _LOGGER.warning("Could not force enable config sensors: %s", ex)
+        _LOGGER.warning("Could not update registry entries of sensors: %s", ex)
     
     async_add_entities(entities)
 
 
-class MeteocatQuotaSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+class MeteocatQuotaSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
     """Representation of a Meteocat API quota sensor."""
 
     _attr_attribution = ATTRIBUTION
     _attr_state_class = SensorStateClass.MEASUREMENT
+    # The plan details are served by the get_quotes service
+    _unrecorded_attributes = MeteocatStaleDataMixin._unrecorded_attributes | frozenset(
+        {"max_consultes", "consultes_realitzades", "consultes_restants", "periode", "plan"}
+    )
 
     def __init__(
         self,
@@ -405,7 +679,7 @@ class MeteocatQuotaSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": self._device_name,
             "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA" if mode == MODE_EXTERNAL else "Predicci\u00f3 Municipi",
+            "model": _get_entry_device_model(mode),
         }
         
         # Quota sensors are diagnostic information
@@ -467,39 +741,32 @@ class MeteocatQuotaSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
         # Fallback: use sanitized slug
         return (plan_name, slug)
 
+    def _get_plan(self) -> dict[str, Any] | None:
+        """Return this sensor's plan from the coordinator index."""
+        return self.coordinator.get_quota_plan(self._plan_name)
+
     @property
     def native_value(self) -> int | None:
         """Return the number of remaining requests."""
-        quotes = self.coordinator.data.get("quotes")
-        if not quotes or not isinstance(quotes, dict):
+        plan = self._get_plan()
+        if plan is None:
             return None
-        
-        # Find the plan in the plans array
-        for plan in quotes.get("plans", []):
-            if plan.get("nom") == self._plan_name:
-                return plan.get("consultesRestants", 0)
-        
-        return None
+        return plan.get("consultesRestants", 0)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        quotes = self.coordinator.data.get("quotes")
-        if not quotes or not isinstance(quotes, dict):
+        plan = self._get_plan()
+        if plan is None:
             return {}
-        
-        # Find the plan in the plans array
-        for plan in quotes.get("plans", []):
-            if plan.get("nom") == self._plan_name:
-                return {
-                    "max_consultes": plan.get("maxConsultes", 0),
-                    "consultes_realitzades": plan.get("consultesRealitzades", 0),
-                    "consultes_restants": plan.get("consultesRestants", 0),
-                    "periode": plan.get("periode", ""),
-                    "plan": self._plan_name,
-                }
-        
-        return {}
+        return {
+            "max_consultes": plan.get("maxConsultes", 0),
+            "consultes_realitzades": plan.get("consultesRealitzades", 0),
+            "consultes_restants": plan.get("consultesRestants", 0),
+            "periode": plan.get("periode", ""),
+            "plan": self._plan_name,
+            **self._stale_data_attributes(),
+        }
 
     @property
     def icon(self) -> str:
@@ -514,7 +781,7 @@ class MeteocatQuotaSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
         return "mdi:counter"
 
 
-class MeteocatXemaSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+class MeteocatXemaSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
     """Representation of a Meteocat XEMA sensor."""
 
     def __init__(
@@ -523,18 +790,32 @@ class MeteocatXemaSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
         entry: ConfigEntry,
         entity_name: str,
         variable_code: int,
+        station_code: str | None = None,
+        sensor_config: dict[str, Any] | None = None,
     ) -> None:
-        """Initialize the sensor."""
+        """Initialize the sensor.
+        
+        station_code is only given for the stations of a multi-station entry,
+        sensor_config for variables outside SENSOR_TYPES.
+        """
         super().__init__(coordinator)
         self._variable_code = variable_code
-        self._sensor_config = SENSOR_TYPES[variable_code]
+        self._sensor_config = sensor_config or SENSOR_TYPES[variable_code]
+        self._multi_station_code = station_code
         
-        station_code = entry.data.get(CONF_STATION_CODE, "")
         key = self._sensor_config["key"]
-        
-        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        if station_code:
+            self._attr_unique_id = f"{entry.entry_id}_{station_code.lower()}_{key}"
+        else:
+            station_code = entry.data.get(CONF_STATION_CODE, "")
+            self._attr_unique_id = f"{entry.entry_id}_{key}"
         self._attr_has_entity_name = True
-        self._attr_translation_key = key
+        if "name" in self._sensor_config:
+            # Discovered variable: named after the XEMA metadata
+            self._attr_name = self._sensor_config["name"]
+            self._attr_suggested_display_precision = self._sensor_config.get("decimals")
+        else:
+            self._attr_translation_key = key
         
         self._attr_device_class = self._sensor_config["device_class"]
         self._attr_native_unit_of_measurement = self._sensor_config["unit"]
@@ -547,27 +828,46 @@ class MeteocatXemaSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
             "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
             "model": "Estaci\u00f3 XEMA",
         }
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        measurements = self.coordinator.data.get("measurements")
-        if not measurements or not isinstance(measurements, list):
-            return None
-        
-        # API returns list of stations, get first one
-        station_data = measurements[0]
-        variables = station_data.get("variables", [])
+        if self._multi_station_code:
+            # Per-station device under the entry device
+            self._attr_device_info["identifiers"] = {(DOMAIN, f"{entry.entry_id}_{station_code}")}
+            self._attr_device_info["via_device"] = (DOMAIN, entry.entry_id)
+
+    def _get_variable(self) -> dict[str, Any] | None:
+        """Return the measurements entry of this sensor's variable."""
+        if self._multi_station_code:
+            variables = self.coordinator.get_station_variables(self._multi_station_code)
+        else:
+            measurements = self.coordinator.data.get("measurements") if self.coordinator.data else None
+            if not measurements or not isinstance(measurements, list):
+                return None
+            
+            # API returns list of stations, get first one
+            station_data = measurements[0]
+            variables = station_data.get("variables", [])
         
         # Find measurement for this variable code
         for variable in variables:
             if variable.get("codi") == self._variable_code:
+                return variable
+        return None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        variable = self._get_variable()
+        if variable is not None:
                 lectures = variable.get("lectures", [])
                 if lectures:
                      # Special handling for Precipitation (35): Daily accumulation
                     if self._variable_code == 35:
+                        # Readings span a rolling window across UTC days: sum the local day only
+                        today = dt_util.now().date()
                         total_precip = 0.0
                         for reading in lectures:
+                            timestamp = parse_reading_time(reading.get("data"))
+                            if timestamp is not None and dt_util.as_local(timestamp).date() != today:
+                                continue
                             valor = reading.get("valor")
                             if valor is not None:
                                 try:
@@ -582,11 +882,186 @@ class MeteocatXemaSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
         
         return None
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the station the value comes from when served by failover."""
+        attrs = self._stale_data_attributes()
+        variable = self._get_variable()
+        if not variable or "source_station" not in variable:
+            return attrs
+        return {
+            "source_station": variable["source_station"],
+            "source_station_name": variable.get("source_station_name"),
+            "source_distance_km": variable.get("source_distance_km"),
+            **attrs,
+        }
+
+
+class MeteocatDailyAggregateSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+    """Minimum, maximum or mean of a XEMA variable since local midnight.
+
+    Read from the daily aggregates of the coordinator history, which are
+    updated with each new reading: no recorder query and no API call.
+    """
+
+    def __init__(
+        self,
+        coordinator: MeteocatCoordinator,
+        entry: ConfigEntry,
+        entity_name: str,
+        variable_code: int,
+        statistic: str,  # "min", "max" or "mean"
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._variable_code = variable_code
+        self._statistic = statistic
+        sensor_config = SENSOR_TYPES[variable_code]
+        station_code = entry.data.get(CONF_STATION_CODE, "")
+        
+        key = f"{sensor_config['key']}_daily_{statistic}"
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_has_entity_name = True
+        self._attr_translation_key = key
+        
+        self._attr_device_class = sensor_config["device_class"]
+        self._attr_native_unit_of_measurement = sensor_config["unit"]
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = sensor_config["icon"]
+        self._attr_suggested_display_precision = 1
+        
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"{entity_name} {station_code}",
+            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
+            "model": "Estaci\u00f3 XEMA",
+        }
+
+    def _get_aggregate(self) -> Any:
+        """Return the aggregate of today, None before the first reading of the day."""
+        return self.coordinator.history.daily(self._variable_code, dt_util.now().date())
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic of today's readings."""
+        aggregate = self._get_aggregate()
+        if aggregate is None:
+            return None
+        if self._statistic == "min":
+            return aggregate.minimum
+        if self._statistic == "max":
+            return aggregate.maximum
+        return round(aggregate.mean, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return when the extreme was reached and how many readings were used."""
+        attrs = self._stale_data_attributes()
+        aggregate = self._get_aggregate()
+        if aggregate is None:
+            return attrs
+        attrs["readings"] = aggregate.count
+        if self._statistic == "min":
+            attrs["reading_time"] = aggregate.minimum_time.isoformat()
+        elif self._statistic == "max":
+            attrs["reading_time"] = aggregate.maximum_time.isoformat()
+        return attrs
+
+
+class MeteocatDerivedSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+    """Dew point, heat index, wind chill or absolute humidity of a station.
+
+    Every derived metric is computed once per measurements payload by the
+    coordinator (see utils.derive_station_metrics); the sensor only reads it.
+    """
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+
+    def __init__(
+        self,
+        coordinator: MeteocatCoordinator,
+        entry: ConfigEntry,
+        entity_name: str,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        sensor_config = DERIVED_SENSOR_TYPES[key]
+        station_code = entry.data.get(CONF_STATION_CODE, "")
+        
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_has_entity_name = True
+        self._attr_translation_key = key
+        self._attr_device_class = sensor_config["device_class"]
+        self._attr_native_unit_of_measurement = sensor_config["unit"]
+        self._attr_icon = sensor_config["icon"]
+        
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"{entity_name} {station_code}",
+            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
+            "model": "Estaci\u00f3 XEMA",
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the derived metric."""
+        return self.coordinator.get_derived_metrics().get(self._key)
+
+
+class MeteocatPrecipitationWindowSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+    """Precipitation of the last minutes or hours.
 
-class MeteocatForecastSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+    Read from a rolling sum of the coordinator history, updated with each new
+    reading only, so it runs across the day boundary without summing again.
+    Unknown once the station has not reported for longer than the window.
+    """
+
+    _attr_device_class = SensorDeviceClass.PRECIPITATION
+    _attr_native_unit_of_measurement = UnitOfPrecipitationDepth.MILLIMETERS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _attr_icon = "mdi:weather-pouring"
+
+    def __init__(
+        self,
+        coordinator: MeteocatCoordinator,
+        entry: ConfigEntry,
+        entity_name: str,
+        minutes: int,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._minutes = minutes
+        station_code = entry.data.get(CONF_STATION_CODE, "")
+        
+        period = f"{minutes}m" if minutes < 60 else f"{minutes // 60}h"
+        key = f"precipitation_{period}"
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_has_entity_name = True
+        self._attr_translation_key = key
+        
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"{entity_name} {station_code}",
+            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
+            "model": "Estaci\u00f3 XEMA",
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the precipitation of the window."""
+        return self.coordinator.history.window_total(35, self._minutes, dt_util.utcnow())
+
+
+class MeteocatForecastSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
     """Representation of a Meteocat forecast sensor (hourly or daily)."""
 
     _attr_attribution = ATTRIBUTION
+    # The full forecast is served by the get_forecast service, the compact one is kept
+    _unrecorded_attributes = MeteocatStaleDataMixin._unrecorded_attributes | frozenset({"forecast_ha"})
 
     def __init__(
         self,
@@ -602,6 +1077,10 @@ class MeteocatForecastSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntit
         self._forecast_type = forecast_type
         self._device_name = device_name
         self._entity_name = entity_name
+        # Columnar forecast attribute instead of the list of forecast items
+        self._compact_attributes = (
+            (entry.options or {}).get(CONF_COMPACT_FORECAST_ATTRIBUTES) is True
+        )
         
         # Create unique ID and name
         self._attr_unique_id = f"{entry.entry_id}_forecast_{forecast_type}"
@@ -618,28 +1097,57 @@ class MeteocatForecastSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntit
             "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
             "model": "Predicci\u00f3 Municipi",
         }
+        
+        # Converted forecast, reused until the coordinator holds a new payload
+        self._forecast_memo: tuple[Any, int, dict[str, Any]] | None = None
+
+    def _get_converted_forecast(self) -> tuple[int, dict[str, Any]]:
+        """Return the number of hours or days and the forecast attributes.
+        
+        Both are computed once per forecast payload: a new fetch always
+        stores a new object in the coordinator data, so the payload identity
+        tells when to convert again.
+        """
+        if self._forecast_type == "hourly":
+            payload = self.coordinator.data.get("forecast_hourly")
+        else:
+            payload = self.coordinator.data.get("forecast")
+        
+        memo = self._forecast_memo
+        if memo is None or memo[0] is not payload:
+            if self._forecast_type == "hourly":
+                # Hours are counted from the temperature values
+                count = sum(
+                    len(dia.get("variables", {}).get("temp", {}).get("valors", []))
+                    for dia in payload.get("dies", [])
+                )
+                forecast = self._get_forecast_hourly()
+            else:
+                count = len(payload.get("dies", []))
+                forecast = self._get_forecast_daily()
+            if self._compact_attributes:
+                attributes = {
+                    "forecast_compact": encode_forecast_columns(forecast, FORECAST_ATTRIBUTE_MAX_BYTES)
+                }
+            else:
+                attributes = {"forecast_ha": forecast}
+            memo = self._forecast_memo = (payload, count, attributes)
+        return memo[1], memo[2]
 
     @property
     def native_value(self) -> int | None:
         """Return the state (number of forecast periods)."""
+        data = self.coordinator.data or {}
         if self._forecast_type == "hourly":
             # Use hourly forecast data
-            forecast_hourly = self.coordinator.data.get("forecast_hourly")
-            if not forecast_hourly:
+            if not data.get("forecast_hourly"):
                 return "0 hores"
             
-            # Count total hours
-            total = 0
-            dies = forecast_hourly.get("dies", [])
-            for dia in dies:
-                variables = dia.get("variables", {})
-                temp_data = variables.get("temp", {})
-                valors = temp_data.get("valors", [])
-                total += len(valors)
+            total = self._get_converted_forecast()[0]
             return f"{total} hores" if total > 0 else "0 hores"
         else:
             # Use daily forecast data
-            forecast = self.coordinator.data.get("forecast")
+            forecast = data.get("forecast")
             if not forecast:
                 return "0 dies"
             
@@ -649,138 +1157,31 @@ class MeteocatForecastSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntit
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return forecast data as attributes."""
+        data = self.coordinator.data or {}
         if self._forecast_type == "hourly":
-            if not self.coordinator.data.get("forecast_hourly"):
+            if not data.get("forecast_hourly"):
                 return {}
             # Only return filtered HA format to avoid exceeding DB size limit (16KB)
             return {
-                "forecast_ha": self._get_forecast_hourly(),
+                **self._get_converted_forecast()[1],
+                **self._stale_data_attributes(),
             }
         else:
-            if not self.coordinator.data.get("forecast"):
+            if not data.get("forecast"):
                 return {}
             # Only return filtered HA format for consistency and DB optimization
             return {
-                "forecast_ha": self._get_forecast_daily(),
+                **self._get_converted_forecast()[1],
+                **self._stale_data_attributes(),
             }
 
     def _get_forecast_hourly(self) -> list[dict[str, Any]]:
         """Return the hourly forecast in HA format."""
-        forecast_hourly = self.coordinator.data.get("forecast_hourly")
-        if not forecast_hourly:
-            return []
-        
-        forecasts = []
-        
-        dies = forecast_hourly.get("dies", [])
-        for dia in dies:
-            variables = dia.get("variables", {})
-            
-            # Get hourly variables with their values arrays
-            temp_data = variables.get("temp", {})
-            estat_cel_data = variables.get("estatCel", {})
-            precip_data = variables.get("precipitacio", {})
-            
-            temp_valors = temp_data.get("valors", [])
-            estat_valors = estat_cel_data.get("valors", [])
-            precip_valors = precip_data.get("valors", [])
-            
-            # Build dictionaries by timestamp
-            temp_dict = {h.get("data"): h.get("valor") for h in temp_valors}
-            estat_dict = {h.get("data"): h.get("valor") for h in estat_valors}
-            precip_dict = {h.get("data"): h.get("valor") for h in precip_valors}
-            
-            # Get all unique timestamps
-            all_times = set(temp_dict.keys()) | set(estat_dict.keys()) | set(precip_dict.keys())
-            
-            for time_str in sorted(all_times):
-                if time_str:
-                    forecast_item = {
-                        "datetime": time_str,
-                    }
-                    
-                    if time_str in temp_dict:
-                        try:
-                            forecast_item["temperature"] = float(temp_dict[time_str])
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    if time_str in estat_dict:
-                        condition = METEOCAT_CONDITION_MAP.get(estat_dict[time_str])
-                        if condition:
-                            forecast_item["condition"] = condition
-                    
-                    if time_str in precip_dict:
-                        try:
-                            forecast_item["precipitation"] = float(precip_dict[time_str])
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    forecasts.append(forecast_item)
-        
-        return forecasts[:72]  # Limit to 72 hours
+        return convert_forecast_hourly(self.coordinator.data.get("forecast_hourly"))
 
     def _get_forecast_daily(self) -> list[dict[str, Any]]:
         """Return the daily forecast in HA format."""
-        forecast = self.coordinator.data.get("forecast")
-        if not forecast:
-            return []
-        
-        forecasts = []
-        
-        dies = forecast.get("dies", [])[:8]  # Limit to 8 days
-        for dia in dies:
-            data = dia.get("data")
-            if not data:
-                continue
-            
-            variables = dia.get("variables", {})
-            
-            forecast_item = {
-                "datetime": data,
-            }
-            
-            # Temperature min/max (simple objects with valor)
-            tmin = variables.get("tmin", {})
-            if isinstance(tmin, dict):
-                valor = tmin.get("valor")
-                if valor is not None:
-                    try:
-                        forecast_item["templow"] = float(valor)
-                    except (ValueError, TypeError):
-                        pass
-            
-            tmax = variables.get("tmax", {})
-            if isinstance(tmax, dict):
-                valor = tmax.get("valor")
-                if valor is not None:
-                    try:
-                        forecast_item["temperature"] = float(valor)
-                    except (ValueError, TypeError):
-                        pass
-            
-            # Condition (simple object with valor)
-            estat_cel = variables.get("estatCel", {})
-            if isinstance(estat_cel, dict):
-                estat_code = estat_cel.get("valor")
-                if estat_code is not None:
-                    condition = METEOCAT_CONDITION_MAP.get(estat_code)
-                    if condition:
-                        forecast_item["condition"] = condition
-            
-            # Precipitation (simple object with valor, percentage)
-            precip = variables.get("precipitacio", {})
-            if isinstance(precip, dict):
-                valor = precip.get("valor")
-                if valor is not None:
-                    try:
-                        forecast_item["precipitation"] = float(valor)
-                    except (ValueError, TypeError):
-                        pass
-            
-            forecasts.append(forecast_item)
-            
-        return forecasts
+        return convert_forecast_daily(self.coordinator.data.get("forecast"))
 
     @property
     def icon(self) -> str:
@@ -788,7 +1189,7 @@ class MeteocatForecastSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntit
         return "mdi:weather-partly-cloudy" if self._forecast_type == "hourly" else "mdi:calendar-week"
 
 
-class MeteocatLastUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+class MeteocatLastUpdateSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
     """Sensor showing last update timestamp."""
 
     _attr_attribution = ATTRIBUTION
@@ -830,7 +1231,7 @@ class MeteocatLastUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEnt
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": self._device_name,
             "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA" if mode == MODE_EXTERNAL else "Predicci\u00f3 Municipi",
+            "model": _get_entry_device_model(mode),
 
         }
         
@@ -854,7 +1255,7 @@ class MeteocatLastUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEnt
         return "mdi:update"
 
 
-class MeteocatNextForecastUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+class MeteocatNextForecastUpdateSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
     """Sensor showing next scheduled forecast update timestamp (External Mode)."""
 
     _attr_attribution = ATTRIBUTION
@@ -897,6 +1298,14 @@ class MeteocatNextForecastUpdateSensor(CoordinatorEntity[MeteocatCoordinator], S
         """Return the next forecast update time."""
         return getattr(self.coordinator, "next_forecast_update", None)
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the per-entry update offset."""
+        return {
+            **_get_update_offset_attributes(self.coordinator),
+            **self._stale_data_attributes(),
+        }
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -908,7 +1317,7 @@ class MeteocatNextForecastUpdateSensor(CoordinatorEntity[MeteocatCoordinator], S
         return "mdi:calendar-clock"
 
 
-class MeteocatLastForecastUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+class MeteocatLastForecastUpdateSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
     """Sensor showing last forecast update timestamp (External Mode)."""
 
     _attr_attribution = ATTRIBUTION
@@ -962,7 +1371,7 @@ class MeteocatLastForecastUpdateSensor(CoordinatorEntity[MeteocatCoordinator], S
         return "mdi:calendar-check"
 
 
-class MeteocatNextUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+class MeteocatNextUpdateSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
     """Sensor showing next scheduled update timestamp.
     
     This diagnostic sensor displays when the next automatic data update will occur.
@@ -1017,7 +1426,7 @@ class MeteocatNextUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEnt
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": self._device_name,
             "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA" if mode == MODE_EXTERNAL else "Predicci\u00f3 Municipi",
+            "model": _get_entry_device_model(mode),
 
         }
         
@@ -1028,6 +1437,14 @@ class MeteocatNextUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEnt
         """Return the next update time."""
         return self.coordinator.next_scheduled_update
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the per-entry update offset."""
+        return {
+            **_get_update_offset_attributes(self.coordinator),
+            **self._stale_data_attributes(),
+        }
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -1039,10 +1456,25 @@ class MeteocatNextUpdateSensor(CoordinatorEntity[MeteocatCoordinator], SensorEnt
         return "mdi:clock-outline"
 
 
-class MeteocatUpdateTimeSensor(SensorEntity):
-    """Sensor showing configured update time."""
+class MeteocatRefreshDurationSensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+    """Sensor showing how long the last refresh took.
+    
+    Data source: coordinator.refresh_traces
+    - State: duration of the last refresh in milliseconds
+    - Attributes: p50/p95 per phase over the last refreshes
+    
+    Entity category: diagnostic
+    """
 
     _attr_attribution = ATTRIBUTION
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_registry_enabled_default = False
+    # The traces are served by the diagnostics download
+    _unrecorded_attributes = MeteocatStaleDataMixin._unrecorded_attributes | frozenset(
+        {"last_refresh", "refreshes", "phases"}
+    )
 
     def __init__(
         self,
@@ -1051,155 +1483,76 @@ class MeteocatUpdateTimeSensor(SensorEntity):
         entity_name: str,
         device_name: str,
         mode: str,
-        time_number: int,  # 1 or 2
         station_code: str | None = None,
     ) -> None:
-        """Initialize the update time sensor."""
-        self._attr_available = True
-        # Do not inherit from CoordinatorEntity to keep it always available
+        """Initialize the refresh duration sensor."""
+        super().__init__(coordinator)
         
-        self._coordinator = coordinator  # Keep reference for helper property
         self._entity_name = entity_name
         self._device_name = device_name
         self._mode = mode
         self._station_code = station_code
-        self._time_number = time_number
         
-        self._attr_unique_id = f"{entry.entry_id}_update_time_{time_number}"
+        self._attr_unique_id = f"{entry.entry_id}_refresh_duration"
         self._attr_has_entity_name = True
-        self._attr_translation_key = "update_time"
-        self._attr_translation_placeholders = {"number": str(time_number)}
+        self._attr_translation_key = "refresh_duration"
         
         # Set explicit entity_id based on mode
         if mode == MODE_EXTERNAL and station_code:
             base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
             code_lower = station_code.lower()
-            self.entity_id = f"sensor.{base_name}_{code_lower}_update_time_{time_number}"
+            self.entity_id = f"sensor.{base_name}_{code_lower}_refresh_duration"
         else:
             base_name = entity_name.lower().replace(" ", "_")
-            self.entity_id = f"sensor.{base_name}_update_time_{time_number}"
+            self.entity_id = f"sensor.{base_name}_refresh_duration"
         
-        # Each entry is a separate device under a shared hub
-        hub_id = f"{DOMAIN}_hub_external" if mode == MODE_EXTERNAL else f"{DOMAIN}_hub_local"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": self._device_name,
             "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA" if mode == MODE_EXTERNAL else "Predicci\u00f3 Municipi",
-
+            "model": _get_entry_device_model(mode),
         }
         
-        # Update time sensors are configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-        self._attr_should_poll = False
-
-    @property
-    def native_value(self):
-        """Return the configured update time."""
-        if self._time_number == 1:
-            return self._coordinator.update_time_1
-        elif self._time_number == 2:
-            return self._coordinator.update_time_2
-        return self._coordinator.update_time_3
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
+    def native_value(self) -> float | None:
+        """Return the duration of the last refresh."""
+        traces = getattr(self.coordinator, "refresh_traces", None)
+        last = getattr(traces, "last", None)
+        if last is None:
+            return None
+        return last.as_dict()["total_ms"]
 
     @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:clock-time-four-outline"
-
-
-class MeteocatAltitudeSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
-    """Sensor showing station altitude.
-    
-    Data obtained from coordinator.data['station'] which is cached in entry.data.
-    Cached data prevents unnecessary API calls on Home Assistant restart.
-    """
-
-    _attr_attribution = ATTRIBUTION
-    _attr_device_class = SensorDeviceClass.DISTANCE
-    _attr_native_unit_of_measurement = "m"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        entity_name: str,
-        device_name: str,
-        station_code: str,
-    ) -> None:
-        """Initialize the altitude sensor."""
-        self._attr_available = True
-        super().__init__(coordinator)
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._station_code = station_code
-        self._entry = entry
-        
-        self._attr_unique_id = f"{entry.entry_id}_altitude"
-        self._attr_name = "Altitud"
-        
-        # Set explicit entity_id
-        base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
-        code_lower = station_code.lower()
-        self.entity_id = f"sensor.{base_name}_{code_lower}_altitude"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA",
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the last trace and the per-phase percentiles."""
+        traces = getattr(self.coordinator, "refresh_traces", None)
+        last = getattr(traces, "last", None)
+        if last is None:
+            return {}
+        return {
+            "last_refresh": last.as_dict(),
+            "refreshes": len(traces),
+            "phases": traces.summary(),
+            **self._stale_data_attributes(),
         }
-        
-        # Geographic sensors are configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_entity_registry_enabled_default = True
-
-    @property
-    def native_value(self) -> float | None:
-        # Prefer fresh data from coordinator.data
-        station_data = self.coordinator.data.get("station")
-        if station_data and isinstance(station_data, dict):
-            alt = station_data.get("altitud")
-            if alt is not None:
-                return alt
-        
-        # Fallback to cached entry.data if coordinator.data empty (quota exhausted)
-        station_data = self._entry.data.get("_station_data")
-        if station_data and isinstance(station_data, dict):
-            return station_data.get("altitud")
-        
-        return None
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        # Configuration sensors are always available
         return True
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        return "mdi:elevation-rise"
+        return "mdi:timer-outline"
 
 
-class MeteocatLatitudeSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
-    """Sensor showing station latitude.
-    
-    Data obtained from coordinator.data['station'] which is cached in entry.data.
-    Cached data prevents unnecessary API calls on Home Assistant restart.
-    """
+class MeteocatUpdateTimeSensor(SensorEntity):
+    """Sensor showing configured update time."""
 
     _attr_attribution = ATTRIBUTION
-    _attr_native_unit_of_measurement = "\u00b0"
 
     def __init__(
         self,
@@ -1207,149 +1560,86 @@ class MeteocatLatitudeSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntit
         entry: ConfigEntry,
         entity_name: str,
         device_name: str,
-        station_code: str,
+        mode: str,
+        time_number: int,  # 1 or 2
+        station_code: str | None = None,
     ) -> None:
-        """Initialize the latitude sensor."""
+        """Initialize the update time sensor."""
         self._attr_available = True
-        super().__init__(coordinator)
+        # Do not inherit from CoordinatorEntity to keep it always available
         
+        self._coordinator = coordinator  # Keep reference for helper property
         self._entity_name = entity_name
         self._device_name = device_name
+        self._mode = mode
         self._station_code = station_code
-        self._entry = entry
+        self._time_number = time_number
         
-        self._attr_unique_id = f"{entry.entry_id}_latitude"
+        self._attr_unique_id = f"{entry.entry_id}_update_time_{time_number}"
         self._attr_has_entity_name = True
-        self._attr_translation_key = "latitude"
+        self._attr_translation_key = "update_time"
+        self._attr_translation_placeholders = {"number": str(time_number)}
         
-        # Set explicit entity_id
-        base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
-        code_lower = station_code.lower()
-        self.entity_id = f"sensor.{base_name}_{code_lower}_latitude"
+        # Set explicit entity_id based on mode
+        if mode == MODE_EXTERNAL and station_code:
+            base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
+            code_lower = station_code.lower()
+            self.entity_id = f"sensor.{base_name}_{code_lower}_update_time_{time_number}"
+        else:
+            base_name = entity_name.lower().replace(" ", "_")
+            self.entity_id = f"sensor.{base_name}_update_time_{time_number}"
         
+        # Each entry is a separate device under a shared hub
+        hub_id = f"{DOMAIN}_hub_external" if mode == MODE_EXTERNAL else f"{DOMAIN}_hub_local"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": self._device_name,
             "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA",
-        }
-        
-        # Geographic sensors are configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the station latitude in degrees."""
-        # Prefer fresh data from coordinator.data
-        station_data = self.coordinator.data.get("station")
-        if station_data and isinstance(station_data, dict):
-            coordenades = station_data.get("coordenades", {})
-            lat = coordenades.get("latitud")
-            if lat is not None:
-                return lat
-        
-        # Fallback to cached entry.data if coordinator.data empty (quota exhausted)
-        station_data = self._entry.data.get("_station_data")
-        if station_data and isinstance(station_data, dict):
-            coordenades = station_data.get("coordenades", {})
-            return coordenades.get("latitud")
-        
-        return None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:latitude"
+            "model": _get_entry_device_model(mode),
 
-
-class MeteocatLongitudeSensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
-    """Sensor showing station longitude.
-    
-    Data obtained from coordinator.data['station'] which is cached in entry.data.
-    Cached data prevents unnecessary API calls on Home Assistant restart.
-    """
-
-    _attr_attribution = ATTRIBUTION
-    _attr_native_unit_of_measurement = "\u00b0"
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        entity_name: str,
-        device_name: str,
-        station_code: str,
-    ) -> None:
-        """Initialize the longitude sensor."""
-        self._attr_available = True
-        super().__init__(coordinator)
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._station_code = station_code
-        self._entry = entry
-        
-        self._attr_unique_id = f"{entry.entry_id}_longitude"
-        self._attr_has_entity_name = True
-        self._attr_translation_key = "longitude"
-        
-        # Set explicit entity_id
-        base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
-        code_lower = station_code.lower()
-        self.entity_id = f"sensor.{base_name}_{code_lower}_longitude"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA",
         }
         
-        # Geographic sensors are configuration information
+        # Update time sensors are configuration information
         # self._attr_entity_category = EntityCategory.CONFIG
         self._attr_entity_registry_enabled_default = True
         self._attr_available = True
+        self._attr_should_poll = False
 
     @property
-    def native_value(self) -> float | None:
-        """Return the station longitude in degrees."""
-        # Prefer fresh data from coordinator.data
-        station_data = self.coordinator.data.get("station")
-        if station_data and isinstance(station_data, dict):
-            coordenades = station_data.get("coordenades", {})
-            lon = coordenades.get("longitud")
-            if lon is not None:
-                return lon
-        
-        # Fallback to cached entry.data if coordinator.data empty (quota exhausted)
-        station_data = self._entry.data.get("_station_data")
-        if station_data and isinstance(station_data, dict):
-            coordenades = station_data.get("coordenades", {})
-            return coordenades.get("longitud")
-        
-        return None
+    def native_value(self):
+        """Return the configured update time."""
+        if self._time_number == 1:
+            return self._coordinator.update_time_1
+        elif self._time_number == 2:
+            return self._coordinator.update_time_2
+        return self._coordinator.update_time_3
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        # Configuration sensors are always available
         return True
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        return "mdi:longitude"
+        return "mdi:clock-time-four-outline"
 
 
-class MeteocatMunicipalityNameSensor(SensorEntity):
-    """Sensor showing municipality name.
+class MeteocatLocationSensor(SensorEntity):
+    """Location of the station or municipality (altitude, coordinates, names).
     
-    Data obtained from configuration (entry.data) - no API calls needed.
+    The value is resolved once at construction from the station metadata
+    (cached in entry.data) or the configuration, so the entity neither polls
+    nor listens to the coordinator and its state is written once when added.
+    Station metadata not cached yet is the only exception: the sensor listens
+    to the coordinator until the first update brings it.
     """
 
+    entity_description: MeteocatLocationSensorEntityDescription
+
     _attr_attribution = ATTRIBUTION
+    _attr_available = True
+    _attr_should_poll = False
 
     def __init__(
         self,
@@ -1357,547 +1647,142 @@ class MeteocatMunicipalityNameSensor(SensorEntity):
         entry: ConfigEntry,
         entity_name: str,
         device_name: str,
-        municipality_code: str,
+        code: str,
+        description: MeteocatLocationSensorEntityDescription,
     ) -> None:
-        """Initialize the municipality name sensor."""
-        self._attr_available = True
-        # Do NOT call super().__init__(coordinator) to avoid linkage to API status
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._municipality_code = municipality_code
-        self._municipality_name = entry.data.get(CONF_MUNICIPALITY_NAME, "")
+        """Initialize the sensor."""
+        # Do NOT link to the coordinator: location sensors stay available on API errors
+        self.coordinator = coordinator
+        self._entry = entry
+        self.entity_description = description
+        self._remove_listener: Callable[[], None] | None = None
         
-        self._attr_unique_id = f"{entry.entry_id}_municipality_name"
-        self._attr_name = "Municipi"
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         
         # Set explicit entity_id
-        base_name = entity_name.lower().replace(" ", "_")
-        self.entity_id = f"sensor.{base_name}_municipality_name"
+        if description.station:
+            base_name = entity_name.replace(f" {code}", "").lower().replace(" ", "_")
+            object_id = description.key.removeprefix("station_")
+            self.entity_id = f"sensor.{base_name}_{code.lower()}_{object_id}"
+        else:
+            base_name = entity_name.lower().replace(" ", "_")
+            self.entity_id = f"sensor.{base_name}_{description.key}"
         
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
+            "name": device_name,
             "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Predicci\u00f3 Municipi",
+            "model": "Estaci\u00f3 XEMA" if description.station else "Predicci\u00f3 Municipi",
         }
         
-        # Municipality name is configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-        self._attr_should_poll = False
+        self._attr_native_value = self._resolve_value()
+
+    def _resolve_value(self) -> Any:
+        """Return the value from the station metadata or the entry data."""
+        description = self.entity_description
+        if description.data_key is not None:
+            return self._entry.data.get(description.data_key, description.default)
+        
+        # Prefer fresh data from coordinator.data, fall back to the cache in
+        # entry.data if coordinator.data is empty (quota exhausted)
+        data = self.coordinator.data
+        for station_data in (
+            data.get("station") if isinstance(data, dict) else None,
+            self._entry.data.get("_station_data"),
+        ):
+            value = station_data
+            for key in description.station_path:
+                value = value.get(key) if isinstance(value, dict) else None
+            if value is not None:
+                return value
+        return None
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the municipality name."""
-        return self._municipality_name
+    async def async_added_to_hass(self) -> None:
+        """Listen to the coordinator only while the station metadata is missing."""
+        await super().async_added_to_hass()
+        if self._attr_native_value is None and self.entity_description.station_path is not None:
+            self._remove_listener = self.coordinator.async_add_listener(self._handle_coordinator_update)
+            self.async_on_remove(self._async_remove_listener)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # Configuration sensors are always available
-        return True
+    @callback
+    def _async_remove_listener(self) -> None:
+        """Stop listening to the coordinator."""
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:city"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the value once the station metadata has been fetched."""
+        self._attr_native_value = self._resolve_value()
+        if self._attr_native_value is not None:
+            self._async_remove_listener()
+            self.async_write_ha_state()
 
 
-class MeteocatComarcaNameSensor(SensorEntity):
-    """Sensor showing comarca name.
-    
-    Data obtained from configuration (entry.data) - no API calls needed.
-    """
+class MeteocatEstimatedDaysRemainingSensor(MeteocatQuotaSensor):
+    """Sensor showing estimated days remaining for a plan."""
 
-    _attr_attribution = ATTRIBUTION
+    _attr_icon = "mdi:calendar-clock"
+    _attr_native_unit_of_measurement = "dies"
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(
         self,
         coordinator: MeteocatCoordinator,
         entry: ConfigEntry,
+        plan_data: dict[str, Any],
         entity_name: str,
         device_name: str,
-        municipality_code: str,
+        mode: str,
+        station_code: str | None = None,
     ) -> None:
-        """Initialize the comarca name sensor."""
-        self._attr_available = True
-        # Do NOT call super().__init__(coordinator) to avoid linkage to API status
+        """Initialize the estimated days remaining sensor."""
+        super().__init__(coordinator, entry, plan_data, entity_name, device_name, mode, station_code)
         
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._municipality_code = municipality_code
-        self._comarca_name = entry.data.get(CONF_COMARCA_NAME, "")
+        display_name, plan_id = self._normalize_plan_name(self._plan_name)
+        self._attr_unique_id = f"{entry.entry_id}_quota_dies_estimats_{plan_id}"
+        self._attr_name = f"Dies disponibles {display_name}"
         
-        self._attr_unique_id = f"{entry.entry_id}_comarca_name"
-        self._attr_name = "Comarca"
-        
-        # Set explicit entity_id
-        base_name = entity_name.lower().replace(" ", "_")
-        self.entity_id = f"sensor.{base_name}_comarca_name"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Predicci\u00f3 Municipi",
-        }
-        
-        # Comarca name is configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-        self._attr_should_poll = False
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the comarca name."""
-        return self._comarca_name
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # Configuration sensors are always available
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:map"
-
-
-class MeteocatMunicipalityLatitudeSensor(SensorEntity):
-    """Sensor showing municipality latitude.
-    
-    Data obtained from configuration (entry.data) - no API calls needed.
-    Only created if latitude data is available from API during setup.
-    """
-
-    _attr_attribution = ATTRIBUTION
-    _attr_native_unit_of_measurement = "\u00b0"
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        entity_name: str,
-        device_name: str,
-        municipality_code: str,
-    ) -> None:
-        """Initialize the municipality latitude sensor."""
-        self._attr_available = True
-        # Do NOT call super().__init__(coordinator) to avoid linkage to API status
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._municipality_code = municipality_code
-        self._latitude = entry.data.get("municipality_lat")
-        
-        self._attr_unique_id = f"{entry.entry_id}_municipality_latitude"
-        self._attr_has_entity_name = True
-        self._attr_translation_key = "latitude"
-        
-        # Set explicit entity_id
-        base_name = entity_name.lower().replace(" ", "_")
-        self.entity_id = f"sensor.{base_name}_municipality_latitude"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Predicci\u00f3 Municipi",
-        }
-        
-        # Municipality sensors provide location information
-        # self._attr_entity_category = EntityCategory.CONFIG  # Removed to show in sensors group
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the municipality latitude."""
-        return self._latitude
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # Configuration sensors are always available
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:latitude"
-
-
-class MeteocatMunicipalityLongitudeSensor(SensorEntity):
-    """Sensor showing municipality longitude.
-    
-    Data obtained from configuration (entry.data) - no API calls needed.
-    Only created if longitude data is available from API during setup.
-    """
-
-    _attr_attribution = ATTRIBUTION
-    _attr_native_unit_of_measurement = "\u00b0"
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        entity_name: str,
-        device_name: str,
-        municipality_code: str,
-    ) -> None:
-        """Initialize the municipality longitude sensor."""
-        self._attr_available = True
-        # Do NOT call super().__init__(coordinator) to avoid linkage to API status
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._municipality_code = municipality_code
-        self._longitude = entry.data.get("municipality_lon")
-        
-        self._attr_unique_id = f"{entry.entry_id}_municipality_longitude"
-        self._attr_has_entity_name = True
-        self._attr_translation_key = "longitude"
-        
-        # Set explicit entity_id
-        base_name = entity_name.lower().replace(" ", "_")
-        self.entity_id = f"sensor.{base_name}_municipality_longitude"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Predicci\u00f3 Municipi",
-        }
-        
-        # Municipality sensors provide location information
-        # self._attr_entity_category = EntityCategory.CONFIG  # Removed to show in sensors group
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the municipality longitude."""
-        return self._longitude
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # Configuration sensors are always available
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:longitude"
-
-
-class MeteocatProvinciaNameSensor(SensorEntity):
-    """Sensor showing province name.
-    
-    Data obtained from configuration (entry.data) - no API calls needed.
-    Only created if province data is available from API during setup.
-    """
-
-    _attr_attribution = ATTRIBUTION
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        entity_name: str,
-        device_name: str,
-        municipality_code: str,
-    ) -> None:
-        """Initialize the provincia name sensor."""
-        self._attr_available = True
-        # Do NOT call super().__init__(coordinator) to avoid linkage to API status
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._municipality_code = municipality_code
-        self._provincia_name = entry.data.get("provincia_name", "")
-        
-        self._attr_unique_id = f"{entry.entry_id}_provincia_name"
-        self._attr_name = "Prov\u00edncia"
-        
-        # Set explicit entity_id
-        base_name = entity_name.lower().replace(" ", "_")
-        self.entity_id = f"sensor.{base_name}_provincia_name"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Predicci\u00f3 Municipi",
-        }
-        
-        # Provincia name is configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-        self._attr_should_poll = False
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the provincia name."""
-        return self._provincia_name
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:map-marker-radius"
-
-
-class MeteocatStationComarcaNameSensor(SensorEntity):
-    """Sensor showing comarca name for a station.
-    
-    Data obtained from configuration (entry.data) - no API calls needed.
-    Always available for stations.
-    """
-
-    _attr_attribution = ATTRIBUTION
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        entity_name: str,
-        device_name: str,
-        station_code: str,
-    ) -> None:
-        """Initialize the station comarca name sensor."""
-        self._attr_available = True
-        # Do NOT call super().__init__(coordinator) to avoid linkage to API status
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._station_code = station_code
-        self._comarca_name = entry.data.get(CONF_COMARCA_NAME, "")
-        
-        self._attr_unique_id = f"{entry.entry_id}_station_comarca_name"
-        self._attr_name = "Comarca"
-        
-        # Set explicit entity_id
-        base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
-        code_lower = station_code.lower()
-        self.entity_id = f"sensor.{base_name}_{code_lower}_comarca_name"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA",
-        }
-        
-        # Geographic sensors are configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-        self._attr_should_poll = False
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the comarca name."""
-        return self._comarca_name
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # Configuration sensors are always available
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:map"
-
-
-class MeteocatStationMunicipalityNameSensor(SensorEntity):
-    """Sensor showing municipality name for a station.
-    
-    Data obtained from configuration (entry.data) - no API calls needed.
-    Only created if municipality data is available from API during setup.
-    """
-
-    _attr_attribution = ATTRIBUTION
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        entity_name: str,
-        device_name: str,
-        station_code: str,
-    ) -> None:
-        """Initialize the station municipality name sensor."""
-         # Do NOT call super().__init__(coordinator) to avoid linkage to API status
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._station_code = station_code
-        self._municipality_name = entry.data.get("station_municipality_name", "")
-        
-        self._attr_unique_id = f"{entry.entry_id}_station_municipality_name"
-        self._attr_name = "Municipi"
-        
-        # Set explicit entity_id
-        base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
-        code_lower = station_code.lower()
-        self.entity_id = f"sensor.{base_name}_{code_lower}_municipality_name"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA",
-        }
-        
-        # Geographic sensors are configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_entity_registry_enabled_default = True
-        self._attr_available = True
-        self._attr_should_poll = False
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the municipality name."""
-        return self._municipality_name
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # Configuration sensors are always available
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:city"
-
-
-class MeteocatStationProvinciaNameSensor(SensorEntity):
-    """Sensor showing province name for a station.
-    
-    Data obtained from configuration (entry.data) - no API calls needed.
-    Only created if province data is available from API during setup.
-    """
-
-    _attr_attribution = ATTRIBUTION
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        entity_name: str,
-        device_name: str,
-        station_code: str,
-    ) -> None:
-        """Initialize the station provincia name sensor."""
-         # Do NOT call super().__init__(coordinator) to avoid linkage to API status
-        
-        self._entity_name = entity_name
-        self._device_name = device_name
-        self._station_code = station_code
-        self._provincia_name = entry.data.get("station_provincia_name", "")
-        
-        self._attr_unique_id = f"{entry.entry_id}_station_provincia_name"
-        self._attr_name = "Prov\u00edncia"
-        
-        # Set explicit entity_id
-        base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
-        code_lower = station_code.lower()
-        self.entity_id = f"sensor.{base_name}_{code_lower}_provincia_name"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": self._device_name,
-            "manufacturer": "Meteocat Edici\u00f3 Comunit\u00e0ria",
-            "model": "Estaci\u00f3 XEMA",
-        }
-        
-        # Geographic sensors are configuration information
-        # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_available = True
-        self._attr_entity_registry_enabled_default = True
-        self._attr_should_poll = False
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the provincia name."""
-        return self._provincia_name
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # Configuration sensors are always available
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:map-marker-radius"
-
-
-
-
-class MeteocatEstimatedDaysRemainingSensor(MeteocatQuotaSensor):
-    """Sensor showing estimated days remaining for a plan."""
-
-    _attr_icon = "mdi:calendar-clock"
-    _attr_native_unit_of_measurement = "dies"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        coordinator: MeteocatCoordinator,
-        entry: ConfigEntry,
-        plan_data: dict[str, Any],
-        entity_name: str,
-        device_name: str,
-        mode: str,
-        station_code: str | None = None,
-    ) -> None:
-        """Initialize the estimated days remaining sensor."""
-        super().__init__(coordinator, entry, plan_data, entity_name, device_name, mode, station_code)
-        
-        display_name, plan_id = self._normalize_plan_name(self._plan_name)
-        self._attr_unique_id = f"{entry.entry_id}_quota_dies_estimats_{plan_id}"
-        self._attr_name = f"Dies disponibles {display_name}"
-        
-        if mode == MODE_EXTERNAL and station_code:
-            base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
-            code_lower = station_code.lower()
-            self.entity_id = f"sensor.{base_name}_{code_lower}_quota_dies_estimats_{plan_id}"
-        else:
-            base_name = entity_name.lower().replace(" ", "_")
-            self.entity_id = f"sensor.{base_name}_quota_dies_estimats_{plan_id}"
-
-    def _get_daily_consumption(self) -> int:
-        """Calculate estimated daily consumption."""
-        # Calculate updates per day based on configuration
-        updates_per_day = 0
-        if self.coordinator.update_time_1:
-            updates_per_day += 1
-        if self.coordinator.update_time_2:
-            updates_per_day += 1
-        if self.coordinator.update_time_3:
-            updates_per_day += 1
-            
-        calls_per_update = 0
-        plan_name_lower = self._plan_name.lower()
+        if mode == MODE_EXTERNAL and station_code:
+            base_name = entity_name.replace(f" {station_code}", "").lower().replace(" ", "_")
+            code_lower = station_code.lower()
+            self.entity_id = f"sensor.{base_name}_{code_lower}_quota_dies_estimats_{plan_id}"
+        else:
+            base_name = entity_name.lower().replace(" ", "_")
+            self.entity_id = f"sensor.{base_name}_quota_dies_estimats_{plan_id}"
+
+    def _get_daily_consumption(self) -> int:
+        """Calculate estimated daily consumption."""
+        # Calculate updates per day based on configuration
+        updates_per_day = 0
+        planned_times = getattr(self.coordinator, "planned_forecast_times", None)
+        if getattr(self.coordinator, "quota_planner", False) is True and isinstance(planned_times, list):
+            # Quota planner active: use the planned schedule
+            updates_per_day = len(planned_times)
+        else:
+            if self.coordinator.update_time_1:
+                updates_per_day += 1
+            if self.coordinator.update_time_2:
+                updates_per_day += 1
+            if self.coordinator.update_time_3:
+                updates_per_day += 1
+            
+        calls_per_update = 0
+        plan_name_lower = self._plan_name.lower()
         
         if "xema" in plan_name_lower:
+            if self._mode == MODE_MULTI:
+                # One call per variable on every measurement update
+                interval = getattr(self.coordinator, "planned_measurement_interval", None)
+                if getattr(self.coordinator, "quota_planner", False) is not True or not isinstance(interval, int):
+                    interval = 1
+                return math.ceil(24 / interval) * len(XEMA_VARIABLES)
             if self._mode == MODE_EXTERNAL:
                 calls_per_update = 1
+                interval = getattr(self.coordinator, "planned_measurement_interval", None)
+                if getattr(self.coordinator, "quota_planner", False) is True and isinstance(interval, int):
+                    return math.ceil(24 / interval)
         elif "predicci" in plan_name_lower:
             if self.coordinator.enable_forecast_daily:
                 calls_per_update += 1
@@ -1911,15 +1796,8 @@ class MeteocatEstimatedDaysRemainingSensor(MeteocatQuotaSensor):
     @property
     def native_value(self) -> float | None:
         """Return the estimated days remaining."""
-        available = None
-        if self.coordinator.data and self.coordinator.data.get("quotes"):
-            quotes = self.coordinator.data["quotes"]
-            if isinstance(quotes, dict) and "plans" in quotes:
-                for plan in quotes.get("plans", []):
-                    if plan.get("nom") == self._plan_name:
-                        available = plan.get("consultesRestants")
-                        break
-        
+        plan = self._get_plan()
+        available = plan.get("consultesRestants") if plan is not None else None
         if available is None:
             return None
             
@@ -1943,7 +1821,7 @@ class MeteocatEstimatedDaysRemainingSensor(MeteocatQuotaSensor):
         return "mdi:calendar-clock"
 
 
-class MeteocatUTCISensor(CoordinatorEntity[MeteocatCoordinator], SensorEntity):
+class MeteocatUTCISensor(MeteocatStaleDataMixin, CoordinatorEntity[MeteocatCoordinator], SensorEntity):
     """UTCI Sensor (Universal Thermal Climate Index)."""
     
     _attr_has_entity_name = True
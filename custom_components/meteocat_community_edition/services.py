@@ -0,0 +1,98 @@
+"""Services for Meteocat (Community Edition).
+
+The full forecast and quota plans are not kept in the recorder (unrecorded
+attributes). These services return them on demand, read from the last
+update of the entry. An hourly forecast request counts as demand, like the
+weather entity, so on-demand entries fetch it once per forecast slot.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_FORECAST_TYPE,
+    DOMAIN,
+    SERVICE_GET_FORECAST,
+    SERVICE_GET_QUOTES,
+)
+from .utils import convert_forecast_daily, convert_forecast_hourly
+
+if TYPE_CHECKING:
+    from .coordinator import MeteocatCoordinator
+
+GET_FORECAST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FORECAST_TYPE, default="daily"): vol.In(["daily", "hourly"]),
+    }
+)
+GET_QUOTES_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> MeteocatCoordinator:
+    """Return the coordinator of the entry the call is for."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if coordinator is None:
+        raise ServiceValidationError(f"Meteocat entry {entry_id} is not loaded")
+    return coordinator
+
+
+def _fetched_at(coordinator: MeteocatCoordinator) -> str | None:
+    """Return when the data served was fetched."""
+    if coordinator.last_successful_update_time is None:
+        return None
+    return coordinator.last_successful_update_time.isoformat()
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def _async_get_forecast(call: ServiceCall) -> ServiceResponse:
+        """Return the forecast of an entry in HA format."""
+        coordinator = _get_coordinator(hass, call)
+        if call.data[ATTR_FORECAST_TYPE] == "hourly":
+            # Fetches the forecast right away if demand resumes after an idle period
+            await coordinator.async_request_hourly_forecast()
+        data = coordinator.data or {}
+        if call.data[ATTR_FORECAST_TYPE] == "hourly":
+            forecast = convert_forecast_hourly(data.get("forecast_hourly"))
+        else:
+            forecast = convert_forecast_daily(data.get("forecast"))
+        return {"forecast": forecast, "fetched_at": _fetched_at(coordinator)}
+
+    async def _async_get_quotes(call: ServiceCall) -> ServiceResponse:
+        """Return the quota plans of an entry."""
+        coordinator = _get_coordinator(hass, call)
+        quotes = (coordinator.data or {}).get("quotes")
+        plans = quotes.get("plans", []) if isinstance(quotes, dict) else []
+        return {"plans": plans, "fetched_at": _fetched_at(coordinator)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FORECAST,
+        _async_get_forecast,
+        schema=GET_FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_QUOTES,
+        _async_get_quotes,
+        schema=GET_QUOTES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
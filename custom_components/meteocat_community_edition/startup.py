@@ -0,0 +1,58 @@
+"""Deferred first refresh for Meteocat (Community Edition).
+
+With the deferred startup option, entries are set up from the data saved
+by their last refresh and their first network refresh is queued. Once Home
+Assistant has started, the queued refreshes of every entry run as one job
+with bounded concurrency, so startup never waits for api.meteo.cat.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.start import async_at_started
+
+from .const import DOMAIN, STARTUP_QUEUE, STARTUP_REFRESH_CONCURRENCY
+
+if TYPE_CHECKING:
+    from .coordinator import MeteocatCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_defer_first_refresh(hass: HomeAssistant, coordinator: MeteocatCoordinator) -> None:
+    """Queue the first refresh of an entry until Home Assistant has started."""
+    queue: list[MeteocatCoordinator] | None = hass.data.get(STARTUP_QUEUE)
+    if queue is None:
+        queue = hass.data[STARTUP_QUEUE] = []
+
+        async def _async_started(hass: HomeAssistant) -> None:
+            await async_run_deferred_refreshes(hass, hass.data.pop(STARTUP_QUEUE, []))
+
+        async_at_started(hass, _async_started)
+    queue.append(coordinator)
+
+
+async def async_run_deferred_refreshes(
+    hass: HomeAssistant, coordinators: list[MeteocatCoordinator]
+) -> None:
+    """Run the queued first refreshes, a few entries at a time.
+
+    Each entry schedules its next updates once its first refresh is done,
+    exactly as after a normal first refresh.
+    """
+    semaphore = asyncio.Semaphore(STARTUP_REFRESH_CONCURRENCY)
+
+    async def _async_refresh(coordinator: MeteocatCoordinator) -> None:
+        async with semaphore:
+            # Skip entries unloaded while waiting
+            if hass.data.get(DOMAIN, {}).get(coordinator.entry.entry_id) is not coordinator:
+                return
+            await coordinator.async_refresh()
+            coordinator._schedule_next_update()
+
+    _LOGGER.debug("Running %d deferred first refreshes", len(coordinators))
+    await asyncio.gather(*(_async_refresh(coordinator) for coordinator in coordinators))
@@ -0,0 +1,138 @@
+"""Long-term statistics for Meteocat (Community Edition).
+
+Readings that were never shown as a sensor state (because Home Assistant
+was down or a refresh failed) are imported as hourly external statistics,
+so the gap is filled in the history and statistics graphs.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime
+import logging
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfPrecipitationDepth,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+)
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, XEMA_VARIABLES
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:
+    # Older Home Assistant versions only know has_mean
+    StatisticMeanType = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Units of the variables imported as statistics.
+# Wind direction (31) is left out: an arithmetic mean of angles is meaningless.
+STATISTIC_UNITS: dict[int, str] = {
+    32: UnitOfTemperature.CELSIUS,
+    33: PERCENTAGE,
+    34: UnitOfPressure.HPA,
+    30: UnitOfSpeed.METERS_PER_SECOND,
+    35: UnitOfPrecipitationDepth.MILLIMETERS,
+    36: "W/m²",
+}
+
+_VARIABLE_KEYS = {code: key for key, code in XEMA_VARIABLES.items()}
+
+
+def get_statistic_id(station_code: str, variable_code: int) -> str | None:
+    """Return the external statistic id for a station variable."""
+    key = _VARIABLE_KEYS.get(variable_code)
+    if key is None or not station_code:
+        return None
+    return f"{DOMAIN}:{station_code.lower()}_{key}"
+
+
+def dedupe_readings(readings: list[tuple[datetime, float]]) -> list[tuple[datetime, float]]:
+    """Return the readings sorted by time, one per timestamp.
+
+    A timestamp seen twice (a reading present in two payloads, or corrected
+    by Meteocat) keeps its last value, so it is not counted twice in a mean.
+    """
+    return sorted(dict(readings).items())
+
+
+def aggregate_hourly(readings: list[tuple[datetime, float]]) -> list[StatisticData]:
+    """Aggregate timestamped readings into hourly mean/min/max statistics."""
+    hours: dict[datetime, list[float]] = {}
+    for timestamp, value in dedupe_readings(readings):
+        hour_start = timestamp.replace(minute=0, second=0, microsecond=0)
+        hours.setdefault(hour_start, []).append(value)
+
+    return [
+        StatisticData(
+            start=hour_start,
+            mean=sum(values) / len(values),
+            min=min(values),
+            max=max(values),
+        )
+        for hour_start, values in sorted(hours.items())
+    ]
+
+
+def async_import_readings(
+    hass: HomeAssistant,
+    station_code: str,
+    station_name: str,
+    readings: dict[int, list[tuple[datetime, float]]],
+    since: datetime | None = None,
+) -> int:
+    """Import the hours containing readings newer than ``since``.
+
+    Every reading of an affected hour is used, so an hour that was only
+    partially imported before is completed. Importing the same hour again
+    overwrites it, which makes the import idempotent.
+
+    Readings go straight to the recorder as external statistics, never as
+    states: each station variable gets a single call holding all its hours.
+    Returns the number of hourly points imported.
+    """
+    if "recorder" not in hass.config.components:
+        return 0
+
+    imported = 0
+    for variable_code, values in readings.items():
+        unit = STATISTIC_UNITS.get(variable_code)
+        statistic_id = get_statistic_id(station_code, variable_code)
+        if unit is None or statistic_id is None:
+            continue
+
+        values = dedupe_readings(values)
+        if since is not None:
+            # Sorted readings: the hours from the one holding the first new reading are affected
+            first_new = bisect_right(values, since, key=lambda item: item[0])
+            if first_new == len(values):
+                continue
+            first_hour = values[first_new][0].replace(minute=0, second=0, microsecond=0)
+            values = [item for item in values if item[0] >= first_hour]
+
+        statistics = aggregate_hourly(values)
+        if not statistics:
+            continue
+
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{station_name} {_VARIABLE_KEYS[variable_code].replace('_', ' ')}",
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=unit,
+        )
+        if StatisticMeanType is not None:
+            metadata["mean_type"] = StatisticMeanType.ARITHMETIC
+
+        async_add_external_statistics(hass, metadata, statistics)
+        imported += len(statistics)
+
+    _LOGGER.debug("Imported %s hourly statistics for station %s", imported, station_code)
+    return imported
@@ -0,0 +1,109 @@
+"""Refresh timing instrumentation for Meteocat (Community Edition).
+
+Each coordinator refresh records how long every phase took (metadata
+lookups, API calls, validation, events, listener fan-out) using monotonic
+timers. The last traces are kept per entry and summarised as p50/p95 for
+the diagnostics sensor and the diagnostics download.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import math
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+
+class RefreshTrace:
+    """Phase durations of a single refresh."""
+
+    def __init__(self) -> None:
+        """Start the trace."""
+        self.started = dt_util.utcnow()
+        self.phases: dict[str, float] = {}
+        self.total: float | None = None
+        self.success: bool | None = None
+        self._start = time.monotonic()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase. Repeated phases are accumulated."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.monotonic() - start
+
+    def finish(self, success: bool) -> None:
+        """Stop the trace."""
+        self.total = time.monotonic() - self._start
+        self.success = success
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace in milliseconds."""
+        return {
+            "started": self.started.isoformat(),
+            "success": self.success,
+            "total_ms": _to_ms(self.total),
+            "phases_ms": {name: _to_ms(duration) for name, duration in self.phases.items()},
+        }
+
+
+class RefreshTraces:
+    """The last refresh traces of an entry."""
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize the buffer."""
+        self._traces: deque[RefreshTrace] = deque(maxlen=maxlen)
+
+    def __len__(self) -> int:
+        """Return the number of stored traces."""
+        return len(self._traces)
+
+    @property
+    def last(self) -> RefreshTrace | None:
+        """Return the most recent trace."""
+        return self._traces[-1] if self._traces else None
+
+    def append(self, trace: RefreshTrace) -> None:
+        """Store a finished trace."""
+        self._traces.append(trace)
+
+    def summary(self) -> dict[str, dict[str, float | None]]:
+        """Return p50/p95 (ms) of the total and of each phase."""
+        durations: dict[str, list[float]] = {"total": []}
+        for trace in self._traces:
+            if trace.total is not None:
+                durations["total"].append(trace.total)
+            for name, duration in trace.phases.items():
+                durations.setdefault(name, []).append(duration)
+        return {
+            name: {
+                "p50": _to_ms(_percentile(values, 50)),
+                "p95": _to_ms(_percentile(values, 95)),
+            }
+            for name, values in durations.items()
+        }
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the stored traces, oldest first."""
+        return [trace.as_dict() for trace in self._traces]
+
+
+def _percentile(values: list[float], percent: float) -> float | None:
+    """Return the nearest-rank percentile of the values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _to_ms(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    if seconds is None:
+        return None
+    return round(seconds * 1000, 1)
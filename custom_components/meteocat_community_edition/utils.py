@@ -1,8 +1,14 @@
 """Utility functions for Meteocat (Community Edition)."""
 from __future__ import annotations
 
+from datetime import datetime, time, timedelta, timezone
+import hashlib
+import json
 import logging
 import math
+from typing import Any
+
+from .const import METEOCAT_CONDITION_MAP
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -334,6 +340,108 @@ def get_utci_icon(utci_value: float) -> str:
     else:
         return "mdi:check-circle-outline"
 
+def calculate_dew_point(temp_c: float, humidity_percent: float) -> float:
+    """Return the dew point in Celsius (Magnus formula, Alduchov & Eskridge 1996)."""
+    humidity = min(100.0, max(1.0, humidity_percent))
+    gamma = math.log(humidity / 100) + 17.625 * temp_c / (243.04 + temp_c)
+    return round(243.04 * gamma / (17.625 - gamma), 1)
+
+
+def calculate_heat_index(temp_c: float, humidity_percent: float) -> float:
+    """Return the heat index in Celsius (NOAA: Steadman, then Rothfusz regression).
+
+    The index is only defined from 26.7 C (80 F); below it the air
+    temperature is returned.
+    """
+    if temp_c < 26.7:
+        return round(temp_c, 1)
+    temp_f = temp_c * 9 / 5 + 32
+    heat_index = 0.5 * (temp_f + 61.0 + (temp_f - 68.0) * 1.2 + humidity_percent * 0.094)
+    if (heat_index + temp_f) / 2 >= 80:
+        heat_index = (
+            -42.379
+            + 2.04901523 * temp_f
+            + 10.14333127 * humidity_percent
+            - 0.22475541 * temp_f * humidity_percent
+            - 0.00683783 * temp_f**2
+            - 0.05481717 * humidity_percent**2
+            + 0.00122874 * temp_f**2 * humidity_percent
+            + 0.00085282 * temp_f * humidity_percent**2
+            - 0.00000199 * temp_f**2 * humidity_percent**2
+        )
+        if humidity_percent < 13 and 80 <= temp_f <= 112:
+            heat_index -= (13 - humidity_percent) / 4 * math.sqrt((17 - abs(temp_f - 95)) / 17)
+        elif humidity_percent > 85 and 80 <= temp_f <= 87:
+            heat_index += (humidity_percent - 85) / 10 * (87 - temp_f) / 5
+    return round((heat_index - 32) * 5 / 9, 1)
+
+
+def calculate_wind_chill(temp_c: float, wind_speed_kmh: float) -> float:
+    """Return the wind chill in Celsius (JAG/TI 2001 formula).
+
+    The index is only defined up to 10 C with wind above 4.8 km/h; outside
+    that range the air temperature is returned.
+    """
+    if temp_c > 10 or wind_speed_kmh <= 4.8:
+        return round(temp_c, 1)
+    wind = wind_speed_kmh**0.16
+    return round(13.12 + 0.6215 * temp_c - 11.37 * wind + 0.3965 * temp_c * wind, 1)
+
+
+def calculate_absolute_humidity(temp_c: float, humidity_percent: float) -> float:
+    """Return the absolute humidity in g/m\u00b3."""
+    vapour_pressure = 6.112 * math.exp(17.67 * temp_c / (temp_c + 243.5)) * humidity_percent / 100
+    return round(216.74 * vapour_pressure / (273.15 + temp_c), 1)
+
+
+def calculate_derived_metrics(
+    temp_c: float | None, humidity_percent: float | None, wind_speed_kmh: float | None
+) -> dict[str, float]:
+    """Return every metric that can be derived from the inputs given.
+
+    The apparent temperature is the heat index in the heat (from 26.7 C),
+    the wind chill in the cold (up to 10 C) and the air temperature between.
+    """
+    metrics: dict[str, float] = {}
+    if temp_c is None:
+        return metrics
+    apparent = round(temp_c, 1)
+    if humidity_percent is not None:
+        metrics["dew_point"] = calculate_dew_point(temp_c, humidity_percent)
+        metrics["heat_index"] = calculate_heat_index(temp_c, humidity_percent)
+        metrics["absolute_humidity"] = calculate_absolute_humidity(temp_c, humidity_percent)
+        apparent = metrics["heat_index"]
+    if wind_speed_kmh is not None:
+        metrics["wind_chill"] = calculate_wind_chill(temp_c, wind_speed_kmh)
+        if temp_c <= 10:
+            apparent = metrics["wind_chill"]
+    metrics["apparent_temperature"] = apparent
+    return metrics
+
+
+def derive_station_metrics(variables: Any) -> dict[str, float]:
+    """Return the derived metrics of the latest readings of a XEMA station.
+
+    A single pass picks the latest temperature (32), humidity (33) and wind
+    speed (30, m/s) from the variables of the measurements payload.
+    """
+    latest: dict[int, float] = {}
+    for variable in variables or []:
+        if not isinstance(variable, dict) or variable.get("codi") not in (30, 32, 33):
+            continue
+        lectures = variable.get("lectures") or []
+        if not lectures:
+            continue
+        try:
+            latest[variable["codi"]] = float(lectures[-1].get("valor"))
+        except (TypeError, ValueError):
+            continue
+    wind_ms = latest.get(30)
+    return calculate_derived_metrics(
+        latest.get(32), latest.get(33), wind_ms * 3.6 if wind_ms is not None else None
+    )
+
+
 def get_beaufort_value(wind_speed_kmh: float) -> int:
     """Calculate Beaufort scale (0-12) from wind speed in km/h.
     
@@ -386,3 +494,627 @@ def get_beaufort_description_key(beaufort_value: int) -> str:
         "beaufort_11", # Tempesta
     ]
     return keys[beaufort_value]
+
+
+def get_update_offset(entry_id: str, window_minutes: int) -> int:
+    """Return a deterministic update offset in seconds for a config entry.
+
+    The offset is derived from a hash of the entry id, so each entry keeps
+    the same offset across restarts while different entries (and different
+    installations) spread their requests over the window.
+    """
+    window_seconds = max(0, int(window_minutes)) * 60
+    if window_seconds == 0:
+        return 0
+    digest = hashlib.sha256(str(entry_id).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % (window_seconds + 1)
+
+
+def get_quota_period_end(period: str | None, now: datetime) -> datetime:
+    """Return the moment the quota period containing ``now`` resets.
+
+    Meteocat plans report their period as free text (e.g. "mensual").
+    Daily and weekly periods are recognised, anything else is treated
+    as a calendar month, which is what every current plan uses.
+    """
+    period_lower = (period or "").lower()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if "dia" in period_lower or "diari" in period_lower:
+        return midnight + timedelta(days=1)
+    if "setman" in period_lower or "seman" in period_lower:
+        return midnight + timedelta(days=7 - now.weekday())
+
+    first_of_month = midnight.replace(day=1)
+    return (first_of_month + timedelta(days=32)).replace(day=1)
+
+
+def index_quota_plans(quotes: Any) -> dict[str, dict[str, Any]]:
+    """Return the plans of a quotes payload by name."""
+    if not isinstance(quotes, dict):
+        return {}
+    return {
+        plan["nom"]: plan
+        for plan in quotes.get("plans") or []
+        if isinstance(plan, dict) and "nom" in plan
+    }
+
+
+def calculate_update_plan(
+    plans: list[dict[str, Any]],
+    now: datetime,
+    entries_sharing_key: int = 1,
+    forecast_calls_per_update: int = 1,
+    fetch_measurements: bool = True,
+    measurement_calls_per_update: int = 1,
+    forecast_entries_sharing_key: int | None = None,
+) -> dict[str, Any]:
+    """Work out the densest update schedule that fits the remaining quota.
+
+    The remaining requests of each plan are spread evenly over the time left
+    in the quota period and shared among every entry using the same API key.
+    Forecasts are shared per municipality, so the Predicció plan can be
+    divided among the unique municipalities instead
+    (``forecast_entries_sharing_key``).
+
+    Returns a dict with:
+    - measurement_interval: hours between XEMA measurement updates (1-24)
+    - forecast_updates_per_day: forecast updates per day (1-24)
+    """
+    entries = max(1, entries_sharing_key)
+    remaining: dict[str, int | None] = {"xema": None, "prediccio": None, "quota": None}
+    period_end: datetime | None = None
+
+    for plan in plans:
+        if not isinstance(plan, dict):
+            continue
+        name = str(plan.get("nom", "")).lower()
+        if "xema" in name:
+            key = "xema"
+        elif "predicci" in name:
+            key = "prediccio"
+        elif "quota" in name:
+            key = "quota"
+        else:
+            continue
+        try:
+            remaining[key] = max(0, int(plan.get("consultesRestants", 0)))
+        except (TypeError, ValueError):
+            continue
+        plan_end = get_quota_period_end(plan.get("periode"), now)
+        if period_end is None or plan_end < period_end:
+            period_end = plan_end
+
+    if period_end is None:
+        period_end = get_quota_period_end(None, now)
+    hours_left = max(1.0, (period_end - now).total_seconds() / 3600)
+    days_left = hours_left / 24
+
+    def _per_entry(key: str) -> float | None:
+        value = remaining[key]
+        return None if value is None else value / entries
+
+    # Every update also queries the Quota plan, so it bounds both schedules.
+    quota_budget = _per_entry("quota")
+
+    measurement_interval = 1
+    if fetch_measurements:
+        xema_budget = _per_entry("xema")
+        if xema_budget is not None:
+            xema_budget /= max(1, measurement_calls_per_update)
+        budgets = [b for b in (xema_budget, quota_budget) if b is not None]
+        if budgets:
+            updates_left = min(budgets)
+            if updates_left <= 0:
+                measurement_interval = 24
+            else:
+                measurement_interval = math.ceil(hours_left / updates_left)
+        measurement_interval = max(1, min(24, measurement_interval))
+
+    forecast_updates_per_day = 24
+    forecast_budgets = []
+    prediccio_budget = remaining["prediccio"]
+    if prediccio_budget is not None:
+        prediccio_budget /= max(1, forecast_entries_sharing_key or entries)
+        forecast_budgets.append(prediccio_budget / max(1, forecast_calls_per_update))
+    if quota_budget is not None and not fetch_measurements:
+        forecast_budgets.append(quota_budget)
+    if forecast_budgets:
+        forecast_updates_per_day = math.floor(min(forecast_budgets) / days_left)
+    forecast_updates_per_day = max(1, min(24, forecast_updates_per_day))
+
+    return {
+        "measurement_interval": measurement_interval,
+        "forecast_updates_per_day": forecast_updates_per_day,
+    }
+
+
+def get_planned_update_times(anchor: str, updates_per_day: int) -> list[str]:
+    """Spread ``updates_per_day`` whole-hour update times evenly from ``anchor``."""
+    try:
+        anchor_time = time.fromisoformat(anchor)
+    except (TypeError, ValueError):
+        anchor_time = time(0, 0)
+
+    count = max(1, min(24, updates_per_day))
+    step = 24 / count
+    planned = {
+        f"{int(anchor_time.hour + round(index * step)) % 24:02d}:{anchor_time.minute:02d}"
+        for index in range(count)
+    }
+    return sorted(planned)
+
+
+def parse_reading_time(value: Any) -> datetime | None:
+    """Parse a XEMA reading timestamp (e.g. "2025-11-24T10:30Z") as UTC."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def extract_readings(measurements: Any) -> dict[int, list[tuple[datetime, float]]]:
+    """Return the timestamped numeric readings of each variable.
+
+    The measurements payload is the list returned by the XEMA station
+    endpoint. Readings without a valid timestamp or value are skipped and
+    each list is sorted by time.
+    """
+    readings: dict[int, list[tuple[datetime, float]]] = {}
+    if not measurements or not isinstance(measurements, list):
+        return readings
+
+    for station in measurements:
+        if not isinstance(station, dict):
+            continue
+        for variable in station.get("variables", []) or []:
+            try:
+                code = int(variable.get("codi"))
+            except (TypeError, ValueError):
+                continue
+            for reading in variable.get("lectures", []) or []:
+                timestamp = parse_reading_time(reading.get("data"))
+                if timestamp is None:
+                    continue
+                try:
+                    value = float(reading.get("valor"))
+                except (TypeError, ValueError):
+                    continue
+                readings.setdefault(code, []).append((timestamp, value))
+
+    for values in readings.values():
+        values.sort(key=lambda item: item[0])
+    return readings
+
+
+def merge_measurements(
+    previous: Any, current: Any, window_hours: float
+) -> Any:
+    """Merge two XEMA measurements payloads into a rolling window.
+
+    Readings are keyed by station, variable and timestamp, so payloads of
+    consecutive UTC days (or the same day fetched again) join seamlessly.
+    The current payload wins on duplicates and provides the station and
+    variable metadata. Readings older than ``window_hours`` before the newest
+    one are dropped. Readings without a valid timestamp are only kept from
+    the current payload.
+    """
+    if not isinstance(current, list):
+        return current
+    if not isinstance(previous, list):
+        previous = []
+
+    stations: dict[Any, dict[str, Any]] = {}
+    variables: dict[Any, dict[Any, dict[str, Any]]] = {}
+    lectures: dict[tuple[Any, Any], dict[Any, tuple[datetime | None, dict[str, Any]]]] = {}
+    for is_current, payload in ((False, previous), (True, current)):
+        for station in payload:
+            if not isinstance(station, dict):
+                continue
+            station_code = station.get("codi")
+            stations[station_code] = station
+            station_variables = variables.setdefault(station_code, {})
+            for variable in station.get("variables", []) or []:
+                if not isinstance(variable, dict):
+                    continue
+                variable_code = variable.get("codi")
+                station_variables[variable_code] = variable
+                readings = lectures.setdefault((station_code, variable_code), {})
+                for index, reading in enumerate(variable.get("lectures", []) or []):
+                    timestamp = parse_reading_time(reading.get("data"))
+                    if timestamp is None:
+                        if is_current:
+                            readings[(None, index)] = (None, reading)
+                        continue
+                    readings[timestamp] = (timestamp, reading)
+
+    timestamps = [
+        timestamp
+        for readings in lectures.values()
+        for timestamp, _ in readings.values()
+        if timestamp is not None
+    ]
+    cutoff = max(timestamps) - timedelta(hours=window_hours) if timestamps else None
+
+    merged = []
+    for station_code, station in stations.items():
+        merged_variables = []
+        for variable_code, variable in variables[station_code].items():
+            items = lectures[(station_code, variable_code)].values()
+            timed = sorted(
+                (item for item in items
+                 if item[0] is not None and (cutoff is None or item[0] > cutoff)),
+                key=lambda item: item[0],
+            )
+            # Untimed readings keep their order after the timed ones
+            untimed = [item for item in items if item[0] is None]
+            merged_variables.append(
+                {**variable, "lectures": [reading for _, reading in timed + untimed]}
+            )
+        merged.append({**station, "variables": merged_variables})
+    return merged
+
+
+def project_measurements(measurements: Any, variable_codes: Any) -> Any:
+    """Keep only the parts of a XEMA measurements payload the entities read.
+
+    Stations keep their code and the variables in ``variable_codes`` (every
+    variable when None), each with its code and readings; readings keep
+    their time and value. Fields such as ``estat`` or ``baseHoraria`` and
+    variables without an entity are dropped. Payloads that are not a list
+    are returned unchanged.
+    """
+    if not isinstance(measurements, list):
+        return measurements
+
+    codes = set(variable_codes) if variable_codes is not None else None
+    projected = []
+    for station in measurements:
+        if not isinstance(station, dict):
+            continue
+        variables = []
+        for variable in station.get("variables", []) or []:
+            if not isinstance(variable, dict):
+                continue
+            if codes is not None and variable.get("codi") not in codes:
+                continue
+            variables.append({
+                "codi": variable.get("codi"),
+                "lectures": [
+                    {"data": reading.get("data"), "valor": reading.get("valor")}
+                    for reading in variable.get("lectures", []) or []
+                    if isinstance(reading, dict)
+                ],
+            })
+        projected.append({"codi": station.get("codi"), "variables": variables})
+    return projected
+
+
+def build_variable_index(variables: Any) -> dict[int, dict[str, Any]]:
+    """Return the name, unit and decimals of each XEMA variable by code.
+
+    The payload is the list returned by the XEMA variables metadata
+    endpoint. Variables without a valid code are skipped.
+    """
+    index: dict[int, dict[str, Any]] = {}
+    if not isinstance(variables, list):
+        return index
+
+    for variable in variables:
+        if not isinstance(variable, dict):
+            continue
+        try:
+            code = int(variable.get("codi"))
+        except (TypeError, ValueError):
+            continue
+        decimals = variable.get("decimals")
+        index[code] = {
+            "codi": code,
+            "nom": variable.get("nom") or f"Variable {code}",
+            "unitat": variable.get("unitat") or None,
+            "decimals": decimals if isinstance(decimals, int) and not isinstance(decimals, bool) else None,
+        }
+    return index
+
+
+def project_forecast(forecast: Any, variable_names: Any) -> Any:
+    """Keep only the parts of a municipal forecast payload the entities read.
+
+    Days keep only the variables in ``variable_names``. Daily
+    variables keep their value, hourly ones their list of values (time,
+    value and code). Payloads without days are returned unchanged, so empty
+    or malformed forecasts are still reported as such.
+    """
+    if not isinstance(forecast, dict) or not isinstance(forecast.get("dies"), list):
+        return forecast
+
+    names = set(variable_names)
+    dies = []
+    for dia in forecast["dies"]:
+        if not isinstance(dia, dict):
+            continue
+        variables = {}
+        for name, variable in (dia.get("variables") or {}).items():
+            if name not in names or not isinstance(variable, dict):
+                continue
+            kept = {}
+            for key in ("valor", "valors", "codi"):
+                if key not in variable:
+                    continue
+                kept[key] = variable[key]
+                # Hourly values: some payloads list them under "valor"
+                if isinstance(variable[key], list):
+                    kept[key] = [
+                        {field: value[field] for field in ("data", "valor", "codi") if field in value}
+                        for value in variable[key]
+                        if isinstance(value, dict)
+                    ]
+            variables[name] = kept
+        if "variables" in dia:
+            dia = {**dia, "variables": variables}
+        dies.append(dia)
+    return {**forecast, "dies": dies}
+
+
+def convert_forecast_hourly(forecast_hourly: Any) -> list[dict[str, Any]]:
+    """Return an hourly forecast payload in HA format (up to 72 hours)."""
+    if not forecast_hourly:
+        return []
+
+    forecasts = []
+
+    dies = forecast_hourly.get("dies", [])
+    for dia in dies:
+        variables = dia.get("variables", {})
+
+        # Get hourly variables with their values arrays
+        temp_data = variables.get("temp", {})
+        estat_cel_data = variables.get("estatCel", {})
+        precip_data = variables.get("precipitacio", {})
+
+        temp_valors = temp_data.get("valors", [])
+        estat_valors = estat_cel_data.get("valors", [])
+        precip_valors = precip_data.get("valors", [])
+
+        # Build dictionaries by timestamp
+        temp_dict = {h.get("data"): h.get("valor") for h in temp_valors}
+        estat_dict = {h.get("data"): h.get("valor") for h in estat_valors}
+        precip_dict = {h.get("data"): h.get("valor") for h in precip_valors}
+
+        # Get all unique timestamps
+        all_times = set(temp_dict.keys()) | set(estat_dict.keys()) | set(precip_dict.keys())
+
+        for time_str in sorted(all_times):
+            if time_str:
+                forecast_item = {
+                    "datetime": time_str,
+                }
+
+                if time_str in temp_dict:
+                    try:
+                        forecast_item["temperature"] = float(temp_dict[time_str])
+                    except (ValueError, TypeError):
+                        pass
+
+                if time_str in estat_dict:
+                    condition = METEOCAT_CONDITION_MAP.get(estat_dict[time_str])
+                    if condition:
+                        forecast_item["condition"] = condition
+
+                if time_str in precip_dict:
+                    try:
+                        forecast_item["precipitation"] = float(precip_dict[time_str])
+                    except (ValueError, TypeError):
+                        pass
+
+                forecasts.append(forecast_item)
+
+    return forecasts[:72]  # Limit to 72 hours
+
+def convert_forecast_daily(forecast: Any) -> list[dict[str, Any]]:
+    """Return a daily forecast payload in HA format (up to 8 days)."""
+    if not forecast:
+        return []
+
+    forecasts = []
+
+    dies = forecast.get("dies", [])[:8]  # Limit to 8 days
+    for dia in dies:
+        data = dia.get("data")
+        if not data:
+            continue
+
+        variables = dia.get("variables", {})
+
+        forecast_item = {
+            "datetime": data,
+        }
+
+        # Temperature min/max (simple objects with valor)
+        tmin = variables.get("tmin", {})
+        if isinstance(tmin, dict):
+            valor = tmin.get("valor")
+            if valor is not None:
+                try:
+                    forecast_item["templow"] = float(valor)
+                except (ValueError, TypeError):
+                    pass
+
+        tmax = variables.get("tmax", {})
+        if isinstance(tmax, dict):
+            valor = tmax.get("valor")
+            if valor is not None:
+                try:
+                    forecast_item["temperature"] = float(valor)
+                except (ValueError, TypeError):
+                    pass
+
+        # Condition (simple object with valor)
+        estat_cel = variables.get("estatCel", {})
+        if isinstance(estat_cel, dict):
+            estat_code = estat_cel.get("valor")
+            if estat_code is not None:
+                condition = METEOCAT_CONDITION_MAP.get(estat_code)
+                if condition:
+                    forecast_item["condition"] = condition
+
+        # Precipitation (simple object with valor, percentage)
+        precip = variables.get("precipitacio", {})
+        if isinstance(precip, dict):
+            valor = precip.get("valor")
+            if valor is not None:
+                try:
+                    forecast_item["precipitation"] = float(valor)
+                except (ValueError, TypeError):
+                    pass
+
+        forecasts.append(forecast_item)
+
+    return forecasts
+
+
+def encode_forecast_columns(forecast: list[dict[str, Any]], max_bytes: int) -> dict[str, Any]:
+    """Encode a forecast in HA format as parallel arrays.
+
+    Each field becomes one array instead of a key repeated in every item.
+    Evenly spaced forecasts are described by their first time and step in
+    seconds, others keep an array of times. Conditions are indexes into the
+    ``conditions`` list. Items are dropped from the end until the JSON
+    encoding fits in ``max_bytes``, reported as ``size_bytes``.
+    """
+    count = len(forecast)
+    while True:
+        encoded = _encode_columns(forecast[:count])
+        encoded["size_bytes"] = 0
+        size = len(json.dumps(encoded, separators=(",", ":")))
+        # Count the digits of the size itself instead of the placeholder
+        size += len(str(size)) - 1
+        if size <= max_bytes or count == 0:
+            encoded["size_bytes"] = size
+            return encoded
+        # Jump close to the fitting length, then go item by item
+        count = min(count - 1, count * max_bytes // size)
+
+
+def _encode_columns(forecast: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the columns of a forecast in HA format."""
+    encoded: dict[str, Any] = {}
+    times = [item.get("datetime") for item in forecast]
+    parsed = [parse_reading_time(value) for value in times]
+    steps = {later - earlier for earlier, later in zip(parsed, parsed[1:])
+             if earlier is not None and later is not None}
+    if parsed and None not in parsed and len(steps) <= 1:
+        encoded["start"] = times[0]
+        encoded["step"] = int(steps.pop().total_seconds()) if steps else 0
+    else:
+        encoded["datetime"] = times
+
+    fields: list[str] = []
+    for item in forecast:
+        for key in item:
+            if key not in ("datetime", "condition") and key not in fields:
+                fields.append(key)
+    for field in fields:
+        encoded[field] = [item.get(field) for item in forecast]
+
+    conditions: list[str] = []
+    indexes: list[int | None] = []
+    for item in forecast:
+        condition = item.get("condition")
+        if condition is None:
+            indexes.append(None)
+            continue
+        if condition not in conditions:
+            conditions.append(condition)
+        indexes.append(conditions.index(condition))
+    if conditions:
+        encoded["condition"] = indexes
+        encoded["conditions"] = conditions
+    return encoded
+
+
+def get_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle (haversine) distance between two points in km."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 6371.0 * 2 * math.asin(math.sqrt(a))
+
+
+def is_station_operational(station: dict[str, Any]) -> bool:
+    """Return True if the XEMA metadata marks the station as operational.
+
+    Stations report a list of states ("estats"); code 2 is "Operativa" and
+    the current state has no end date. Stations without states are assumed
+    operational.
+    """
+    states = station.get("estats")
+    if not isinstance(states, list) or not states:
+        return True
+    return any(
+        isinstance(state, dict) and state.get("codi") == 2 and not state.get("dataFi")
+        for state in states
+    )
+
+
+def build_station_index(stations: Any) -> list[dict[str, Any]]:
+    """Return a compact index (code, name, coordinates) of operational stations."""
+    index = []
+    if not isinstance(stations, list):
+        return index
+    for station in stations:
+        if not isinstance(station, dict) or not is_station_operational(station):
+            continue
+        coordinates = station.get("coordenades") or {}
+        try:
+            latitude = float(coordinates["latitud"])
+            longitude = float(coordinates["longitud"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        index.append({
+            "codi": station.get("codi"),
+            "nom": station.get("nom"),
+            "lat": latitude,
+            "lon": longitude,
+        })
+    return index
+
+
+def nearest_stations(
+    index: list[dict[str, Any]],
+    latitude: float,
+    longitude: float,
+    limit: int,
+    max_distance_km: float,
+    exclude: str | None = None,
+) -> list[dict[str, Any]]:
+    """Return up to ``limit`` indexed stations within ``max_distance_km``, nearest first."""
+    candidates = []
+    for station in index:
+        if station.get("codi") == exclude:
+            continue
+        distance = get_distance_km(latitude, longitude, station["lat"], station["lon"])
+        if distance <= max_distance_km:
+            candidates.append({**station, "distance_km": round(distance, 1)})
+    candidates.sort(key=lambda station: station["distance_km"])
+    return candidates[:limit]
+
+
+def get_latest_reading_time(variable: Any) -> datetime | None:
+    """Return the timestamp of the newest reading of a measurements variable."""
+    if not isinstance(variable, dict):
+        return None
+    latest = None
+    for reading in variable.get("lectures", []) or []:
+        if not isinstance(reading, dict) or reading.get("valor") is None:
+            continue
+        timestamp = parse_reading_time(reading.get("data"))
+        if timestamp is not None and (latest is None or timestamp > latest):
+            latest = timestamp
+    return latest
@@ -50,6 +50,8 @@ from .const import (
     CONF_SENSOR_APPARENT_TEMPERATURE,
 )
 from .coordinator import MeteocatCoordinator
+from .entity import MeteocatStaleDataMixin
+from .utils import calculate_derived_metrics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,12 +62,16 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Meteocat weather entity."""
-    from .const import CONF_MODE, MODE_EXTERNAL
+    from .const import CONF_MODE, MODE_EXTERNAL, MODE_MULTI
     
     # Only create weather entity in XEMA mode
     mode = entry.data.get(CONF_MODE, MODE_EXTERNAL)
     _LOGGER.info("Weather platform setup - mode: %s", mode)
     
+    if mode == MODE_MULTI:
+        # Multi-station entries have no forecast and no single station to describe
+        return
+    
     coordinator: MeteocatCoordinator = hass.data[DOMAIN][entry.entry_id]
     
     if mode == MODE_EXTERNAL:
@@ -77,7 +83,7 @@ async def async_setup_entry(
 
 
 
-class MeteocatWeather(SingleCoordinatorWeatherEntity[MeteocatCoordinator]):
+class MeteocatWeather(MeteocatStaleDataMixin, SingleCoordinatorWeatherEntity[MeteocatCoordinator]):
     """Representation of a Meteocat weather entity.
     
     Combines station measurements with forecast data:
@@ -384,6 +390,9 @@ class MeteocatWeather(SingleCoordinatorWeatherEntity[MeteocatCoordinator]):
 
     async def async_forecast_hourly(self) -> list[Forecast] | None:
         """Return the hourly forecast (72 hours)."""
+        # Being asked is what keeps an on-demand hourly forecast fetched
+        if getattr(self.coordinator, "hourly_forecast_on_demand", False) is True:
+            await self.coordinator.async_request_hourly_forecast()
         forecast_hourly = self.coordinator.data.get("forecast_hourly")
         if not forecast_hourly:
             return None
@@ -403,11 +412,15 @@ class MeteocatWeather(SingleCoordinatorWeatherEntity[MeteocatCoordinator]):
             temp_valors = temp_data.get("valors", temp_data.get("valor", []))
             estat_valors = estat_cel_data.get("valors", estat_cel_data.get("valor", []))
             precip_valors = precip_data.get("valors", precip_data.get("valor", []))
+            humidity_valors = (variables.get("humitat") or {}).get("valors", [])
+            wind_valors = (variables.get("velVent") or {}).get("valors", [])
             
             # Build dictionaries by timestamp
             temp_dict = {h.get("data"): h.get("valor") for h in temp_valors}
             estat_dict = {h.get("data"): h.get("valor") for h in estat_valors}
             precip_dict = {h.get("data"): h.get("valor") for h in precip_valors}
+            humidity_dict = {h.get("data"): h.get("valor") for h in humidity_valors}
+            wind_dict = {h.get("data"): h.get("valor") for h in wind_valors}
             
             # Get all unique timestamps
             all_times = set(temp_dict.keys()) | set(estat_dict.keys()) | set(precip_dict.keys())
@@ -435,6 +448,29 @@ class MeteocatWeather(SingleCoordinatorWeatherEntity[MeteocatCoordinator]):
                         except (ValueError, TypeError):
                             pass
                     
+                    if time_str in humidity_dict:
+                        try:
+                            forecast_item["humidity"] = float(humidity_dict[time_str])
+                        except (ValueError, TypeError):
+                            pass
+                    
+                    if time_str in wind_dict:
+                        try:
+                            forecast_item["native_wind_speed"] = float(wind_dict[time_str])  # km/h
+                        except (ValueError, TypeError):
+                            pass
+                    
+                    # Same derivations as the station sensors, where the hour has the inputs
+                    metrics = calculate_derived_metrics(
+                        forecast_item.get("native_temperature"),
+                        forecast_item.get("humidity"),
+                        forecast_item.get("native_wind_speed"),
+                    )
+                    if "dew_point" in metrics:
+                        forecast_item["native_dew_point"] = metrics["dew_point"]
+                    if "heat_index" in metrics or "wind_chill" in metrics:
+                        forecast_item["native_apparent_temperature"] = metrics["apparent_temperature"]
+                    
                     forecasts.append(forecast_item)
         
         return forecasts[:72]  # Limit to 72 hours
@@ -525,7 +561,7 @@ class MeteocatLocalWeather(MeteocatWeather):
     @property
     def extra_state_attributes(self) -> dict:
         """Return all configured sensor values as extra state attributes."""
-        attrs = {}
+        attrs = self._stale_data_attributes()
         sensors = [
             ("ozone", "ozone"),
             ("pressure", "pressure"),
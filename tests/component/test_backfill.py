@@ -0,0 +1,247 @@
+"""Tests for the backfill of missed measurement readings.
+
+Readings missed while Home Assistant was down (or while refreshes failed)
+are fetched by day and imported into long-term statistics, within a
+per-refresh request budget.
+"""
+import sys
+import os
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    BACKFILL_MAX_REQUESTS,
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_STATION_CODE,
+    MODE_EXTERNAL,
+)
+from custom_components.meteocat_community_edition.statistics import (
+    aggregate_hourly,
+    async_import_readings,
+    get_statistic_id,
+)
+from custom_components.meteocat_community_edition.utils import extract_readings
+
+NOW = datetime(2026, 10, 19, 1, 15, tzinfo=timezone.utc)
+
+
+def _measurements(day: date, hours: range, temperature: float = 15.0):
+    """Build a XEMA payload with half-hourly temperature readings."""
+    lectures = []
+    for hour in hours:
+        for minute in (0, 30):
+            lectures.append({
+                "data": f"{day.isoformat()}T{hour:02d}:{minute:02d}Z",
+                "valor": temperature + hour,
+                "estat": "V",
+                "baseHoraria": "SH",
+            })
+    return [{"codi": "YM", "variables": [{"codi": 32, "lectures": lectures}]}]
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance with the recorder loaded."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.config.components = {"recorder"}
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+    }
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def coordinator(mock_hass, mock_entry):
+    """Create a coordinator with a mocked backfill store."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api.get_station_measurements = AsyncMock()
+    coordinator._backfill_store = MagicMock()
+    return coordinator
+
+
+def test_extract_readings():
+    """Test that readings are parsed as UTC timestamps and sorted."""
+    readings = extract_readings(_measurements(date(2026, 10, 19), range(0, 2)))
+    assert list(readings) == [32]
+    assert readings[32][0] == (datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc), 15.0)
+    assert len(readings[32]) == 4
+
+
+def test_extract_readings_skips_invalid():
+    """Test that readings without time or value are ignored."""
+    measurements = [{"variables": [{"codi": 32, "lectures": [
+        {"valor": 10.0},
+        {"data": "2026-10-19T10:00Z", "valor": None},
+        {"data": "bad", "valor": 1.0},
+    ]}]}]
+    assert extract_readings(measurements) == {}
+    assert extract_readings(None) == {}
+
+
+def test_aggregate_hourly():
+    """Test hourly mean/min/max aggregation."""
+    readings = extract_readings(_measurements(date(2026, 10, 19), range(0, 1)))
+    readings[32][1] = (readings[32][1][0], 17.0)
+    statistics = aggregate_hourly(readings[32])
+    assert len(statistics) == 1
+    assert statistics[0]["start"] == datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc)
+    assert statistics[0]["mean"] == 16.0
+    assert statistics[0]["min"] == 15.0
+    assert statistics[0]["max"] == 17.0
+
+
+def test_aggregate_hourly_dedupes_timestamps():
+    """Test that a reading present twice is counted once, with its last value."""
+    readings = extract_readings(_measurements(date(2026, 10, 19), range(0, 1)))[32]
+    readings = [*readings, (readings[1][0], 19.0), readings[0]]
+
+    statistics = aggregate_hourly(readings)
+
+    assert statistics[0]["mean"] == 17.0
+    assert statistics[0]["max"] == 19.0
+
+
+def test_import_one_call_per_variable(mock_hass):
+    """Test that every new hour of a variable is imported in a single call."""
+    readings = extract_readings(_measurements(date(2026, 10, 19), range(0, 24)))
+    since = datetime(2026, 10, 19, 20, 0, tzinfo=timezone.utc)
+
+    with patch(
+        "custom_components.meteocat_community_edition.statistics.async_add_external_statistics"
+    ) as mock_add:
+        assert async_import_readings(mock_hass, "YM", "Barcelona", readings, since) == 4
+        assert async_import_readings(mock_hass, "YM", "Barcelona", readings, NOW.replace(day=20)) == 0
+
+    mock_add.assert_called_once()
+    metadata, statistics = mock_add.call_args[0][1:]
+    assert metadata["statistic_id"] == "meteocat_community_edition:ym_temperature"
+    # The hour of the last imported reading is completed with both of its readings
+    assert [item["start"].hour for item in statistics] == [20, 21, 22, 23]
+    assert statistics[0]["mean"] == 35.0
+
+
+def test_statistic_id():
+    """Test statistic ids for known and unknown variables."""
+    assert get_statistic_id("YM", 32) == "meteocat_community_edition:ym_temperature"
+    assert get_statistic_id("YM", 999) is None
+
+
+@pytest.mark.asyncio
+async def test_first_run_imports_payload_without_extra_calls(coordinator):
+    """Test that without history only the current payload is imported."""
+    coordinator._backfill_store = None
+    payload = _measurements(date(2026, 10, 19), range(0, 2))
+
+    with patch("custom_components.meteocat_community_edition.coordinator.Store") as mock_store, \
+         patch("custom_components.meteocat_community_edition.coordinator.async_import_readings") as mock_import, \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        mock_store.return_value.async_load = AsyncMock(return_value=None)
+        await coordinator._async_backfill_measurements(payload)
+
+    coordinator.api.get_station_measurements.assert_not_called()
+    assert mock_import.call_args[0][4] is None
+    assert coordinator.last_ingested_reading == datetime(2026, 10, 19, 1, 30, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_gap_across_midnight_fetches_previous_day(coordinator):
+    """Test that a gap crossing UTC midnight fetches the previous day once."""
+    coordinator.last_ingested_reading = datetime(2026, 10, 18, 21, 0, tzinfo=timezone.utc)
+    coordinator.api.get_station_measurements.return_value = _measurements(date(2026, 10, 18), range(0, 24))
+    payload = _measurements(date(2026, 10, 19), range(0, 2))
+
+    with patch("custom_components.meteocat_community_edition.coordinator.async_import_readings") as mock_import, \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        await coordinator._async_backfill_measurements(payload)
+
+    coordinator.api.get_station_measurements.assert_called_once_with("YM", date(2026, 10, 18))
+    readings = mock_import.call_args[0][3]
+    assert readings[32][0][0] == datetime(2026, 10, 18, 0, 0, tzinfo=timezone.utc)
+    assert len(readings[32]) == 48 + 4
+    assert coordinator.last_ingested_reading == datetime(2026, 10, 19, 1, 30, tzinfo=timezone.utc)
+    coordinator._backfill_store.async_delay_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_no_gap_no_extra_calls(coordinator):
+    """Test that a continuous series needs no backfill call."""
+    coordinator.last_ingested_reading = datetime(2026, 10, 19, 0, 30, tzinfo=timezone.utc)
+    payload = _measurements(date(2026, 10, 19), range(0, 2))
+
+    with patch("custom_components.meteocat_community_edition.coordinator.async_import_readings") as mock_import, \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        await coordinator._async_backfill_measurements(payload)
+
+    coordinator.api.get_station_measurements.assert_not_called()
+    assert mock_import.called
+
+
+@pytest.mark.asyncio
+async def test_backfill_budget_limits_requests(coordinator):
+    """Test that long outages are recovered over several refreshes."""
+    coordinator.last_ingested_reading = datetime(2026, 10, 10, 12, 0, tzinfo=timezone.utc)
+
+    async def _get_day(station_code, day):
+        return _measurements(day, range(0, 24))
+
+    coordinator.api.get_station_measurements.side_effect = _get_day
+    payload = _measurements(date(2026, 10, 19), range(0, 2))
+
+    with patch("custom_components.meteocat_community_edition.coordinator.async_import_readings"), \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        await coordinator._async_backfill_measurements(payload)
+
+    assert coordinator.api.get_station_measurements.call_count == BACKFILL_MAX_REQUESTS
+    # Starts BACKFILL_MAX_DAYS back and only advances over the recovered days
+    first_day = coordinator.api.get_station_measurements.call_args_list[0][0][1]
+    assert first_day == date(2026, 10, 16)
+    assert coordinator.last_ingested_reading == datetime(2026, 10, 17, 23, 30, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_backfill_error_keeps_position(coordinator):
+    """Test that a failed day fetch is retried on the next refresh."""
+    from custom_components.meteocat_community_edition.api import MeteocatAPIError
+
+    since = datetime(2026, 10, 18, 21, 0, tzinfo=timezone.utc)
+    coordinator.last_ingested_reading = since
+    coordinator.api.get_station_measurements.side_effect = MeteocatAPIError("500")
+    payload = _measurements(date(2026, 10, 19), range(0, 2))
+
+    with patch("custom_components.meteocat_community_edition.coordinator.async_import_readings"), \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        await coordinator._async_backfill_measurements(payload)
+
+    assert coordinator.last_ingested_reading == since
+
+
+@pytest.mark.asyncio
+async def test_backfill_skipped_without_recorder(coordinator, mock_hass):
+    """Test that nothing is fetched when the recorder is not loaded."""
+    mock_hass.config.components = set()
+    coordinator.last_ingested_reading = datetime(2026, 10, 18, 21, 0, tzinfo=timezone.utc)
+
+    with patch("custom_components.meteocat_community_edition.coordinator.async_import_readings") as mock_import:
+        await coordinator._async_backfill_measurements(_measurements(date(2026, 10, 19), range(0, 2)))
+
+    coordinator.api.get_station_measurements.assert_not_called()
+    mock_import.assert_not_called()
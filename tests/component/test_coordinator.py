@@ -228,7 +228,7 @@ async def test_coordinator_handles_quota_exceeded(mock_hass, mock_api, mock_entr
     }
     
     # Mock API to raise 429 error
-    mock_api.get_quotes.side_effect = MeteocatAPIError("Rate limit exceeded (429)")
+    mock_api.get_quotes.side_effect = MeteocatAPIError("Rate limit exceeded (429)", status=429)
     
     # Run update
     data = await coordinator._async_update_data()
@@ -82,7 +82,7 @@ async def test_coordinator_429_quota_exceeded(hass: HomeAssistant, mock_api):
     }
     
     # Mock quota error
-    mock_api.get_quotes.side_effect = MeteocatAPIError("Rate limit exceeded 429")
+    mock_api.get_quotes.side_effect = MeteocatAPIError("Rate limit exceeded 429", status=429)
     
     # Run update
     new_data = await coordinator._async_update_data()
@@ -40,7 +40,7 @@ async def test_coordinator_handles_quota_exceeded_with_previous_data(hass, mock_
     }
     
     # Mock API to raise 429
-    mock_api.get_quotes.side_effect = MeteocatAPIError("429 Rate limit exceeded")
+    mock_api.get_quotes.side_effect = MeteocatAPIError("429 Rate limit exceeded", status=429)
     mock_api.get_station_measurements.return_value = {}
     mock_api.get_municipal_forecast.return_value = {}
     
@@ -59,7 +59,7 @@ async def test_coordinator_handles_quota_exceeded_without_previous_data(hass, mo
     coordinator.data = {}
     
     # Mock API to raise 429
-    mock_api.get_quotes.side_effect = MeteocatAPIError("429 Rate limit exceeded")
+    mock_api.get_quotes.side_effect = MeteocatAPIError("429 Rate limit exceeded", status=429)
     
     result = await coordinator._async_update_data()
     
@@ -89,6 +89,23 @@ async def test_coordinator_handles_non_429_api_error_fetching_quotes(hass, mock_
     
     assert result.get("quotes") is None
 
+@pytest.mark.asyncio
+async def test_coordinator_429_in_message_is_not_rate_limit(hass, mock_entry, mock_api):
+    """Test that only the status code marks the quotes fetch as rate limited."""
+    coordinator = MeteocatCoordinator(hass, mock_entry)
+    coordinator.api = mock_api
+    
+    coordinator.data = {
+        "quotes": {"plans": [{"nom": "Plan 1", "consultesRestants": 100}]}
+    }
+    
+    mock_api.get_quotes.side_effect = MeteocatAPIError("Error 500 for station 429", status=500)
+    
+    result = await coordinator._async_update_data()
+    
+    # Old quotes are kept, not zeroed
+    assert result["quotes"]["plans"][0]["consultesRestants"] == 100
+
 @pytest.mark.asyncio
 async def test_coordinator_fires_events(mock_entry, mock_api):
     """Test that events are fired after update."""
@@ -4,12 +4,13 @@ This test suite validates the coordinator-level retry logic for handling
 temporary API failures while preserving quota consumption.
 
 Key behaviors tested:
-1. Retryable errors (network, server) trigger 60s retry
+1. Retryable errors (network, typed 5xx/429 status) trigger a retry
 2. Non-retryable errors (auth, not found) do NOT trigger retry
 3. Quotes API skipped on retry to avoid double-counting
-4. Only 1 retry attempt (no infinite loops)
-5. Retry cancellation on shutdown
-6. Events only fire on complete success
+4. Retries capped per scheduled slot (no infinite loops)
+5. Capped exponential backoff with jitter, never overlapping a scheduled update
+6. Retry cancellation on shutdown
+7. Events only fire on complete success
 """
 import sys
 import os
@@ -26,13 +27,18 @@ from custom_components.meteocat_community_edition.coordinator import MeteocatCoo
 from custom_components.meteocat_community_edition.api import (
     MeteocatAPIError,
     MeteocatAuthError,
+    MeteocatConnectionError,
 )
 from custom_components.meteocat_community_edition.const import (
     CONF_API_KEY,
     CONF_MODE,
+    CONF_RETRY_MAX_ATTEMPTS,
     CONF_STATION_CODE,
     CONF_MUNICIPALITY_CODE,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
     MODE_EXTERNAL,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
 )
 
 
@@ -131,7 +137,7 @@ async def test_network_timeout_triggers_retry(mock_hass, mock_api, mock_entry_xe
 @pytest.mark.asyncio
 async def test_server_error_500_triggers_retry(mock_hass, mock_api, mock_entry_xema, mock_device_registry):
     """Test that server error 500 triggers a retry."""
-    mock_api.get_station_measurements.side_effect = MeteocatAPIError("Server error 500")
+    mock_api.get_station_measurements.side_effect = MeteocatAPIError("Server error", status=500)
     
     with patch('custom_components.meteocat_community_edition.coordinator.async_get_clientsession'), \
          patch('custom_components.meteocat_community_edition.coordinator.dr.async_get', return_value=mock_device_registry), \
@@ -200,7 +206,7 @@ async def test_auth_error_401_no_retry(mock_hass, mock_api, mock_entry_xema, moc
 @pytest.mark.asyncio
 async def test_not_found_404_no_retry(mock_hass, mock_api, mock_entry_xema, mock_device_registry):
     """Test that 404 errors do NOT trigger retry."""
-    mock_api.get_station_measurements.side_effect = MeteocatAPIError("Not found 404")
+    mock_api.get_station_measurements.side_effect = MeteocatAPIError("Not found", status=404)
     
     with patch('custom_components.meteocat_community_edition.coordinator.async_get_clientsession'), \
          patch('custom_components.meteocat_community_edition.coordinator.dr.async_get', return_value=mock_device_registry), \
@@ -264,8 +270,8 @@ async def test_quotes_called_on_normal_update(mock_hass, mock_api, mock_entry_xe
 
 
 @pytest.mark.asyncio
-async def test_only_one_retry_scheduled(mock_hass, mock_api, mock_entry_xema, mock_device_registry):
-    """Test that only ONE retry is scheduled (no infinite retries)."""
+async def test_retries_capped_per_slot(mock_hass, mock_api, mock_entry_xema, mock_device_registry):
+    """Test that retries stop after the maximum attempts (no infinite retries)."""
     mock_api.get_station_measurements.side_effect = ServerTimeoutError("Timeout")
     
     with patch('custom_components.meteocat_community_edition.coordinator.async_get_clientsession'), \
@@ -283,17 +289,48 @@ async def test_only_one_retry_scheduled(mock_hass, mock_api, mock_entry_xema, mo
         
         assert mock_track.call_count == 1
         
-        # Now simulate retry update (still failing)
+        # Retries keep failing until the attempts of the slot are used
         coordinator._is_retry_update = True
-        mock_track.reset_mock()
+        coordinator._is_first_refresh = False
+        for _ in range(DEFAULT_RETRY_MAX_ATTEMPTS):
+            try:
+                await coordinator._async_update_data()
+            except Exception:
+                pass
         
-        try:
-            await coordinator._async_update_data()
-        except Exception:
-            pass
+        # Should NOT schedule more than the maximum attempts
+        assert mock_track.call_count == DEFAULT_RETRY_MAX_ATTEMPTS
+        assert coordinator.retry_attempts == DEFAULT_RETRY_MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_retry_attempts_configurable(mock_hass, mock_api, mock_entry_xema):
+    """Test that retries can be disabled from the options."""
+    mock_entry_xema.options = {CONF_RETRY_MAX_ATTEMPTS: 0}
+    
+    with patch('custom_components.meteocat_community_edition.coordinator.async_get_clientsession'), \
+         patch('custom_components.meteocat_community_edition.coordinator.async_track_point_in_utc_time') as mock_track:
+        coordinator = MeteocatCoordinator(mock_hass, mock_entry_xema)
+        
+        assert await coordinator._schedule_retry_update() is False
+        assert not mock_track.called
+
+
+@pytest.mark.asyncio
+async def test_scheduled_update_resets_attempts(mock_hass, mock_api, mock_entry_xema):
+    """Test that a new scheduled slot cancels pending retries and resets attempts."""
+    with patch('custom_components.meteocat_community_edition.coordinator.async_get_clientsession'), \
+         patch('custom_components.meteocat_community_edition.coordinator.async_track_point_in_utc_time'):
+        coordinator = MeteocatCoordinator(mock_hass, mock_entry_xema)
+        coordinator.async_request_refresh = AsyncMock()
+        coordinator.retry_attempts = 2
+        mock_remover = MagicMock()
+        coordinator._retry_remover = mock_remover
         
-        # Should NOT schedule another retry (already in retry mode)
-        assert mock_track.call_count == 0
+        await coordinator._async_scheduled_update(datetime.now())
+        
+        mock_remover.assert_called_once()
+        assert coordinator.retry_attempts == 0
 
 
 # ============================================================================
@@ -444,3 +481,59 @@ async def test_retry_delay_is_60_seconds(mock_hass, mock_api, mock_entry_xema):
         scheduled_time = mock_track.call_args[0][2]
         expected_time = now + timedelta(seconds=60)
         assert scheduled_time == expected_time
+
+# ============================================================================
+# RETRY POLICY TESTS
+# ============================================================================
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        (MeteocatAPIError("Server error", status=500), True),
+        (MeteocatAPIError("Bad gateway", status=502), True),
+        (MeteocatAPIError("Unavailable", status=503), True),
+        (MeteocatAPIError("Rate limited", status=429), True),
+        (MeteocatConnectionError("Timeout connecting to Meteocat API"), True),
+        (MeteocatAPIError("Bad request", status=400), False),
+        (MeteocatAPIError("Error 500 in message only"), False),
+        (MeteocatAuthError("Forbidden", status=403), False),
+    ],
+)
+def test_retryable_error_uses_typed_status(mock_hass, mock_entry_xema, error, expected):
+    """Test that errors are classified by their status code, not their message."""
+    with patch('custom_components.meteocat_community_edition.coordinator.async_get_clientsession'):
+        coordinator = MeteocatCoordinator(mock_hass, mock_entry_xema)
+    
+    assert coordinator._is_retryable_error(error) is expected
+
+
+def test_retry_delay_exponential_with_jitter(mock_hass, mock_entry_xema):
+    """Test that the delay doubles per attempt, is capped and jittered."""
+    with patch('custom_components.meteocat_community_edition.coordinator.async_get_clientsession'):
+        coordinator = MeteocatCoordinator(mock_hass, mock_entry_xema)
+    
+    for attempt in range(1, 10):
+        expected = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        for _ in range(20):
+            delay = coordinator._get_retry_delay(attempt)
+            assert expected / 2 <= delay <= expected
+
+
+@pytest.mark.asyncio
+async def test_retry_never_overlaps_scheduled_update(mock_hass, mock_entry_xema):
+    """Test that no retry is scheduled right before the next scheduled update."""
+    from datetime import timezone
+    
+    now = datetime(2025, 11, 26, 12, 0, 0, tzinfo=timezone.utc)
+    with patch('custom_components.meteocat_community_edition.coordinator.async_get_clientsession'), \
+         patch('custom_components.meteocat_community_edition.coordinator.dt_util.utcnow', return_value=now), \
+         patch('custom_components.meteocat_community_edition.coordinator.async_track_point_in_utc_time') as mock_track:
+        coordinator = MeteocatCoordinator(mock_hass, mock_entry_xema)
+        coordinator.next_scheduled_update = now + timedelta(minutes=2)
+        
+        assert await coordinator._schedule_retry_update(delay_seconds=60) is False
+        assert not mock_track.called
+        
+        coordinator.next_scheduled_update = now + timedelta(minutes=30)
+        assert await coordinator._schedule_retry_update(delay_seconds=60) is True
+        assert mock_track.called
@@ -0,0 +1,148 @@
+"""Tests for the daily aggregate sensors of external stations.
+
+Minimum, maximum and mean of today's readings are read from the history
+of the coordinator: no recorder query and no API call.
+"""
+import sys
+import os
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_STATION_CODE,
+    DOMAIN,
+    MODE_EXTERNAL,
+)
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.history import ReadingHistory
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatDailyAggregateSensor,
+    async_setup_entry,
+)
+from custom_components.meteocat_community_edition.utils import extract_readings
+
+START = datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc)
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.data = {"mode": MODE_EXTERNAL, "station_code": "YM", "station_name": "Granollers"}
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Create a mock coordinator with a day of temperature readings."""
+    coordinator = MagicMock()
+    coordinator.data = {"measurements": [{"codi": "YM", "variables": [{"codi": 32, "lectures": []}]}]}
+    coordinator.history = ReadingHistory(24)
+    coordinator.history.add_readings({32: [
+        (START + timedelta(minutes=30 * index), value)
+        for index, value in enumerate([10.0, 8.5, 13.0, 12.5])
+    ]})
+    return coordinator
+
+
+def _sensor(coordinator, entry, statistic):
+    """Create a daily temperature aggregate sensor."""
+    return MeteocatDailyAggregateSensor(coordinator, entry, "Granollers", 32, statistic)
+
+
+def test_daily_statistics(mock_coordinator, mock_entry):
+    """Test min, max and mean with the time of the extremes."""
+    with patch("custom_components.meteocat_community_edition.sensor.dt_util.now", return_value=NOW):
+        minimum = _sensor(mock_coordinator, mock_entry, "min")
+        maximum = _sensor(mock_coordinator, mock_entry, "max")
+        mean = _sensor(mock_coordinator, mock_entry, "mean")
+
+        assert minimum.native_value == 8.5
+        assert minimum.extra_state_attributes["reading_time"] == "2026-10-19T00:30:00+00:00"
+        assert maximum.native_value == 13.0
+        assert maximum.extra_state_attributes["readings"] == 4
+        assert mean.native_value == 11.0
+        assert "reading_time" not in mean.extra_state_attributes
+
+    assert minimum.unique_id == "test_entry_temperature_daily_min"
+    assert minimum.translation_key == "temperature_daily_min"
+
+
+def test_new_day_without_readings(mock_coordinator, mock_entry):
+    """Test that the sensor is unknown until the first reading of the day."""
+    with patch(
+        "custom_components.meteocat_community_edition.sensor.dt_util.now",
+        return_value=NOW + timedelta(days=1),
+    ):
+        sensor = _sensor(mock_coordinator, mock_entry, "max")
+        assert sensor.native_value is None
+        assert "readings" not in sensor.extra_state_attributes
+
+
+@pytest.mark.asyncio
+async def test_restart_keeps_readings_before_utc_midnight(mock_entry):
+    """Test that after a restart the local day starts with the previous UTC day's readings."""
+    original = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(ZoneInfo("Europe/Madrid"))
+    try:
+        entry = MagicMock()
+        entry.entry_id = "test_entry"
+        entry.data = {CONF_API_KEY: "test_api_key", CONF_MODE: MODE_EXTERNAL, CONF_STATION_CODE: "YM"}
+        entry.options = {}
+        hass = MagicMock()
+        hass.data = {}
+        coordinator = MeteocatCoordinator(hass, entry)
+
+        async def _get_day(station_code, day=None):
+            day = day or date(2026, 10, 19)
+            lectures = [
+                # Coldest at 22:30Z, right after local midnight (UTC+2)
+                {"data": f"{day.isoformat()}T{hour:02d}:{minute:02d}Z",
+                 "valor": 5.0 if (day.day, hour, minute) == (18, 22, 30) else 10.0}
+                for hour in range(24 if day.day == 18 else 8)
+                for minute in (0, 30)
+            ]
+            return [{"codi": "YM", "variables": [{"codi": 32, "lectures": lectures}]}]
+
+        coordinator.api.get_station_measurements = AsyncMock(side_effect=_get_day)
+        with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+                   return_value=datetime(2026, 10, 19, 8, 0, tzinfo=timezone.utc)):
+            measurements = await coordinator._async_fetch_measurements()
+        coordinator.history.add_readings(extract_readings(measurements))
+
+        with patch("custom_components.meteocat_community_edition.sensor.dt_util.now",
+                   return_value=datetime(2026, 10, 19, 10, 0, tzinfo=ZoneInfo("Europe/Madrid"))):
+            minimum = _sensor(coordinator, mock_entry, "min")
+            assert minimum.native_value == 5.0
+            assert minimum.extra_state_attributes["readings"] == 20
+    finally:
+        dt_util.set_default_time_zone(original)
+
+
+@pytest.mark.asyncio
+async def test_created_for_reported_variables(mock_coordinator, mock_entry):
+    """Test that only the aggregates of reported variables are created."""
+    hass = MagicMock()
+    hass.data = {DOMAIN: {mock_entry.entry_id: mock_coordinator}}
+    entities = []
+
+    with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=MagicMock()):
+        await async_setup_entry(hass, mock_entry, entities.extend)
+
+    keys = sorted(
+        entity.translation_key for entity in entities
+        if isinstance(entity, MeteocatDailyAggregateSensor)
+    )
+    assert keys == ["temperature_daily_max", "temperature_daily_mean", "temperature_daily_min"]
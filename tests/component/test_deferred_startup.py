@@ -0,0 +1,232 @@
+"""Tests for the deferred startup.
+
+With the option enabled, entries start from the data saved by their last
+refresh and their first network refresh runs, batched with the other
+entries, once Home Assistant has started.
+"""
+import sys
+import os
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+from homeassistant.core import CoreState
+
+from custom_components.meteocat_community_edition import async_setup_entry
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.sensor import MeteocatForecastSensor, MeteocatXemaSensor
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_DEFERRED_STARTUP,
+    CONF_MODE,
+    CONF_STATION_CODE,
+    DOMAIN,
+    MODE_EXTERNAL,
+    STARTUP_QUEUE,
+    STARTUP_REFRESH_CONCURRENCY,
+)
+from custom_components.meteocat_community_edition.startup import (
+    async_defer_first_refresh,
+    async_run_deferred_refreshes,
+)
+
+SNAPSHOT = {
+    "saved_at": "2026-10-19T10:05:00+00:00",
+    "data": {
+        "measurements": [{"codi": "YM", "variables": [
+            {"codi": 32, "lectures": [{"data": "2026-10-19T10:00Z", "valor": 15.5}]}
+        ]}],
+        "forecast": {"dies": []},
+        "quotes": {"plans": []},
+    },
+}
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance that is still starting."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.state = CoreState.starting
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry with the deferred startup."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+    }
+    entry.options = {CONF_DEFERRED_STARTUP: True}
+    entry.add_update_listener = MagicMock(return_value=MagicMock())
+    entry.async_on_unload = MagicMock()
+    return entry
+
+
+def _coordinator(entry_id):
+    """Create a mock coordinator for the startup queue."""
+    coordinator = MagicMock()
+    coordinator.entry.entry_id = entry_id
+    coordinator.async_refresh = AsyncMock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_setup_does_not_wait_for_network(mock_hass, mock_entry):
+    """Test that entities are set up from saved data while HA is starting."""
+    with patch('custom_components.meteocat_community_edition.MeteocatCoordinator') as mock_coordinator_class, \
+         patch('custom_components.meteocat_community_edition.startup.async_at_started') as mock_at_started:
+        coordinator = mock_coordinator_class.return_value
+        coordinator.async_config_entry_first_refresh = AsyncMock()
+        coordinator.async_restore_snapshot = AsyncMock(return_value=True)
+
+        assert await async_setup_entry(mock_hass, mock_entry) is True
+
+    coordinator.async_restore_snapshot.assert_awaited_once()
+    coordinator.async_config_entry_first_refresh.assert_not_called()
+    coordinator._schedule_next_update.assert_not_called()
+    mock_hass.config_entries.async_forward_entry_setups.assert_called_once()
+    assert mock_hass.data[STARTUP_QUEUE] == [coordinator]
+    mock_at_started.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_setup_after_start_refreshes_immediately(mock_hass, mock_entry):
+    """Test that entries added at runtime keep the normal first refresh."""
+    mock_hass.state = CoreState.running
+    with patch('custom_components.meteocat_community_edition.MeteocatCoordinator') as mock_coordinator_class:
+        coordinator = mock_coordinator_class.return_value
+        coordinator.async_config_entry_first_refresh = AsyncMock()
+        coordinator.async_restore_snapshot = AsyncMock()
+
+        await async_setup_entry(mock_hass, mock_entry)
+
+    coordinator.async_config_entry_first_refresh.assert_awaited_once()
+    coordinator.async_restore_snapshot.assert_not_called()
+    assert STARTUP_QUEUE not in mock_hass.data
+
+
+@pytest.mark.asyncio
+async def test_setup_without_snapshot_refreshes_immediately(mock_hass, mock_entry):
+    """Test that a first start without saved data is not deferred."""
+    with patch('custom_components.meteocat_community_edition.MeteocatCoordinator') as mock_coordinator_class, \
+         patch('custom_components.meteocat_community_edition.startup.async_at_started') as mock_at_started:
+        coordinator = mock_coordinator_class.return_value
+        coordinator.async_config_entry_first_refresh = AsyncMock()
+        coordinator.async_restore_snapshot = AsyncMock(return_value=False)
+
+        assert await async_setup_entry(mock_hass, mock_entry) is True
+
+    coordinator.async_restore_snapshot.assert_awaited_once()
+    coordinator.async_config_entry_first_refresh.assert_awaited_once()
+    coordinator._schedule_next_update.assert_called_once()
+    assert STARTUP_QUEUE not in mock_hass.data
+    mock_at_started.assert_not_called()
+
+
+def test_sensors_without_data(mock_entry):
+    """Test that sensors report no value before the first data is available."""
+    coordinator = MagicMock()
+    coordinator.data = None
+
+    assert MeteocatXemaSensor(coordinator, mock_entry, "Granollers", 32).native_value is None
+    for forecast_type in ("hourly", "daily"):
+        sensor = MeteocatForecastSensor(coordinator, mock_entry, "Forecast", forecast_type, "YM")
+        assert sensor.native_value in ("0 hores", "0 dies")
+        assert sensor.extra_state_attributes == {}
+
+
+def test_queue_registers_one_start_listener(mock_hass):
+    """Test that all entries share a single job."""
+    with patch('custom_components.meteocat_community_edition.startup.async_at_started') as mock_at_started:
+        for entry_id in ("a", "b", "c"):
+            async_defer_first_refresh(mock_hass, _coordinator(entry_id))
+
+    mock_at_started.assert_called_once()
+    assert len(mock_hass.data[STARTUP_QUEUE]) == 3
+
+
+@pytest.mark.asyncio
+async def test_deferred_refreshes_are_bounded(mock_hass):
+    """Test the concurrency limit, scheduling and unloaded entries."""
+    running = 0
+    peak = 0
+
+    async def _refresh():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    coordinators = [_coordinator(f"entry_{index}") for index in range(5)]
+    for coordinator in coordinators:
+        coordinator.async_refresh.side_effect = _refresh
+    # The last entry was unloaded before Home Assistant started
+    mock_hass.data[DOMAIN] = {c.entry.entry_id: c for c in coordinators[:-1]}
+
+    await async_run_deferred_refreshes(mock_hass, coordinators)
+
+    assert peak == STARTUP_REFRESH_CONCURRENCY
+    for coordinator in coordinators[:-1]:
+        coordinator.async_refresh.assert_awaited_once()
+        coordinator._schedule_next_update.assert_called_once()
+    coordinators[-1].async_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot(mock_hass, mock_entry):
+    """Test that the saved data is served until the first refresh."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=SNAPSHOT)
+
+    with patch("custom_components.meteocat_community_edition.coordinator.Store", return_value=store):
+        assert await coordinator.async_restore_snapshot() is True
+
+    assert coordinator.data == SNAPSHOT["data"]
+    assert coordinator.last_successful_update_time == datetime(2026, 10, 19, 10, 5, tzinfo=timezone.utc)
+    assert coordinator.history.variables == [32]
+
+
+@pytest.mark.asyncio
+async def test_restore_without_snapshot(mock_hass, mock_entry):
+    """Test that a first start without saved data leaves the entities empty."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+
+    with patch("custom_components.meteocat_community_edition.coordinator.Store", return_value=store):
+        assert await coordinator.async_restore_snapshot() is False
+
+    assert coordinator.data is None
+
+
+@pytest.mark.asyncio
+async def test_successful_refresh_saves_snapshot(mock_hass, mock_entry):
+    """Test that every successful refresh saves the data for the next startup."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.station_data = {"codi": "YM", "nom": "Granollers"}
+    coordinator.municipality_code = "081131"
+    coordinator.api = MagicMock()
+    coordinator.api.get_station_measurements = AsyncMock(return_value=SNAPSHOT["data"]["measurements"])
+    coordinator.api.get_municipal_forecast = AsyncMock(return_value={"dies": []})
+    coordinator.api.get_quotes = AsyncMock(return_value={"plans": []})
+    store = MagicMock()
+
+    with patch("custom_components.meteocat_community_edition.coordinator.Store", return_value=store), \
+         patch("custom_components.meteocat_community_edition.coordinator.dr.async_get"):
+        data = await coordinator._async_update_data()
+
+    store.async_delay_save.assert_called_once()
+    saved = store.async_delay_save.call_args[0][0]()
+    assert saved["data"] is data
@@ -0,0 +1,132 @@
+"""Tests for the metrics derived from the station readings and the forecast.
+
+Dew point, heat index, wind chill and absolute humidity are computed once
+per measurements payload by the coordinator; the hourly forecast gets the
+dew point and apparent temperature of each hour with the same formulas.
+"""
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_STATION_CODE,
+    DOMAIN,
+    MODE_EXTERNAL,
+)
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatDerivedSensor,
+    async_setup_entry,
+)
+from custom_components.meteocat_community_edition.weather import MeteocatWeather
+
+
+def _measurements(temperature=0.0):
+    """Build a station payload with temperature, humidity and wind."""
+    return [{"codi": "YM", "variables": [
+        {"codi": 32, "lectures": [{"data": "2026-10-19T10:00Z", "valor": temperature}]},
+        {"codi": 33, "lectures": [{"data": "2026-10-19T10:00Z", "valor": 80}]},
+        {"codi": 30, "lectures": [{"data": "2026-10-19T10:00Z", "valor": 20 / 3.6}]},
+    ]}]
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+        "station_name": "Granollers",
+    }
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def coordinator(mock_entry):
+    """Create a coordinator holding a measurements payload."""
+    hass = MagicMock()
+    hass.data = {}
+    coordinator = MeteocatCoordinator(hass, mock_entry)
+    coordinator.data = {"measurements": _measurements()}
+    return coordinator
+
+
+def test_metrics_computed_once_per_payload(coordinator):
+    """Test that the metrics are only derived again for a new payload."""
+    with patch(
+        "custom_components.meteocat_community_edition.coordinator.derive_station_metrics",
+        return_value={"dew_point": 1.0},
+    ) as derive:
+        coordinator.get_derived_metrics()
+        coordinator.get_derived_metrics()
+        assert derive.call_count == 1
+
+        coordinator.data = {"measurements": _measurements(5.0)}
+        coordinator.get_derived_metrics()
+        assert derive.call_count == 2
+
+
+def test_derived_sensor_values(coordinator, mock_entry):
+    """Test the derived sensors of a station."""
+    wind_chill = MeteocatDerivedSensor(coordinator, mock_entry, "Granollers", "wind_chill")
+    dew_point = MeteocatDerivedSensor(coordinator, mock_entry, "Granollers", "dew_point")
+
+    assert wind_chill.native_value == -5.2
+    assert dew_point.native_value == -3.0
+    assert wind_chill.unique_id == "test_entry_wind_chill"
+    assert dew_point.native_unit_of_measurement == "°C"
+
+
+@pytest.mark.asyncio
+async def test_created_when_inputs_reported(mock_entry):
+    """Test that only the metrics with reported inputs get a sensor."""
+    mock_coordinator = MagicMock()
+    mock_coordinator.data = {"measurements": [{"codi": "YM", "variables": [
+        {"codi": 32, "lectures": []}, {"codi": 30, "lectures": []},
+    ]}]}
+    hass = MagicMock()
+    hass.data = {DOMAIN: {mock_entry.entry_id: mock_coordinator}}
+    entities = []
+
+    with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=MagicMock()):
+        await async_setup_entry(hass, mock_entry, entities.extend)
+
+    keys = [entity.translation_key for entity in entities if isinstance(entity, MeteocatDerivedSensor)]
+    assert keys == ["wind_chill"]
+
+
+@pytest.mark.asyncio
+async def test_hourly_forecast_derived_metrics(mock_entry):
+    """Test that forecast hours with humidity and wind get dew point and apparent temperature."""
+    mock_coordinator = MagicMock()
+    mock_coordinator.hourly_forecast_on_demand = False
+    mock_coordinator.data = {"forecast_hourly": {"dies": [{"variables": {
+        "temp": {"valors": [
+            {"data": "2026-10-19T10:00Z", "valor": "0"},
+            {"data": "2026-10-19T11:00Z", "valor": "20"},
+        ]},
+        "humitat": {"valors": [{"data": "2026-10-19T10:00Z", "valor": "80"}]},
+        "velVent": {"valors": [{"data": "2026-10-19T10:00Z", "valor": "20"}]},
+    }}]}}
+    weather = MeteocatWeather(mock_coordinator, mock_entry)
+
+    forecast = await weather.async_forecast_hourly()
+
+    assert forecast[0]["humidity"] == 80.0
+    assert forecast[0]["native_wind_speed"] == 20.0
+    assert forecast[0]["native_dew_point"] == -3.0
+    assert forecast[0]["native_apparent_temperature"] == -5.2
+    # Temperature only: nothing to derive
+    assert "native_dew_point" not in forecast[1]
+    assert "native_apparent_temperature" not in forecast[1]
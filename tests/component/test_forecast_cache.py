@@ -0,0 +1,218 @@
+"""Tests for the forecast cache shared by every entry.
+
+Forecasts only depend on the municipality: entries of the same
+municipality (external stations mapped to it, local entries) share one
+payload per forecast slot and one API call per concurrent refresh.
+"""
+import sys
+import os
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.api import MeteocatAPIError
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_MUNICIPALITY_CODE,
+    CONF_STATION_CODE,
+    CONF_UPDATE_STAGGER_WINDOW,
+    FORECAST_CACHE,
+    MODE_EXTERNAL,
+    MODE_LOCAL,
+)
+from custom_components.meteocat_community_edition.forecast_cache import (
+    ForecastCache,
+    get_forecast_cache,
+)
+from custom_components.meteocat_community_edition.utils import calculate_update_plan
+
+SLOT = datetime(2026, 10, 19, 6, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+def _entry(entry_id, **data):
+    """Create a mock config entry."""
+    entry = MagicMock()
+    entry.entry_id = entry_id
+    entry.data = {CONF_API_KEY: "test_api_key", **data}
+    entry.options = {CONF_UPDATE_STAGGER_WINDOW: 0}
+    return entry
+
+
+def _api():
+    """Create a mock API client."""
+    api = MagicMock()
+    api.get_station_measurements = AsyncMock(return_value=[{"codi": "YM", "variables": []}])
+    api.get_municipal_forecast = AsyncMock(return_value={"dies": []})
+    api.get_hourly_forecast = AsyncMock(return_value={"dies": []})
+    api.get_quotes = AsyncMock(return_value={"plans": []})
+    return api
+
+
+@pytest.mark.asyncio
+async def test_cache_reuses_payload_within_slot():
+    """Test that another entry gets the cached payload for the same slot."""
+    cache = ForecastCache()
+    fetch = AsyncMock(return_value={"dies": [1]})
+
+    first = await cache.async_get("081131", "daily", SLOT, fetch)
+    second = await cache.async_get("081131", "daily", SLOT, fetch)
+
+    assert first is second
+    fetch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_refetches_new_slot_and_manual():
+    """Test the cases that need a new call."""
+    cache = ForecastCache()
+    fetch = AsyncMock(return_value={"dies": []})
+
+    first = await cache.async_get("081131", "daily", SLOT, fetch)
+    # The same entry asking again (e.g. retrying) reuses its payload
+    assert await cache.async_get("081131", "daily", SLOT, fetch) is first
+    assert fetch.call_count == 1
+    # Next update time reached
+    await cache.async_get("081131", "daily", SLOT.replace(hour=14), fetch)
+    # Manual refresh
+    await cache.async_get("081131", "daily", None, fetch)
+    # Other forecast type
+    await cache.async_get("081131", "hourly", SLOT, fetch)
+
+    assert fetch.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_cache_shares_in_flight_request():
+    """Test that concurrent requests make a single call."""
+    cache = ForecastCache()
+    release = asyncio.Event()
+
+    async def _fetch():
+        await release.wait()
+        return {"dies": []}
+
+    fetch = AsyncMock(side_effect=_fetch)
+    pending = [
+        asyncio.ensure_future(cache.async_get("081131", "daily", SLOT, fetch))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*pending)
+
+    fetch.assert_called_once()
+    assert results[0] is results[1] is results[2]
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_keep_errors():
+    """Test that a failed call is shared but not cached."""
+    cache = ForecastCache()
+    fetch = AsyncMock(side_effect=MeteocatAPIError("Server error", status=503))
+
+    with pytest.raises(MeteocatAPIError):
+        await cache.async_get("081131", "daily", SLOT, fetch)
+
+    assert len(cache) == 0
+    fetch.side_effect = None
+    fetch.return_value = {"dies": []}
+    assert await cache.async_get("081131", "daily", SLOT, fetch) == {"dies": []}
+
+
+def test_get_forecast_cache_is_shared(mock_hass):
+    """Test that every entry gets the same cache."""
+    cache = get_forecast_cache(mock_hass)
+    assert get_forecast_cache(mock_hass) is cache
+    assert mock_hass.data[FORECAST_CACHE] is cache
+
+
+@pytest.mark.asyncio
+async def test_external_and_local_entries_share_forecast(mock_hass):
+    """Test that a station and a local entry of the same town fetch once."""
+    external = MeteocatCoordinator(mock_hass, _entry(
+        "external", **{CONF_MODE: MODE_EXTERNAL, CONF_STATION_CODE: "YM",
+                       "station_municipality_code": "081131", "_station_data": {"codi": "YM"}}
+    ))
+    local = MeteocatCoordinator(mock_hass, _entry(
+        "local", **{CONF_MODE: MODE_LOCAL, CONF_MUNICIPALITY_CODE: "081131"}
+    ))
+    external.api = _api()
+    local.api = _api()
+    for coordinator in (external, local):
+        coordinator.enable_forecast_hourly = True
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dr.async_get"):
+        external_data, local_data = await asyncio.gather(
+            external._async_update_data(), local._async_update_data()
+        )
+
+    calls = (
+        external.api.get_municipal_forecast.call_count + local.api.get_municipal_forecast.call_count,
+        external.api.get_hourly_forecast.call_count + local.api.get_hourly_forecast.call_count,
+    )
+    assert calls == (1, 1)
+    assert external_data["forecast"] is local_data["forecast"]
+
+
+@pytest.mark.asyncio
+async def test_manual_refresh_bypasses_cache(mock_hass):
+    """Test that the forecast button always makes a new call."""
+    coordinator = MeteocatCoordinator(mock_hass, _entry(
+        "local", **{CONF_MODE: MODE_LOCAL, CONF_MUNICIPALITY_CODE: "081131"}
+    ))
+    other = MeteocatCoordinator(mock_hass, _entry(
+        "other", **{CONF_MODE: MODE_LOCAL, CONF_MUNICIPALITY_CODE: "081131"}
+    ))
+    coordinator.api = other.api = _api()
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dr.async_get"):
+        await other._async_update_data()
+        coordinator._force_forecast = True
+        await coordinator._async_update_data()
+
+    assert coordinator.api.get_municipal_forecast.call_count == 2
+
+
+def test_forecast_slot_follows_update_times(mock_hass):
+    """Test that the slot is the last update time reached."""
+    coordinator = MeteocatCoordinator(mock_hass, _entry(
+        "local", **{CONF_MODE: MODE_LOCAL, CONF_MUNICIPALITY_CODE: "081131"}
+    ))
+    coordinator.update_time_1 = "06:00"
+    coordinator.update_time_2 = "14:00"
+    now = datetime(2026, 10, 19, 10, 30, tzinfo=timezone.utc)
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.now", return_value=now):
+        assert coordinator._get_forecast_slot() == now.replace(hour=6, minute=0)
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.now",
+               return_value=now.replace(hour=5)):
+        assert coordinator._get_forecast_slot() == datetime(2026, 10, 18, 14, 0, tzinfo=timezone.utc)
+
+
+def test_quota_plan_counts_unique_municipalities():
+    """Test that the Predicció plan is shared by municipality, not by entry."""
+    now = datetime(2026, 10, 1, 0, 0, tzinfo=timezone.utc)
+    plans = [{"nom": "Prediccio", "consultesRestants": 1240, "periode": "Mensual"}]
+
+    per_entry = calculate_update_plan(plans, now, entries_sharing_key=4, fetch_measurements=False)
+    per_municipality = calculate_update_plan(
+        plans, now, entries_sharing_key=4, fetch_measurements=False, forecast_entries_sharing_key=2
+    )
+
+    assert per_entry["forecast_updates_per_day"] == 10
+    assert per_municipality["forecast_updates_per_day"] == 20
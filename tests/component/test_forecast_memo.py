@@ -0,0 +1,96 @@
+"""Tests for the memoized forecast of the forecast sensors.
+
+The forecast in HA format and the period count are converted once per
+fetched payload and reused by every state write.
+"""
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from custom_components.meteocat_community_edition.const import CONF_COMPACT_FORECAST_ATTRIBUTES
+from custom_components.meteocat_community_edition.sensor import MeteocatForecastSensor
+
+
+def _hourly_payload():
+    """Build a 72-hour forecast payload."""
+    return {"dies": [{
+        "data": f"2026-10-{19 + day}Z",
+        "variables": {
+            name: {"valors": [
+                {"data": f"2026-10-{19 + day}T{hour:02d}:00Z", "valor": value}
+                for hour in range(24)
+            ]}
+            for name, value in (("temp", "12.5"), ("estatCel", 2), ("precipitacio", "0.4"))
+        },
+    } for day in range(3)]}
+
+
+def _daily_payload():
+    """Build an 8-day forecast payload."""
+    return {"dies": [{
+        "data": f"2026-10-{19 + day}Z",
+        "variables": {"tmin": {"valor": 8}, "tmax": {"valor": 19}, "estatCel": {"valor": 2}},
+    } for day in range(8)]}
+
+
+def _sensor(forecast_type, data, options=None):
+    """Create a forecast sensor on a mock coordinator."""
+    coordinator = MagicMock()
+    coordinator.data = data
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.options = options or {}
+    return MeteocatForecastSensor(coordinator, entry, "Device Name", "Entity Name", forecast_type)
+
+
+def test_hourly_converted_once_per_payload():
+    """Test that state and attributes share one conversion until a new fetch."""
+    sensor = _sensor("hourly", {"forecast_hourly": _hourly_payload()})
+
+    with patch.object(sensor, "_get_forecast_hourly", wraps=sensor._get_forecast_hourly) as convert:
+        assert sensor.native_value == "72 hores"
+        forecast = sensor.extra_state_attributes["forecast_ha"]
+        assert sensor.extra_state_attributes["forecast_ha"] is forecast
+        assert convert.call_count == 1
+
+        sensor.coordinator.data["forecast_hourly"] = _hourly_payload()
+        sensor.extra_state_attributes
+        assert convert.call_count == 2
+
+    assert len(forecast) == 72
+    assert forecast[0] == {
+        "datetime": "2026-10-19T00:00Z",
+        "temperature": 12.5,
+        "condition": "partlycloudy",
+        "precipitation": 0.4,
+    }
+
+
+def test_daily_converted_once_per_payload():
+    """Test the daily forecast memo."""
+    sensor = _sensor("daily", {"forecast": _daily_payload()})
+
+    with patch.object(sensor, "_get_forecast_daily", wraps=sensor._get_forecast_daily) as convert:
+        assert len(sensor.extra_state_attributes["forecast_ha"]) == 8
+        sensor.extra_state_attributes
+        assert convert.call_count == 1
+
+
+def test_compact_attributes_option():
+    """Test that the option replaces the forecast items by columns."""
+    sensor = _sensor(
+        "hourly", {"forecast_hourly": _hourly_payload()}, {CONF_COMPACT_FORECAST_ATTRIBUTES: True}
+    )
+
+    attributes = sensor.extra_state_attributes
+
+    assert "forecast_ha" not in attributes
+    compact = attributes["forecast_compact"]
+    assert compact["start"] == "2026-10-19T00:00Z"
+    assert compact["step"] == 3600
+    assert compact["temperature"] == [12.5] * 72
+    assert compact["conditions"] == ["partlycloudy"]
+    assert sensor.native_value == "72 hores"
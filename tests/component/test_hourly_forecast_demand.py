@@ -0,0 +1,177 @@
+"""Tests for the on-demand hourly forecast.
+
+With the option enabled, the 72-hour forecast is only fetched while the
+weather entity is asked for it (subscribed cards, forecast services): the
+first request after an idle period fetches it right away and refreshes
+keep it up to date until the demand expires.
+"""
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.api import MeteocatAPIError
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_ENABLE_FORECAST_HOURLY,
+    CONF_HOURLY_FORECAST_ON_DEMAND,
+    CONF_MODE,
+    CONF_MUNICIPALITY_CODE,
+    CONF_STATION_CODE,
+    CONF_STATION_NAME,
+    HOURLY_FORECAST_DEMAND_TTL,
+    MODE_LOCAL,
+)
+from custom_components.meteocat_community_edition.weather import MeteocatWeather
+
+NOW = datetime(2026, 10, 19, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def patch_device_registry():
+    """Patch device_registry for tests that call _async_update_data."""
+    with patch('custom_components.meteocat_community_edition.coordinator.dr.async_get'):
+        yield
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock local entry with the on-demand hourly forecast."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_LOCAL,
+        CONF_MUNICIPALITY_CODE: "081131",
+        CONF_ENABLE_FORECAST_HOURLY: True,
+    }
+    entry.options = {CONF_HOURLY_FORECAST_ON_DEMAND: True}
+    return entry
+
+
+@pytest.fixture
+def coordinator(mock_hass, mock_entry):
+    """Create a coordinator with a mocked API."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api = MagicMock()
+    coordinator.api.get_municipal_forecast = AsyncMock(return_value={"dies": []})
+    coordinator.api.get_hourly_forecast = AsyncMock(return_value={"dies": [{"data": "2026-10-19Z"}]})
+    coordinator.api.get_quotes = AsyncMock(return_value={"plans": []})
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_idle_entry_skips_hourly_forecast(coordinator):
+    """Test that nothing is fetched while nobody asks for the hourly forecast."""
+    data = await coordinator._async_update_data()
+
+    coordinator.api.get_municipal_forecast.assert_called_once()
+    coordinator.api.get_hourly_forecast.assert_not_called()
+    assert "forecast_hourly" not in data
+    assert coordinator.hourly_forecast_wanted is False
+
+
+@pytest.mark.asyncio
+async def test_idle_refreshes_do_not_fail(coordinator):
+    """Test that refreshes after the first one succeed without the hourly forecast."""
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator._is_first_refresh is False
+
+    data = await coordinator._async_update_data()
+
+    assert coordinator.api.get_municipal_forecast.call_count == 2
+    coordinator.api.get_hourly_forecast.assert_not_called()
+    assert data["forecast"] == {"dies": []}
+
+
+@pytest.mark.asyncio
+async def test_failed_demand_fetch_is_retried(coordinator):
+    """Test that a failed on-demand fetch does not use up the forecast slot."""
+    coordinator.data = {"forecast": {"dies": []}}
+    coordinator.api.get_hourly_forecast.side_effect = [
+        MeteocatAPIError("Server error", status=503),
+        {"dies": [{"data": "2026-10-19Z"}]},
+    ]
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        await coordinator.async_request_hourly_forecast()
+        assert "forecast_hourly" not in coordinator.data
+        await coordinator.async_request_hourly_forecast()
+
+    assert coordinator.api.get_hourly_forecast.call_count == 2
+    assert coordinator.data["forecast_hourly"] == {"dies": [{"data": "2026-10-19Z"}]}
+
+
+@pytest.mark.asyncio
+async def test_first_demand_fetches_once(coordinator):
+    """Test the lazy fetch on first demand, once per forecast slot."""
+    coordinator.data = {"forecast": {"dies": []}}
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        await coordinator.async_request_hourly_forecast()
+        await coordinator.async_request_hourly_forecast()
+
+    coordinator.api.get_hourly_forecast.assert_called_once_with("081131")
+    assert coordinator.data["forecast_hourly"] == {"dies": [{"data": "2026-10-19Z"}]}
+    assert coordinator.data["forecast"] == {"dies": []}
+
+
+@pytest.mark.asyncio
+async def test_demand_keeps_hourly_forecast_fresh_until_it_expires(coordinator):
+    """Test that refreshes fetch the hourly forecast only while demand lasts."""
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        await coordinator.async_request_hourly_forecast()
+        assert coordinator.hourly_forecast_wanted is True
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+               return_value=NOW + timedelta(hours=HOURLY_FORECAST_DEMAND_TTL - 1)):
+        assert coordinator.hourly_forecast_wanted is True
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+               return_value=NOW + timedelta(hours=HOURLY_FORECAST_DEMAND_TTL + 1)):
+        assert coordinator.hourly_forecast_wanted is False
+
+
+@pytest.mark.asyncio
+async def test_option_disabled_always_fetches(coordinator):
+    """Test that without the option the hourly forecast is fetched on every slot."""
+    coordinator.hourly_forecast_on_demand = False
+
+    await coordinator.async_request_hourly_forecast()
+    coordinator.api.get_hourly_forecast.assert_not_called()
+
+    data = await coordinator._async_update_data()
+    coordinator.api.get_hourly_forecast.assert_called_once()
+    assert data["forecast_hourly"] is not None
+
+
+@pytest.mark.asyncio
+async def test_weather_entity_reports_demand():
+    """Test that asking the weather entity for the hourly forecast records demand."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {CONF_STATION_NAME: "Granollers", CONF_STATION_CODE: "YM"}
+    entry.options = {}
+    coordinator = MagicMock()
+    coordinator.data = {"forecast_hourly": None}
+    coordinator.hourly_forecast_on_demand = True
+    coordinator.async_request_hourly_forecast = AsyncMock()
+
+    weather = MeteocatWeather(coordinator, entry)
+
+    assert await weather.async_forecast_hourly() is None
+    coordinator.async_request_hourly_forecast.assert_awaited_once()
@@ -0,0 +1,138 @@
+"""Tests for the location sensors of stations and municipalities.
+
+Altitude, coordinates and names never change after setup: the value is
+resolved when the entity is created and the entity does not listen to the
+coordinator, so a refresh does not fan out to them.
+"""
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.const import MODE_EXTERNAL, MODE_LOCAL
+from custom_components.meteocat_community_edition.sensor import (
+    LOCATION_SENSOR_TYPES,
+    MeteocatLocationSensor,
+    _get_location_sensor_types,
+)
+
+STATION_DATA = {"codi": "YM", "coordenades": {"latitud": 41.6126, "longitud": 2.2615}, "altitud": 95}
+LOCATION_DESCRIPTIONS = {description.key: description for description in LOCATION_SENSOR_TYPES}
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry with cached station metadata."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.data = {
+        "mode": MODE_EXTERNAL,
+        "station_code": "YM",
+        "comarca_name": "Vallès Oriental",
+        "_station_data": STATION_DATA,
+    }
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Create a mock coordinator without data."""
+    coordinator = MagicMock()
+    coordinator.data = {}
+    return coordinator
+
+
+def test_descriptions():
+    """Test that each location sensor has a unique key and one value source."""
+    assert len(LOCATION_DESCRIPTIONS) == len(LOCATION_SENSOR_TYPES) == 11
+    for description in LOCATION_SENSOR_TYPES:
+        assert (description.station_path is None) != (description.data_key is None)
+        assert description.station_path is None or description.station
+
+
+def test_optional_sensors_need_a_value(mock_entry):
+    """Test that optional sensors are only created with a value in the entry data."""
+    assert [description.key for description in _get_location_sensor_types(mock_entry, station=True)] == [
+        "altitude", "latitude", "longitude", "station_comarca_name",
+    ]
+
+    mock_entry.data = {"mode": MODE_LOCAL, "municipality_lat": 41.38, "provincia_name": ""}
+    assert [description.key for description in _get_location_sensor_types(mock_entry, station=False)] == [
+        "municipality_name", "comarca_name", "municipality_latitude",
+    ]
+
+
+def test_value_resolved_once(mock_coordinator, mock_entry):
+    """Test that the value is read at construction and not on state writes."""
+    sensor = MeteocatLocationSensor(
+        mock_coordinator, mock_entry, "Granollers YM", "Granollers YM", "YM",
+        LOCATION_DESCRIPTIONS["station_comarca_name"],
+    )
+    mock_entry.data = {}
+
+    assert sensor.native_value == "Vallès Oriental"
+    assert sensor.entity_id == "sensor.granollers_ym_comarca_name"
+    assert sensor.should_poll is False
+    assert sensor.device_info["model"] == "Estació XEMA"
+
+
+def test_municipality_sensor(mock_coordinator):
+    """Test a municipality sensor built from the table."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.data = {"mode": MODE_LOCAL, "municipality_lat": 41.38}
+
+    sensor = MeteocatLocationSensor(
+        mock_coordinator, entry, "Barcelona", "Barcelona", "080193", LOCATION_DESCRIPTIONS["municipality_latitude"]
+    )
+
+    assert sensor.native_value == 41.38
+    assert sensor.unique_id == "test_entry_municipality_latitude"
+    assert sensor.entity_id == "sensor.barcelona_municipality_latitude"
+    assert sensor.translation_key == "latitude"
+    assert sensor.device_info["model"] == "Predicció Municipi"
+
+
+@pytest.mark.asyncio
+async def test_no_listener_when_resolved(mock_coordinator, mock_entry):
+    """Test that resolved sensors do not subscribe to coordinator updates."""
+    sensor = MeteocatLocationSensor(
+        mock_coordinator, mock_entry, "Granollers YM", "Granollers YM", "YM", LOCATION_DESCRIPTIONS["altitude"]
+    )
+
+    await sensor.async_added_to_hass()
+
+    assert sensor.native_value == 95
+    mock_coordinator.async_add_listener.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_listens_until_station_metadata_fetched(mock_coordinator, mock_entry):
+    """Test that a sensor without station metadata waits for the first update only."""
+    mock_entry.data = {"mode": MODE_EXTERNAL, "station_code": "YM"}
+    remove_listener = MagicMock()
+    mock_coordinator.async_add_listener.return_value = remove_listener
+    sensor = MeteocatLocationSensor(
+        mock_coordinator, mock_entry, "Granollers YM", "Granollers YM", "YM", LOCATION_DESCRIPTIONS["latitude"]
+    )
+
+    await sensor.async_added_to_hass()
+    assert sensor.native_value is None
+    mock_coordinator.async_add_listener.assert_called_once()
+
+    with patch.object(sensor, "async_write_ha_state") as write_state:
+        # An update without station metadata keeps listening
+        sensor._handle_coordinator_update()
+        remove_listener.assert_not_called()
+
+        mock_coordinator.data = {"station": STATION_DATA}
+        sensor._handle_coordinator_update()
+
+    assert sensor.native_value == 41.6126
+    write_state.assert_called_once()
+    remove_listener.assert_called_once()
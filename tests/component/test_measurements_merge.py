@@ -0,0 +1,248 @@
+"""Tests for the rolling merge of measurements across UTC days.
+
+XEMA days are UTC days: right after midnight the day payload is nearly
+empty, so the previous day's tail is kept (and fetched once if needed)
+and readings are served as a rolling window keyed by timestamp.
+"""
+import sys
+import os
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.meteocat_community_edition.api import MeteocatAPIError
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_STATION_CODE,
+    MODE_EXTERNAL,
+)
+from custom_components.meteocat_community_edition.sensor import MeteocatXemaSensor
+from custom_components.meteocat_community_edition.utils import (
+    extract_readings,
+    merge_measurements,
+)
+
+
+def _measurements(day: date, hours: range, code: int = 32, value: float = 15.0):
+    """Build a XEMA payload with half-hourly readings."""
+    lectures = [
+        {"data": f"{day.isoformat()}T{hour:02d}:{minute:02d}Z", "valor": value, "estat": "V"}
+        for hour in hours
+        for minute in (0, 30)
+    ]
+    return [{"codi": "YM", "variables": [{"codi": code, "lectures": lectures}]}]
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+    }
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def coordinator(mock_hass, mock_entry):
+    """Create a coordinator with a mocked API."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api.get_station_measurements = AsyncMock()
+    return coordinator
+
+
+@pytest.fixture
+def madrid_time_zone():
+    """Use the local time zone of the XEMA stations."""
+    original = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(ZoneInfo("Europe/Madrid"))
+    yield
+    dt_util.set_default_time_zone(original)
+
+
+def test_merge_joins_days_by_timestamp():
+    """Test that consecutive days join without duplicates."""
+    previous = _measurements(date(2026, 10, 18), range(20, 24))
+    current = _measurements(date(2026, 10, 19), range(0, 1))
+    # The same day fetched again overlaps the previous payload
+    current[0]["variables"][0]["lectures"].insert(0, previous[0]["variables"][0]["lectures"][-1])
+
+    merged = merge_measurements(previous, current, 24)
+
+    lectures = merged[0]["variables"][0]["lectures"]
+    assert len(lectures) == 8 + 2
+    assert lectures[0]["data"] == "2026-10-18T20:00Z"
+    assert lectures[-1]["data"] == "2026-10-19T00:30Z"
+
+
+def test_merge_drops_readings_outside_window():
+    """Test that the window follows the newest reading."""
+    previous = _measurements(date(2026, 10, 18), range(0, 24))
+    current = _measurements(date(2026, 10, 19), range(0, 2))
+
+    merged = merge_measurements(previous, current, 6)
+
+    lectures = merged[0]["variables"][0]["lectures"]
+    assert lectures[0]["data"] == "2026-10-18T20:00Z"
+    assert len(lectures) == 12
+
+
+def test_merge_keeps_variables_and_current_values():
+    """Test that variables missing from the new payload are kept and values are updated."""
+    previous = _measurements(date(2026, 10, 19), range(0, 1), code=33, value=60.0)
+    previous[0]["variables"] += _measurements(date(2026, 10, 19), range(0, 1), value=10.0)[0]["variables"]
+    current = _measurements(date(2026, 10, 19), range(0, 1), value=11.0)
+
+    merged = merge_measurements(previous, current, 24)
+
+    variables = {variable["codi"]: variable for variable in merged[0]["variables"]}
+    assert len(variables[33]["lectures"]) == 2
+    assert [reading["valor"] for reading in variables[32]["lectures"]] == [11.0, 11.0]
+
+
+def test_merge_untimed_and_invalid_payloads():
+    """Test payloads without timestamps and non-list payloads."""
+    current = [{"codi": "YM", "variables": [{"codi": 32, "lectures": [{"valor": 15.5}]}]}]
+    previous = [{"codi": "YM", "variables": [{"codi": 32, "lectures": [{"valor": 14.0}]}]}]
+
+    merged = merge_measurements(previous, current, 24)
+
+    assert merged[0]["variables"][0]["lectures"] == [{"valor": 15.5}]
+    assert merge_measurements(previous, {"error": "x"}, 24) == {"error": "x"}
+    assert merge_measurements(None, current, 24) == current
+
+
+@pytest.mark.asyncio
+async def test_fetch_keeps_previous_tail(coordinator):
+    """Test that a known previous-day tail avoids an extra call."""
+    coordinator.history.add_readings(extract_readings(_measurements(date(2026, 10, 18), range(0, 24))))
+    coordinator.data = {"measurements": _measurements(date(2026, 10, 18), range(0, 24))}
+    coordinator.api.get_station_measurements.return_value = _measurements(date(2026, 10, 19), range(0, 1))
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+               return_value=datetime(2026, 10, 19, 1, 0, tzinfo=timezone.utc)):
+        measurements = await coordinator._async_fetch_measurements()
+
+    coordinator.api.get_station_measurements.assert_called_once_with("YM")
+    lectures = measurements[0]["variables"][0]["lectures"]
+    assert lectures[0]["data"] == "2026-10-18T01:00Z"
+    assert lectures[-1]["data"] == "2026-10-19T00:30Z"
+
+
+@pytest.mark.asyncio
+async def test_fetch_previous_day_when_tail_missing(coordinator):
+    """Test that the previous day is fetched when its last readings are unknown."""
+    coordinator.history.add_readings(extract_readings(_measurements(date(2026, 10, 18), range(0, 22))))
+
+    async def _get_day(station_code, day=None):
+        if day is None:
+            return _measurements(date(2026, 10, 19), range(0, 1))
+        return _measurements(day, range(0, 24))
+
+    coordinator.api.get_station_measurements.side_effect = _get_day
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+               return_value=datetime(2026, 10, 19, 1, 0, tzinfo=timezone.utc)):
+        measurements = await coordinator._async_fetch_measurements()
+
+    assert coordinator.api.get_station_measurements.call_args_list[1][0] == ("YM", date(2026, 10, 18))
+    assert len(measurements[0]["variables"][0]["lectures"]) == 48
+
+
+@pytest.mark.asyncio
+async def test_fetch_first_run_near_midnight(coordinator):
+    """Test that without history a nearly empty day payload is completed."""
+    coordinator.api.get_station_measurements.side_effect = [
+        _measurements(date(2026, 10, 19), range(0, 1)),
+        MeteocatAPIError("Server error", status=500),
+    ]
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+               return_value=datetime(2026, 10, 19, 1, 0, tzinfo=timezone.utc)):
+        measurements = await coordinator._async_fetch_measurements()
+
+    # The previous day failed: today's readings are still served
+    assert coordinator.api.get_station_measurements.call_count == 2
+    assert len(measurements[0]["variables"][0]["lectures"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_first_run_later_in_day(coordinator):
+    """Test that a day payload with enough readings needs no extra call."""
+    coordinator.api.get_station_measurements.return_value = _measurements(date(2026, 10, 19), range(0, 10))
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+               return_value=datetime(2026, 10, 19, 10, 15, tzinfo=timezone.utc)):
+        await coordinator._async_fetch_measurements()
+
+    coordinator.api.get_station_measurements.assert_called_once_with("YM")
+
+
+@pytest.mark.asyncio
+async def test_fetch_first_run_after_local_midnight(madrid_time_zone, mock_hass, mock_entry):
+    """Test that a restart fetches the readings of the local day before UTC midnight."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+
+    async def _get_day(station_code, day=None):
+        if day is None:
+            return _measurements(date(2026, 10, 19), range(0, 8), code=35, value=0.5)
+        return _measurements(day, range(0, 24), code=35, value=1.0)
+
+    coordinator.api.get_station_measurements = AsyncMock(side_effect=_get_day)
+
+    # 10:00 in Madrid (UTC+2): the local day started at 2026-10-18 22:00Z
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+               return_value=datetime(2026, 10, 19, 8, 0, tzinfo=timezone.utc)):
+        measurements = await coordinator._async_fetch_measurements()
+
+    assert coordinator.api.get_station_measurements.call_args_list[1][0] == ("YM", date(2026, 10, 18))
+
+    coordinator.data = {"measurements": measurements}
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.data = {CONF_STATION_CODE: "YM"}
+    sensor = MeteocatXemaSensor(coordinator, entry, "Precipitation", 35)
+    with patch("custom_components.meteocat_community_edition.sensor.dt_util.now",
+               return_value=datetime(2026, 10, 19, 10, 0, tzinfo=ZoneInfo("Europe/Madrid"))):
+        # 22:00Z-23:30Z (4 x 1.0) + 00:00Z-07:30Z (16 x 0.5)
+        assert sensor.native_value == 12.0
+
+
+def test_daily_precipitation_resets_at_local_midnight(madrid_time_zone):
+    """Test that only readings of the local day are summed."""
+    coordinator = MagicMock(spec=MeteocatCoordinator)
+    # 2026-10-18 22:00Z is midnight in Madrid (UTC+2)
+    coordinator.data = {"measurements": merge_measurements(
+        _measurements(date(2026, 10, 18), range(20, 24), code=35, value=1.0),
+        _measurements(date(2026, 10, 19), range(0, 1), code=35, value=0.5),
+        24,
+    )}
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.data = {CONF_STATION_CODE: "YM"}
+    sensor = MeteocatXemaSensor(coordinator, entry, "Precipitation", 35)
+
+    with patch("custom_components.meteocat_community_edition.sensor.dt_util.now",
+               return_value=datetime(2026, 10, 19, 3, 0, tzinfo=ZoneInfo("Europe/Madrid"))):
+        # 22:00Z-23:30Z (4 x 1.0) + 00:00Z-00:30Z (2 x 0.5)
+        assert sensor.native_value == 5.0
@@ -0,0 +1,254 @@
+"""Tests for multi-station entries.
+
+A multi-station entry monitors several XEMA stations (e.g. a whole comarca)
+with one coordinator: measurements are fetched once per variable for all
+stations and every station gets its own device.
+"""
+import sys
+import os
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.api import MeteocatAPIError
+from custom_components.meteocat_community_edition.config_flow import MeteocatConfigFlow
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_COMARCA_CODE,
+    CONF_COMARCA_NAME,
+    CONF_MODE,
+    CONF_STATION_CODES,
+    DOMAIN,
+    MODE_MULTI,
+    XEMA_VARIABLES,
+)
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatEstimatedDaysRemainingSensor,
+    MeteocatQuotaSensor,
+    MeteocatUpdateTimeSensor,
+    MeteocatXemaSensor,
+    async_setup_entry,
+)
+from custom_components.meteocat_community_edition.utils import calculate_update_plan
+
+STATIONS = ["YM", "CC", "X4"]
+
+
+def _variable_payload(variable_code, value=10.0):
+    """Build a XEMA variable payload with one reading per station."""
+    return [
+        {
+            "codi": code,
+            "variables": [{
+                "codi": variable_code,
+                "lectures": [{"data": "2026-10-19T10:00Z", "valor": value + index, "estat": "V"}],
+            }],
+        }
+        for index, code in enumerate(STATIONS + ["WU"])
+    ]
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock multi-station entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.title = "Vallès Oriental (3)"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_MULTI,
+        CONF_STATION_CODES: STATIONS,
+        CONF_COMARCA_CODE: "41",
+        CONF_COMARCA_NAME: "Vallès Oriental",
+        "_stations_data": {code: {"codi": code, "nom": f"Station {code}"} for code in STATIONS},
+    }
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def coordinator(mock_hass, mock_entry):
+    """Create a multi-station coordinator with a mocked API."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api.get_variable_measurements = AsyncMock(
+        side_effect=lambda code: _variable_payload(code)
+    )
+    coordinator.api.get_station_measurements = AsyncMock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_bulk_fetch_one_call_per_variable(coordinator):
+    """Test that calls scale with variables and readings are regrouped per station."""
+    measurements = await coordinator._async_fetch_multi_measurements()
+
+    assert coordinator.api.get_variable_measurements.call_count == len(XEMA_VARIABLES)
+    coordinator.api.get_station_measurements.assert_not_called()
+    # Only the selected stations are kept
+    assert [station["codi"] for station in measurements] == STATIONS
+    assert len(measurements[0]["variables"]) == len(XEMA_VARIABLES)
+
+
+@pytest.mark.asyncio
+async def test_bulk_fetch_partial_failure(coordinator):
+    """Test that a failed variable does not drop the others."""
+    def _fetch(code):
+        if code == 36:
+            raise MeteocatAPIError("Server error", status=500)
+        return _variable_payload(code)
+
+    coordinator.api.get_variable_measurements.side_effect = _fetch
+
+    measurements = await coordinator._async_fetch_multi_measurements()
+
+    assert len(measurements[0]["variables"]) == len(XEMA_VARIABLES) - 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_fetch_total_failure(coordinator):
+    """Test that the error is raised when every variable fails."""
+    coordinator.api.get_variable_measurements.side_effect = MeteocatAPIError("Server error", status=503)
+
+    with pytest.raises(MeteocatAPIError):
+        await coordinator._async_fetch_multi_measurements()
+
+
+@pytest.mark.asyncio
+async def test_refresh_uses_bulk_fetch(coordinator):
+    """Test a full refresh of a multi-station entry."""
+    coordinator.api.get_quotes = AsyncMock(return_value={"plans": []})
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dr.async_get"):
+        data = await coordinator._async_update_data()
+
+    assert len(data["measurements"]) == len(STATIONS)
+    assert coordinator.last_measurements_update is not None
+    # History and backfill track a single station only
+    assert coordinator.history.variables == []
+
+
+def test_station_index(coordinator):
+    """Test the per-station lookup of the shared snapshot."""
+    coordinator.data = {"measurements": [
+        {"codi": "YM", "variables": [{"codi": 32, "lectures": []}]},
+        {"codi": "CC", "variables": []},
+    ]}
+    assert coordinator.get_station_variables("YM") == [{"codi": 32, "lectures": []}]
+    assert coordinator.get_station_variables("ZZ") == []
+
+    # A new payload rebuilds the index
+    coordinator.data = {"measurements": [{"codi": "ZZ", "variables": [{"codi": 33}]}]}
+    assert coordinator.get_station_variables("ZZ") == [{"codi": 33}]
+    assert coordinator.get_station_variables("YM") == []
+
+
+def test_per_station_sensor(coordinator, mock_entry):
+    """Test that each station gets its own device and value."""
+    coordinator.data = {"measurements": [
+        {"codi": "YM", "variables": [{"codi": 32, "lectures": [{"data": "2026-10-19T10:00Z", "valor": 15.5}]}]},
+        {"codi": "CC", "variables": [{"codi": 32, "lectures": [{"data": "2026-10-19T10:00Z", "valor": 12.0}]}]},
+    ]}
+
+    sensor_ym = MeteocatXemaSensor(coordinator, mock_entry, "Station YM", 32, "YM")
+    sensor_cc = MeteocatXemaSensor(coordinator, mock_entry, "Station CC", 32, "CC")
+
+    assert sensor_ym.native_value == 15.5
+    assert sensor_cc.native_value == 12.0
+    assert sensor_ym.unique_id == "test_entry_id_ym_temperature"
+    assert sensor_ym.device_info["identifiers"] == {(DOMAIN, "test_entry_id_YM")}
+    assert sensor_ym.device_info["via_device"] == (DOMAIN, "test_entry_id")
+    assert sensor_ym.device_info["name"] == "Station YM YM"
+
+
+@pytest.mark.asyncio
+async def test_setup_creates_station_plan_sensors_only(coordinator, mock_hass, mock_entry):
+    """Test that forecast quota and update time sensors are not created."""
+    coordinator.data = {"quotes": {"plans": [
+        {"nom": "Prediccio_100", "consultesRestants": 990},
+        {"nom": "XEMA_75", "consultesRestants": 700},
+    ]}}
+    coordinator.update_time_3 = "14:00"
+    mock_hass.data = {DOMAIN: {mock_entry.entry_id: coordinator}}
+    entities = []
+
+    with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=MagicMock()):
+        await async_setup_entry(mock_hass, mock_entry, entities.extend)
+
+    quota = [entity for entity in entities if isinstance(entity, MeteocatQuotaSensor)]
+    assert [entity.unique_id for entity in quota] == [
+        "test_entry_id_quota_xema_75",
+        "test_entry_id_quota_dies_estimats_xema_75",
+    ]
+    assert quota[0].device_info["model"] == "Estacions XEMA"
+    assert not any(isinstance(entity, MeteocatUpdateTimeSensor) for entity in entities)
+
+
+def test_estimated_days_count_calls_per_variable(coordinator, mock_entry):
+    """Test that the XEMA estimate counts one call per variable and update."""
+    coordinator.data = {"quotes": {"plans": [{"nom": "XEMA_75", "consultesRestants": 960}]}}
+    sensor = MeteocatEstimatedDaysRemainingSensor(
+        coordinator, mock_entry, {"nom": "XEMA_75"}, "Vallès Oriental", "Vallès Oriental", MODE_MULTI
+    )
+
+    assert sensor._get_daily_consumption() == 24 * len(XEMA_VARIABLES)
+
+
+def test_quota_plan_counts_calls_per_variable():
+    """Test that the planner budgets one XEMA call per variable."""
+    now = datetime(2026, 10, 1, 0, 0, tzinfo=timezone.utc)
+    plans = [{"nom": "XEMA", "consultesRestants": 1488, "periode": "Mensual"}]
+
+    single = calculate_update_plan(plans, now)
+    multi = calculate_update_plan(plans, now, measurement_calls_per_update=len(XEMA_VARIABLES))
+
+    assert single["measurement_interval"] == 1
+    assert multi["measurement_interval"] == 4
+
+
+@pytest.mark.asyncio
+async def test_config_flow_stations_step():
+    """Test the station multi-select creates a single entry."""
+    flow = MeteocatConfigFlow()
+    flow.hass = MagicMock()
+    flow.api_key = "valid_key"
+    flow.mode = MODE_MULTI
+    flow.comarca_code = "41"
+    flow.comarca_name = "Vallès Oriental"
+    flow._stations = [{"codi": code, "nom": f"Station {code}"} for code in STATIONS]
+    flow.async_set_unique_id = AsyncMock()
+    flow._abort_if_unique_id_configured = MagicMock()
+
+    result = await flow.async_step_stations({CONF_STATION_CODES: ["YM", "CC"]})
+
+    assert result["type"] == "create_entry"
+    assert result["title"] == "Vallès Oriental (2)"
+    assert result["data"][CONF_MODE] == MODE_MULTI
+    assert result["data"][CONF_STATION_CODES] == ["CC", "YM"]
+    assert set(result["data"]["_stations_data"]) == {"CC", "YM"}
+    flow.async_set_unique_id.assert_called_once_with("multi_CC_YM")
+
+
+@pytest.mark.asyncio
+async def test_config_flow_stations_step_requires_selection():
+    """Test that an empty selection shows an error."""
+    flow = MeteocatConfigFlow()
+    flow.hass = MagicMock()
+    flow._stations = [{"codi": "YM", "nom": "Granollers"}]
+
+    result = await flow.async_step_stations({CONF_STATION_CODES: []})
+
+    assert result["type"] == "form"
+    assert result["errors"] == {"base": "no_stations_selected"}
@@ -16,6 +16,9 @@ from custom_components.meteocat_community_edition.const import (
     CONF_UPDATE_TIME_2,
     CONF_ENABLE_FORECAST_DAILY,
     CONF_ENABLE_FORECAST_HOURLY,
+    CONF_STALE_DATA_MAX_AGE,
+    CONF_STATION_CODES,
+    MODE_MULTI,
 )
 
 @pytest.mark.asyncio
@@ -72,3 +75,32 @@ async def test_options_flow_save(hass: HomeAssistant):
     assert result["type"] == FlowResultType.CREATE_ENTRY
     # Verify that API key is preserved in data (prevents corruption)
     assert entry.data[CONF_API_KEY] == "test_key"
+
+@pytest.mark.asyncio
+async def test_options_flow_multi_station_hides_forecast(hass: HomeAssistant):
+    """Test that multi-station entries are not offered forecast options."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_API_KEY: "test_key",
+            CONF_MODE: MODE_MULTI,
+            CONF_STATION_CODES: ["YM", "X4"],
+        },
+        options={}
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    assert result["type"] == FlowResultType.FORM
+    fields = {str(key) for key in result["data_schema"].schema}
+    assert CONF_UPDATE_TIME_1 not in fields
+    assert CONF_ENABLE_FORECAST_DAILY not in fields
+    assert CONF_ENABLE_FORECAST_HOURLY not in fields
+    assert CONF_STALE_DATA_MAX_AGE in fields
+
+    with patch("custom_components.meteocat_community_edition.async_setup_entry", return_value=True):
+        result = await hass.config_entries.options.async_configure(result["flow_id"], user_input={})
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert CONF_ENABLE_FORECAST_DAILY not in entry.options
@@ -0,0 +1,94 @@
+"""Tests for the rolling precipitation sensors of external stations."""
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.const import (
+    DOMAIN,
+    MODE_EXTERNAL,
+    PRECIPITATION_WINDOWS,
+)
+from custom_components.meteocat_community_edition.history import ReadingHistory
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatPrecipitationWindowSensor,
+    async_setup_entry,
+)
+
+START = datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.data = {"mode": MODE_EXTERNAL, "station_code": "YM", "station_name": "Granollers"}
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Create a mock coordinator with six hours of precipitation readings."""
+    coordinator = MagicMock()
+    coordinator.data = {"measurements": [{"codi": "YM", "variables": [{"codi": 35, "lectures": []}]}]}
+    coordinator.history = ReadingHistory(24, sum_windows={35: PRECIPITATION_WINDOWS})
+    coordinator.history.add_readings({35: [
+        (START + timedelta(minutes=30 * index), 0.2) for index in range(12)
+    ]})
+    return coordinator
+
+
+def test_window_values(mock_coordinator, mock_entry):
+    """Test the sum and the naming of each window."""
+    sensors = {
+        minutes: MeteocatPrecipitationWindowSensor(mock_coordinator, mock_entry, "Granollers", minutes)
+        for minutes in PRECIPITATION_WINDOWS
+    }
+
+    # Newest reading at 05:30, published an hour later
+    with patch("custom_components.meteocat_community_edition.sensor.dt_util.utcnow",
+               return_value=START + timedelta(hours=6, minutes=30)):
+        assert sensors[30].native_value == 0.2
+        assert sensors[60].native_value == 0.4
+        assert sensors[180].native_value == 1.2
+        # Six hours known: the 24-hour sum would be partial
+        assert sensors[1440].native_value is None
+
+    # The station stopped reporting
+    with patch("custom_components.meteocat_community_edition.sensor.dt_util.utcnow",
+               return_value=START + timedelta(hours=9)):
+        assert sensors[30].native_value is None
+        assert sensors[180].native_value == 0.2
+        assert sensors[1440].native_value is None
+
+    # A full day known
+    mock_coordinator.history.add_readings({35: [
+        (START - timedelta(hours=24) + timedelta(minutes=30 * index), 0.1) for index in range(48)
+    ]})
+    with patch("custom_components.meteocat_community_edition.sensor.dt_util.utcnow",
+               return_value=START + timedelta(hours=6, minutes=30)):
+        # 06:00-23:30 the day before (36 x 0.1) + 00:00-05:30 (12 x 0.2)
+        assert sensors[1440].native_value == 6.0
+    assert sensors[30].unique_id == "test_entry_precipitation_30m"
+    assert sensors[1440].translation_key == "precipitation_24h"
+
+
+@pytest.mark.asyncio
+async def test_created_when_station_reports_precipitation(mock_coordinator, mock_entry):
+    """Test that a sensor is created for each window."""
+    hass = MagicMock()
+    hass.data = {DOMAIN: {mock_entry.entry_id: mock_coordinator}}
+    entities = []
+
+    with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=MagicMock()):
+        await async_setup_entry(hass, mock_entry, entities.extend)
+
+    windows = [entity for entity in entities if isinstance(entity, MeteocatPrecipitationWindowSensor)]
+    assert len(windows) == len(PRECIPITATION_WINDOWS)
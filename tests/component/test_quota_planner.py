@@ -0,0 +1,169 @@
+"""Tests for the quota budget planner.
+
+The planner derives the measurement cadence and the forecast update times
+from the remaining quota of each plan, shared among the entries that use
+the same API key.
+"""
+import sys
+import os
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_MUNICIPALITY_CODE,
+    CONF_QUOTA_PLANNER,
+    CONF_STATION_CODE,
+    MODE_EXTERNAL,
+    MODE_LOCAL,
+)
+from custom_components.meteocat_community_edition.utils import (
+    calculate_update_plan,
+    get_planned_update_times,
+    get_quota_period_end,
+)
+
+NOW = datetime(2026, 10, 19, 10, 30, tzinfo=dt_util.UTC)
+
+
+def _plans(xema=None, prediccio=None, quota=None):
+    plans = []
+    if xema is not None:
+        plans.append({"nom": "XEMA_100", "consultesRestants": xema, "maxConsultes": 750, "periode": "mensual"})
+    if prediccio is not None:
+        plans.append({"nom": "Predicció_100", "consultesRestants": prediccio, "maxConsultes": 1000, "periode": "mensual"})
+    if quota is not None:
+        plans.append({"nom": "Quota", "consultesRestants": quota, "maxConsultes": 10000, "periode": "mensual"})
+    return plans
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.config_entries.async_entries.return_value = []
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry with the planner enabled."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+        "update_time_1": "06:00",
+        "update_time_2": "14:00",
+    }
+    entry.options = {CONF_QUOTA_PLANNER: True}
+    return entry
+
+
+def test_period_end_monthly():
+    """Test that a monthly period resets on the first day of next month."""
+    assert get_quota_period_end("mensual", datetime(2026, 12, 5, 8, 0)) == datetime(2027, 1, 1)
+    assert get_quota_period_end(None, datetime(2026, 2, 27, 8, 0)) == datetime(2026, 3, 1)
+
+
+def test_period_end_daily():
+    """Test that a daily period resets at midnight."""
+    assert get_quota_period_end("diari", datetime(2026, 5, 5, 8, 0)) == datetime(2026, 5, 6)
+
+
+def test_plan_hourly_when_quota_is_plentiful():
+    """Test that plenty of quota keeps hourly measurements."""
+    plan = calculate_update_plan(_plans(xema=5000, prediccio=1000, quota=10000), NOW)
+    assert plan["measurement_interval"] == 1
+    assert plan["forecast_updates_per_day"] >= 2
+
+
+def test_plan_slows_down_when_quota_is_scarce():
+    """Test that scarce XEMA quota stretches the measurement interval."""
+    # ~300 hours left in October, 100 calls -> one update every 4 hours
+    plan = calculate_update_plan(_plans(xema=100, quota=10000), NOW)
+    assert plan["measurement_interval"] == 4
+
+
+def test_plan_shares_quota_between_entries():
+    """Test that entries sharing the key split the budget."""
+    single = calculate_update_plan(_plans(xema=300, quota=10000), NOW, entries_sharing_key=1)
+    shared = calculate_update_plan(_plans(xema=300, quota=10000), NOW, entries_sharing_key=3)
+    assert shared["measurement_interval"] > single["measurement_interval"]
+
+
+def test_plan_exhausted_quota():
+    """Test the sparsest schedule when nothing is left."""
+    plan = calculate_update_plan(_plans(xema=0, prediccio=0, quota=0), NOW)
+    assert plan["measurement_interval"] == 24
+    assert plan["forecast_updates_per_day"] == 1
+
+
+def test_plan_forecast_calls_per_update():
+    """Test that daily + hourly forecast halves the forecast cadence."""
+    one = calculate_update_plan(_plans(prediccio=250), NOW, forecast_calls_per_update=1, fetch_measurements=False)
+    two = calculate_update_plan(_plans(prediccio=250), NOW, forecast_calls_per_update=2, fetch_measurements=False)
+    assert one["forecast_updates_per_day"] == 19
+    assert two["forecast_updates_per_day"] == 9
+
+
+def test_planned_update_times():
+    """Test that planned times are spread evenly from the anchor."""
+    assert get_planned_update_times("06:00", 2) == ["06:00", "18:00"]
+    assert get_planned_update_times("06:00", 4) == ["00:00", "06:00", "12:00", "18:00"]
+    assert get_planned_update_times("invalid", 1) == ["00:00"]
+    assert len(get_planned_update_times("06:00", 24)) == 24
+
+
+@pytest.mark.asyncio
+async def test_coordinator_replans_and_reschedules(mock_hass, mock_entry):
+    """Test that new quota data feeds the scheduler directly."""
+    with patch("custom_components.meteocat_community_edition.coordinator.async_track_point_in_utc_time") as mock_track, \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.now", return_value=NOW):
+        coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+        coordinator._schedule_next_update()
+        assert coordinator.next_scheduled_update.hour == 11
+
+        coordinator._update_quota_plan({"plans": _plans(xema=100, prediccio=27, quota=10000)})
+
+        assert coordinator.planned_measurement_interval == 4
+        assert coordinator.planned_forecast_times == ["06:00", "18:00"]
+        # Rescheduled with the new plan (cancelled the previous timer)
+        assert mock_track.call_count == 2
+        assert coordinator.next_scheduled_update.hour == 14
+
+
+@pytest.mark.asyncio
+async def test_coordinator_planner_disabled_keeps_configured_times(mock_hass, mock_entry):
+    """Test that without the planner the configured times are used."""
+    mock_entry.options = {}
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    assert coordinator.quota_planner is False
+    assert coordinator.get_forecast_update_times() == ["06:00", "14:00"]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_local_mode_plans_forecast_only(mock_hass, mock_entry):
+    """Test that local mode only plans forecast times."""
+    mock_entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_LOCAL,
+        CONF_MUNICIPALITY_CODE: "081131",
+    }
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.now", return_value=NOW):
+        coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+        coordinator._update_quota_plan({"plans": _plans(prediccio=250, quota=10000)})
+
+    assert coordinator.planned_measurement_interval is None
+    assert coordinator.get_forecast_update_times() == coordinator.planned_forecast_times
+    assert len(coordinator.planned_forecast_times) == 19
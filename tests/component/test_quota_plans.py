@@ -0,0 +1,97 @@
+"""Tests for the quota plan index of the coordinator.
+
+The plans of a quotes payload are indexed by name once, so quota sensors
+look their plan up instead of scanning the list on every state write.
+"""
+import sys
+import os
+import logging
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_STATION_CODE,
+    MODE_EXTERNAL,
+)
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.utils import index_quota_plans
+
+PLANS = [
+    {"nom": "Prediccio_100", "consultesRestants": 990},
+    {"nom": "XEMA_75", "consultesRestants": 700},
+]
+
+
+@pytest.fixture
+def coordinator():
+    """Create a coordinator holding a quotes payload."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.data = {CONF_API_KEY: "test_api_key", CONF_MODE: MODE_EXTERNAL, CONF_STATION_CODE: "YM"}
+    entry.options = {}
+    hass = MagicMock()
+    hass.data = {}
+    coordinator = MeteocatCoordinator(hass, entry)
+    coordinator.data = {"quotes": {"plans": PLANS}}
+    return coordinator
+
+
+def test_index_quota_plans():
+    """Test that plans are indexed by name and invalid entries skipped."""
+    index = index_quota_plans({"plans": [*PLANS, {"consultesRestants": 1}, "bad"]})
+
+    assert list(index) == ["Prediccio_100", "XEMA_75"]
+    assert index["XEMA_75"] is PLANS[1]
+    assert index_quota_plans(None) == {}
+    assert index_quota_plans([]) == {}
+    assert index_quota_plans({"plans": None}) == {}
+
+
+def test_index_built_once_per_payload(coordinator):
+    """Test that lookups reuse the index until a new payload arrives."""
+    with patch(
+        "custom_components.meteocat_community_edition.coordinator.index_quota_plans",
+        side_effect=index_quota_plans,
+    ) as index:
+        assert coordinator.get_quota_plan("XEMA_75")["consultesRestants"] == 700
+        assert coordinator.get_quota_plan("Prediccio_100")["consultesRestants"] == 990
+        assert coordinator.get_quota_plan("missing") is None
+        assert index.call_count == 1
+
+        coordinator.data = {"quotes": {"plans": [{"nom": "XEMA_75", "consultesRestants": 650}]}}
+        assert coordinator.get_quota_plan("XEMA_75")["consultesRestants"] == 650
+        assert index.call_count == 2
+
+
+def test_no_quotes(coordinator):
+    """Test lookups without data or after a failed quotes fetch."""
+    coordinator.get_quota_plan("XEMA_75")
+    coordinator.data = {"quotes": None}
+    assert coordinator.get_quota_plan("XEMA_75") is None
+
+    coordinator.data = None
+    assert coordinator.get_quota_plan("XEMA_75") is None
+
+
+def test_plan_change_logged(coordinator, caplog):
+    """Test that a removed or added plan is reported once."""
+    coordinator.get_quota_plan("XEMA_75")
+    caplog.clear()
+
+    with caplog.at_level(logging.WARNING):
+        # Same plans in a new payload: nothing to report
+        coordinator.data = {"quotes": {"plans": list(reversed(PLANS))}}
+        coordinator.get_quota_plan("XEMA_75")
+        assert not caplog.records
+
+        coordinator.data = {"quotes": {"plans": [PLANS[0], {"nom": "XEMA_200"}]}}
+        assert coordinator.get_quota_plan("XEMA_75") is None
+
+    assert len(caplog.records) == 1
+    assert "removed: XEMA_75, added: XEMA_200" in caplog.text
@@ -0,0 +1,224 @@
+"""Tests for refresh phase timing and diagnostics."""
+import sys
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    DOMAIN,
+    MODE_EXTERNAL,
+    REFRESH_TRACE_HISTORY,
+)
+from custom_components.meteocat_community_edition.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatRefreshDurationSensor,
+)
+from custom_components.meteocat_community_edition.timing import (
+    RefreshTrace,
+    RefreshTraces,
+)
+
+
+@pytest.fixture(autouse=True)
+def patch_device_registry():
+    """Patch device_registry for tests that call _async_update_data."""
+    with patch('custom_components.meteocat_community_edition.coordinator.dr.async_get') as mock_dr:
+        mock_dr.return_value.async_get_device.return_value = None
+        yield
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_api():
+    """Create a mock API client."""
+    api = MagicMock()
+    api.get_station_measurements = AsyncMock(return_value=[
+        {"codi": "YM", "variables": [{"codi": 32, "lectures": [{"valor": 15.5}]}]}
+    ])
+    api.get_stations = AsyncMock(return_value=[{"codi": "YM", "nom": "Granollers"}])
+    api.get_municipal_forecast = AsyncMock(return_value={"dies": []})
+    api.get_hourly_forecast = AsyncMock(return_value={})
+    api.find_municipality_for_station = AsyncMock(return_value="081131")
+    api.get_quotes = AsyncMock(return_value={"plans": []})
+    return api
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock config entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        "api_key": "test_api_key",
+        "mode": MODE_EXTERNAL,
+        "station_code": "YM",
+    }
+    entry.options = {}
+    return entry
+
+
+def _trace(total, **phases):
+    """Build a finished trace with fixed durations (seconds)."""
+    trace = RefreshTrace()
+    trace.phases = dict(phases)
+    trace.total = total
+    trace.success = True
+    return trace
+
+
+def test_trace_phase_accumulates():
+    """Test that a repeated phase adds up."""
+    trace = RefreshTrace()
+    with patch("custom_components.meteocat_community_edition.timing.time.monotonic", side_effect=[1.0, 1.5, 2.0, 2.25]):
+        with trace.phase("fetch"):
+            pass
+        with trace.phase("fetch"):
+            pass
+    assert trace.phases["fetch"] == 0.75
+
+
+def test_traces_keep_last_n_and_percentiles():
+    """Test the buffer size and p50/p95 per phase."""
+    traces = RefreshTraces(5)
+    for index in range(1, 8):
+        traces.append(_trace(index, fetch=index / 10))
+    assert len(traces) == 5
+    summary = traces.summary()
+    # Kept totals: 3..7 s
+    assert summary["total"] == {"p50": 5000.0, "p95": 7000.0}
+    assert summary["fetch"] == {"p50": 500.0, "p95": 700.0}
+    assert traces.as_list()[0]["total_ms"] == 3000.0
+
+
+@pytest.mark.asyncio
+async def test_refresh_records_phases(mock_hass, mock_api, mock_entry):
+    """Test that a refresh stores a trace with its phases."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api = mock_api
+    coordinator.refresh_traces = RefreshTraces(REFRESH_TRACE_HISTORY)
+
+    await coordinator._async_update_data()
+
+    trace = coordinator.refresh_traces.last
+    assert trace.success is True
+    assert trace.total is not None
+    for phase in ("station_lookup", "municipality_lookup", "fetch", "quotes", "validation", "events"):
+        assert phase in trace.phases
+
+    # Listener fan-out is added to the same trace
+    coordinator.async_update_listeners()
+    assert "listeners" in trace.phases
+
+
+@pytest.mark.asyncio
+async def test_total_includes_listener_fan_out(mock_hass, mock_api, mock_entry):
+    """Test that the total is stopped after the entities are updated."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api = mock_api
+    coordinator._listeners = {object(): (lambda: time.sleep(0.05), None)}
+
+    await coordinator._async_update_data()
+    fetched = coordinator.refresh_traces.last.total
+    coordinator.async_update_listeners()
+
+    trace = coordinator.refresh_traces.last
+    assert trace.phases["listeners"] >= 0.05
+    assert trace.total >= fetched + trace.phases["listeners"]
+    assert coordinator.refresh_traces.summary()["total"]["p50"] == round(trace.total * 1000, 1)
+
+
+@pytest.mark.asyncio
+async def test_trace_completed_without_listener_update(mock_hass, mock_api, mock_entry):
+    """Test that a refresh that does not update the listeners still completes its trace."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api = mock_api
+
+    async def _refresh(*args, **kwargs):
+        await coordinator._async_update_data()
+
+    with patch(
+        "custom_components.meteocat_community_edition.coordinator.DataUpdateCoordinator._async_refresh",
+        side_effect=_refresh,
+    ), patch("custom_components.meteocat_community_edition.coordinator.SLOW_REFRESH_THRESHOLD", 0), \
+         patch("custom_components.meteocat_community_edition.coordinator._LOGGER") as mock_logger:
+        await coordinator._async_refresh()
+
+    assert coordinator._listeners_trace is None
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_traced(mock_hass, mock_api, mock_entry):
+    """Test that failures are traced too."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api = mock_api
+    mock_api.get_stations.side_effect = ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await coordinator._async_update_data()
+
+    assert coordinator.refresh_traces.last.success is False
+
+
+@pytest.mark.asyncio
+async def test_slow_refresh_is_logged(mock_hass, mock_api, mock_entry, caplog):
+    """Test that slow refreshes are logged with their trace."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.api = mock_api
+
+    with patch("custom_components.meteocat_community_edition.coordinator.SLOW_REFRESH_THRESHOLD", 0):
+        await coordinator._async_update_data()
+        # Reported once the fan-out is timed too
+        assert "Slow refresh" not in caplog.text
+        coordinator.async_update_listeners()
+
+    assert "Slow refresh" in caplog.text
+    assert "fetch" in caplog.text
+    assert "listeners" in caplog.text
+
+
+def test_refresh_duration_sensor(mock_hass, mock_entry):
+    """Test the diagnostics sensor state and attributes."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    sensor = MeteocatRefreshDurationSensor(
+        coordinator, mock_entry, "Granollers", "Granollers YM", MODE_EXTERNAL, "YM"
+    )
+    assert sensor.native_value is None
+    assert sensor.extra_state_attributes == {}
+
+    coordinator.refresh_traces.append(_trace(1.2345, fetch=1.0))
+    assert sensor.native_value == 1234.5
+    attributes = sensor.extra_state_attributes
+    assert attributes["refreshes"] == 1
+    assert attributes["phases"]["fetch"]["p95"] == 1000.0
+    assert sensor.entity_id == "sensor.granollers_ym_refresh_duration"
+    assert set(attributes) <= MeteocatRefreshDurationSensor._unrecorded_attributes
+
+
+@pytest.mark.asyncio
+async def test_diagnostics(mock_hass, mock_entry):
+    """Test the diagnostics download redacts the API key and includes timings."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.refresh_traces.append(_trace(0.5, fetch=0.4))
+    mock_hass.data = {DOMAIN: {mock_entry.entry_id: coordinator}}
+
+    diagnostics = await async_get_config_entry_diagnostics(mock_hass, mock_entry)
+
+    assert diagnostics["entry"]["data"]["api_key"] == "**REDACTED**"
+    assert diagnostics["refresh_timing"]["phases"]["fetch"]["p50"] == 400.0
+    assert len(diagnostics["refresh_timing"]["traces"]) == 1
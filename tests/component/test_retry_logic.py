@@ -192,3 +192,60 @@ async def test_successful_request_no_retry(api_client, mock_session):
     
     assert result == {"data": "test"}
     assert mock_session.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_client_error_status_no_retry(api_client, mock_session):
+    """Test that 4xx responses fail at once with a typed status."""
+    mock_response = AsyncMock()
+    mock_response.status = 404
+    mock_response.headers = {}
+    mock_response.raise_for_status = MagicMock(side_effect=aiohttp.ClientResponseError(
+        request_info=MagicMock(),
+        history=(),
+        status=404
+    ))
+    mock_session.request.return_value.__aenter__.return_value = mock_response
+
+    with patch("asyncio.sleep") as mock_sleep:
+        with pytest.raises(MeteocatAPIError) as exc_info:
+            await api_client._request("GET", "/test")
+
+    assert exc_info.value.status == 404
+    assert mock_session.request.call_count == 1
+    assert not mock_sleep.called
+
+
+@pytest.mark.asyncio
+async def test_server_error_status_after_retries(api_client, mock_session):
+    """Test that 5xx responses are retried and keep their status."""
+    mock_response = AsyncMock()
+    mock_response.status = 503
+    mock_response.headers = {}
+    mock_response.raise_for_status = MagicMock(side_effect=aiohttp.ClientResponseError(
+        request_info=MagicMock(),
+        history=(),
+        status=503
+    ))
+    mock_session.request.return_value.__aenter__.return_value = mock_response
+
+    with patch("asyncio.sleep"):
+        with pytest.raises(MeteocatAPIError) as exc_info:
+            await api_client._request("GET", "/test")
+
+    assert exc_info.value.status == 503
+    assert mock_session.request.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_network_error_is_connection_error(api_client, mock_session):
+    """Test that network failures raise a connection error without status."""
+    from custom_components.meteocat_community_edition.api import MeteocatConnectionError
+
+    mock_session.request.return_value.__aenter__.side_effect = aiohttp.ClientError("Persistent error")
+
+    with patch("asyncio.sleep"):
+        with pytest.raises(MeteocatConnectionError) as exc_info:
+            await api_client._request("GET", "/test")
+
+    assert exc_info.value.status is None
@@ -15,12 +15,8 @@ from custom_components.meteocat_community_edition.sensor import (
     MeteocatLastUpdateSensor,
     MeteocatNextUpdateSensor,
     MeteocatUpdateTimeSensor,
-    MeteocatAltitudeSensor,
-    MeteocatLatitudeSensor,
-    MeteocatLongitudeSensor,
-    MeteocatMunicipalityNameSensor,
-    MeteocatComarcaNameSensor,
-    MeteocatProvinciaNameSensor,
+    LOCATION_SENSOR_TYPES,
+    MeteocatLocationSensor,
 )
 from custom_components.meteocat_community_edition.const import (
     DOMAIN,
@@ -28,6 +24,8 @@ from custom_components.meteocat_community_edition.const import (
     MODE_LOCAL,
 )
 
+LOCATION_DESCRIPTIONS = {description.key: description for description in LOCATION_SENSOR_TYPES}
+
 
 def _mock_platform(sensor):
     """Mock platform for sensor to allow name property access."""
@@ -462,12 +460,13 @@ def test_altitude_sensor(mock_coordinator, mock_entry):
         }
     }
     
-    sensor = MeteocatAltitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["altitude"],
     )
     
     assert sensor.native_value == 95
@@ -483,12 +482,13 @@ def test_altitude_sensor_no_data(mock_coordinator, mock_entry):
     """Test altitude sensor with no station data."""
     mock_coordinator.data = {}
     
-    sensor = MeteocatAltitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["altitude"],
     )
     
     assert sensor.native_value is None
@@ -508,12 +508,13 @@ def test_latitude_sensor(mock_coordinator, mock_entry):
         }
     }
     
-    sensor = MeteocatLatitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["latitude"],
     )
     
     assert sensor.native_value == 41.3851
@@ -527,12 +528,13 @@ def test_latitude_sensor_no_data(mock_coordinator, mock_entry):
     """Test latitude sensor with no station data."""
     mock_coordinator.data = {}
     
-    sensor = MeteocatLatitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["latitude"],
     )
     
     assert sensor.native_value is None
@@ -552,12 +554,13 @@ def test_longitude_sensor(mock_coordinator, mock_entry):
         }
     }
     
-    sensor = MeteocatLongitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["longitude"],
     )
     
     assert sensor.native_value == 2.1734
@@ -571,12 +574,13 @@ def test_longitude_sensor_no_data(mock_coordinator, mock_entry):
     """Test longitude sensor with no station data."""
     mock_coordinator.data = {}
     
-    sensor = MeteocatLongitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["longitude"],
     )
     
     assert sensor.native_value is None
@@ -595,12 +599,13 @@ def test_municipality_name_sensor(mock_coordinator, mock_entry):
         "comarca_name": "Barcelonès",
     }
     
-    sensor = MeteocatMunicipalityNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["municipality_name"],
     )
     
     assert sensor.native_value == "Barcelona"
@@ -618,12 +623,13 @@ def test_municipality_name_sensor_no_data(mock_coordinator, mock_entry):
         "municipality_code": "080193",
     }
     
-    sensor = MeteocatMunicipalityNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["municipality_name"],
     )
     
     # Should return empty string when municipality_name is not in config
@@ -642,12 +648,13 @@ def test_comarca_name_sensor(mock_coordinator, mock_entry):
         "comarca_name": "Barcelonès",
     }
     
-    sensor = MeteocatComarcaNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["comarca_name"],
     )
     
     assert sensor.native_value == "Barcelonès"
@@ -666,12 +673,13 @@ def test_comarca_name_sensor_no_data(mock_coordinator, mock_entry):
         "municipality_code": "080193",
     }
     
-    sensor = MeteocatComarcaNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["comarca_name"],
     )
     
     # Should return empty string when comarca_name is not in config
@@ -683,7 +691,6 @@ def test_comarca_name_sensor_no_data(mock_coordinator, mock_entry):
 
 def test_station_comarca_name_sensor():
     """Test station comarca name sensor."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatStationComarcaNameSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -696,12 +703,13 @@ def test_station_comarca_name_sensor():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatStationComarcaNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["station_comarca_name"],
     )
     
     assert sensor.native_value == "Vallès Oriental"
@@ -710,7 +718,6 @@ def test_station_comarca_name_sensor():
 
 def test_station_comarca_name_sensor_no_data():
     """Test station comarca name sensor with no data."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatStationComarcaNameSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -724,12 +731,13 @@ def test_station_comarca_name_sensor_no_data():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatStationComarcaNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["station_comarca_name"],
     )
     
     assert sensor.native_value == ""
@@ -738,7 +746,6 @@ def test_station_comarca_name_sensor_no_data():
 
 def test_station_municipality_name_sensor():
     """Test station municipality name sensor."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatStationMunicipalityNameSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -751,12 +758,13 @@ def test_station_municipality_name_sensor():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatStationMunicipalityNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["station_municipality_name"],
     )
     
     assert sensor.native_value == "Granollers"
@@ -765,7 +773,6 @@ def test_station_municipality_name_sensor():
 
 def test_station_municipality_name_sensor_no_data():
     """Test station municipality name sensor with no data."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatStationMunicipalityNameSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -779,12 +786,13 @@ def test_station_municipality_name_sensor_no_data():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatStationMunicipalityNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["station_municipality_name"],
     )
     
     assert sensor.native_value == ""
@@ -793,7 +801,6 @@ def test_station_municipality_name_sensor_no_data():
 
 def test_station_provincia_name_sensor():
     """Test station province name sensor."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatStationProvinciaNameSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -806,12 +813,13 @@ def test_station_provincia_name_sensor():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatStationProvinciaNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["station_provincia_name"],
     )
     
     assert sensor.native_value == "Barcelona"
@@ -820,7 +828,6 @@ def test_station_provincia_name_sensor():
 
 def test_station_provincia_name_sensor_no_data():
     """Test station province name sensor with no data."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatStationProvinciaNameSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -834,12 +841,13 @@ def test_station_provincia_name_sensor_no_data():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatStationProvinciaNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["station_provincia_name"],
     )
     
     assert sensor.native_value == ""
@@ -850,7 +858,6 @@ def test_station_provincia_name_sensor_no_data():
 
 def test_municipality_latitude_sensor():
     """Test municipality latitude sensor."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatMunicipalityLatitudeSensor
     from unittest.mock import MagicMock
     from homeassistant.helpers.entity import EntityCategory
     
@@ -864,12 +871,13 @@ def test_municipality_latitude_sensor():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatMunicipalityLatitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["municipality_latitude"],
     )
     
     assert sensor.native_value == 41.6
@@ -880,7 +888,6 @@ def test_municipality_latitude_sensor():
 
 def test_municipality_longitude_sensor():
     """Test municipality longitude sensor."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatMunicipalityLongitudeSensor
     from unittest.mock import MagicMock
     from homeassistant.helpers.entity import EntityCategory
     
@@ -894,12 +901,13 @@ def test_municipality_longitude_sensor():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatMunicipalityLongitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["municipality_longitude"],
     )
     
     assert sensor.native_value == 2.3
@@ -910,7 +918,6 @@ def test_municipality_longitude_sensor():
 
 def test_municipality_latitude_sensor_no_data():
     """Test municipality latitude sensor with no data."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatMunicipalityLatitudeSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -923,12 +930,13 @@ def test_municipality_latitude_sensor_no_data():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatMunicipalityLatitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["municipality_latitude"],
     )
     
     assert sensor.native_value is None
@@ -937,7 +945,6 @@ def test_municipality_latitude_sensor_no_data():
 
 def test_municipality_longitude_sensor_no_data():
     """Test municipality longitude sensor with no data."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatMunicipalityLongitudeSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -950,12 +957,13 @@ def test_municipality_longitude_sensor_no_data():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatMunicipalityLongitudeSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["municipality_longitude"],
     )
     
     assert sensor.native_value is None
@@ -964,7 +972,6 @@ def test_municipality_longitude_sensor_no_data():
 
 def test_municipality_provincia_name_sensor():
     """Test municipality province name sensor."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatProvinciaNameSensor
     from unittest.mock import MagicMock
     from homeassistant.helpers.entity import EntityCategory
     
@@ -978,12 +985,13 @@ def test_municipality_provincia_name_sensor():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatProvinciaNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["provincia_name"],
     )
     
     assert sensor.native_value == "Barcelona"
@@ -993,11 +1001,6 @@ def test_municipality_provincia_name_sensor():
 
 def test_coordinate_sensors_read_from_entry_data_cache():
     """Test that coordinate sensors read from entry.data._station_data when coordinator.data is empty."""
-    from custom_components.meteocat_community_edition.sensor import (
-        MeteocatLatitudeSensor,
-        MeteocatLongitudeSensor,
-        MeteocatAltitudeSensor,
-    )
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -1019,43 +1022,41 @@ def test_coordinate_sensors_read_from_entry_data_cache():
     mock_entry.options = {}
     
     # Test latitude sensor
-    lat_sensor = MeteocatLatitudeSensor(
+    lat_sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["latitude"],
     )
     assert lat_sensor.native_value == 41.6126
     
     # Test longitude sensor
-    lon_sensor = MeteocatLongitudeSensor(
+    lon_sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["longitude"],
     )
     assert lon_sensor.native_value == 2.2615
     
     # Test altitude sensor
-    alt_sensor = MeteocatAltitudeSensor(
+    alt_sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["altitude"],
     )
     assert alt_sensor.native_value == 95
 
 
 def test_coordinate_sensors_prefer_coordinator_data_over_cache():
     """Test that coordinate sensors prefer coordinator.data over entry.data cache when available."""
-    from custom_components.meteocat_community_edition.sensor import (
-        MeteocatLatitudeSensor,
-        MeteocatLongitudeSensor,
-        MeteocatAltitudeSensor,
-    )
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -1086,37 +1087,39 @@ def test_coordinate_sensors_prefer_coordinator_data_over_cache():
     mock_entry.options = {}
     
     # Sensors should use coordinator.data (fresh data) not cache
-    lat_sensor = MeteocatLatitudeSensor(
+    lat_sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["latitude"],
     )
     assert lat_sensor.native_value == 41.9999
     
-    lon_sensor = MeteocatLongitudeSensor(
+    lon_sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["longitude"],
     )
     assert lon_sensor.native_value == 2.9999
     
-    alt_sensor = MeteocatAltitudeSensor(
+    alt_sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Granollers",
         "Granollers YM",
-        "YM"
+        "YM",
+        LOCATION_DESCRIPTIONS["altitude"],
     )
     assert alt_sensor.native_value == 999
 
 
 def test_municipality_provincia_name_sensor_no_data():
     """Test municipality province name sensor with no data."""
-    from custom_components.meteocat_community_edition.sensor import MeteocatProvinciaNameSensor
     from unittest.mock import MagicMock
     
     mock_coordinator = MagicMock()
@@ -1129,12 +1132,13 @@ def test_municipality_provincia_name_sensor_no_data():
     }
     mock_entry.options = {}
     
-    sensor = MeteocatProvinciaNameSensor(
+    sensor = MeteocatLocationSensor(
         mock_coordinator,
         mock_entry,
         "Barcelona",
         "Barcelona",
-        "080193"
+        "080193",
+        LOCATION_DESCRIPTIONS["provincia_name"],
     )
     
     # Should return empty string when provincia_name is not in config
@@ -6,19 +6,13 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.meteocat_community_edition.button import MeteocatRefreshForecastButton
 from custom_components.meteocat_community_edition.sensor import (
-    MeteocatMunicipalityNameSensor,
-    MeteocatComarcaNameSensor,
-    MeteocatMunicipalityLatitudeSensor,
-    MeteocatMunicipalityLongitudeSensor,
-    MeteocatProvinciaNameSensor,
-    MeteocatStationComarcaNameSensor,
-    MeteocatStationMunicipalityNameSensor,
-    MeteocatStationProvinciaNameSensor,
     MeteocatLastUpdateSensor,
     MeteocatNextUpdateSensor,
     MeteocatUpdateTimeSensor,
     MeteocatNextForecastUpdateSensor,
     MeteocatLastForecastUpdateSensor,
+    LOCATION_SENSOR_TYPES,
+    MeteocatLocationSensor,
 )
 from custom_components.meteocat_community_edition.const import (
     CONF_MUNICIPALITY_NAME,
@@ -27,6 +21,8 @@ from custom_components.meteocat_community_edition.const import (
     MODE_EXTERNAL,
 )
 
+LOCATION_DESCRIPTIONS = {description.key: description for description in LOCATION_SENSOR_TYPES}
+
 @pytest.fixture
 def mock_coordinator():
     """Create a mock coordinator with failed update."""
@@ -79,82 +75,90 @@ async def test_location_sensors_available_on_error(hass: HomeAssistant, mock_coo
     }
     
     # Municipality Sensor
-    municipality_sensor = MeteocatMunicipalityNameSensor(
+    municipality_sensor = MeteocatLocationSensor(
         mock_coordinator,
         entry,
         "Test Entity",
         "Test Device",
-        "08001"
+        "08001",
+        LOCATION_DESCRIPTIONS["municipality_name"],
     )
     municipality_sensor.hass = hass
     
     # Comarca Sensor
-    comarca_sensor = MeteocatComarcaNameSensor(
+    comarca_sensor = MeteocatLocationSensor(
         mock_coordinator,
         entry,
         "Test Entity",
         "Test Device",
-        "13"
+        "13",
+        LOCATION_DESCRIPTIONS["comarca_name"],
     )
     comarca_sensor.hass = hass
 
     # Latitude Sensor
-    lat_sensor = MeteocatMunicipalityLatitudeSensor(
+    lat_sensor = MeteocatLocationSensor(
         mock_coordinator,
         entry,
         "Test Entity",
         "Test Device",
-        "08001"
+        "08001",
+        LOCATION_DESCRIPTIONS["municipality_latitude"],
     )
     lat_sensor.hass = hass
 
     # Longitude Sensor
-    lon_sensor = MeteocatMunicipalityLongitudeSensor(
+    lon_sensor = MeteocatLocationSensor(
         mock_coordinator,
         entry,
         "Test Entity",
         "Test Device",
-        "08001"
+        "08001",
+        LOCATION_DESCRIPTIONS["municipality_longitude"],
     )
     lon_sensor.hass = hass
 
     # Provincia Sensor
-    prov_sensor = MeteocatProvinciaNameSensor(
+    prov_sensor = MeteocatLocationSensor(
         mock_coordinator,
         entry,
         "Test Entity",
         "Test Device",
-        "08001"
+        "08001",
+        LOCATION_DESCRIPTIONS["provincia_name"],
     )
     prov_sensor.hass = hass
 
     # Station Comarca Sensor
-    station_comarca_sensor = MeteocatStationComarcaNameSensor(
+    station_comarca_sensor = MeteocatLocationSensor(
         mock_coordinator,
         entry,
         "Test Entity",
         "Test Device",
-        "X4"
+        "X4",
+        LOCATION_DESCRIPTIONS["station_comarca_name"],
     )
     station_comarca_sensor.hass = hass
 
     # Station Municipality Sensor
-    station_mun_sensor = MeteocatStationMunicipalityNameSensor(
+    station_mun_sensor = MeteocatLocationSensor(
         mock_coordinator,
         entry,
         "Test Entity",
         "Test Device",
-        "X4"
+        "X4",
+        LOCATION_DESCRIPTIONS["station_municipality_name"],
     )
     station_mun_sensor.hass = hass
 
     # Station Provincia Sensor
-    station_prov_sensor = MeteocatStationProvinciaNameSensor(
+    station_prov_sensor = MeteocatLocationSensor(
         mock_coordinator,
         entry,
         "Test Entity",
         "Test Device",
-        "X4"
+        "X4",
+        LOCATION_DESCRIPTIONS["station_provincia_name"],
     )
     station_prov_sensor.hass = hass
     
@@ -1,4 +1,5 @@
 """Tests to ensure 100% coverage in sensor.py."""
+import functools
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from homeassistant.const import CONF_API_KEY
@@ -30,6 +31,11 @@ def mock_coordinator_full(hass):
     """Return a mocked coordinator with full data structure."""
     coordinator = MagicMock(spec=MeteocatCoordinator)
     coordinator.hass = hass
+    coordinator.name = "Meteocat"
+    coordinator._quota_plans = {}
+    coordinator._quota_plans_source = None
+    coordinator._quota_plan_names = frozenset()
+    coordinator.get_quota_plan = functools.partial(MeteocatCoordinator.get_quota_plan, coordinator)
     coordinator.data = {
         "quotes": {
             "plans": [
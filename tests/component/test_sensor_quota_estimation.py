@@ -1,6 +1,7 @@
 """Tests for Meteocat quota estimation sensors."""
 import sys
 import os
+import functools
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
@@ -8,6 +9,7 @@ from unittest.mock import MagicMock
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 import pytest
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
 from custom_components.meteocat_community_edition.sensor import (
     MeteocatEstimatedDaysRemainingSensor,
 )
@@ -28,6 +30,10 @@ except ImportError:
 def mock_coordinator():
     """Create a mock coordinator."""
     coordinator = MagicMock()
+    coordinator._quota_plans = {}
+    coordinator._quota_plans_source = None
+    coordinator._quota_plan_names = frozenset()
+    coordinator.get_quota_plan = functools.partial(MeteocatCoordinator.get_quota_plan, coordinator)
     coordinator.data = {
         "quotes": {
             "plans": [
@@ -105,15 +105,67 @@ async def test_async_setup_registry_enable_entities(hass):
     
     mock_entity = MagicMock()
     mock_entity.config_entry_id = entry.entry_id
+    mock_entity.domain = "sensor"
     mock_entity.disabled = True
     mock_entity.unique_id = "some_unique_id_municipality_name"
     mock_entity.entity_id = "sensor.test"
     
     mock_registry = MagicMock()
-    mock_registry.entities = {"sensor.test": mock_entity}
     mock_registry.async_update_entity = MagicMock()
     
-    with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=mock_registry):
+    with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=mock_registry), \
+         patch(
+             "custom_components.meteocat_community_edition.sensor.er.async_entries_for_config_entry",
+             return_value=[mock_entity],
+         ) as mock_entries:
         await async_setup_entry(hass, entry, async_add_entities)
         
         mock_registry.async_update_entity.assert_called_with("sensor.test", disabled_by=None)
+        mock_entries.assert_called_once_with(mock_registry, entry.entry_id)
+        # Only the entries of this config entry are read
+        mock_registry.entities.values.assert_not_called()
+
+
+def _registry_entity(entry_id, unique_id, disabled=False):
+    """Create a registry entry of a sensor."""
+    entity = MagicMock()
+    entity.config_entry_id = entry_id
+    entity.domain = "sensor"
+    entity.disabled = disabled
+    entity.unique_id = unique_id
+    entity.entity_id = f"sensor.{unique_id}"
+    return entity
+
+
+async def test_async_setup_registry_single_pass(hass):
+    """Test that unsupported forecast sensors are removed in the same pass."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_pass"
+    entry.data = {CONF_MODE: MODE_LOCAL}
+
+    coordinator = MagicMock()
+    coordinator.data = {}
+    coordinator.enable_forecast_hourly = False
+    coordinator.enable_forecast_daily = True
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    entities = [
+        _registry_entity(entry.entry_id, "test_entry_pass_forecast_hourly"),
+        _registry_entity(entry.entry_id, "test_entry_pass_forecast_daily"),
+        _registry_entity(entry.entry_id, "test_entry_pass_update_time_1", disabled=True),
+        _registry_entity(entry.entry_id, "test_entry_pass_quota_prediccio", disabled=True),
+    ]
+    mock_registry = MagicMock()
+
+    with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=mock_registry), \
+         patch(
+             "custom_components.meteocat_community_edition.sensor.er.async_entries_for_config_entry",
+             return_value=entities,
+         ) as mock_entries:
+        await async_setup_entry(hass, entry, MagicMock())
+
+    mock_entries.assert_called_once()
+    mock_registry.async_remove.assert_called_once_with("sensor.test_entry_pass_forecast_hourly")
+    mock_registry.async_update_entity.assert_called_once_with(
+        "sensor.test_entry_pass_update_time_1", disabled_by=None
+    )
@@ -13,7 +13,7 @@ from custom_components.meteocat_community_edition.const import (
     MODE_EXTERNAL,
     MODE_LOCAL,
 )
-from custom_components.meteocat_community_edition.sensor import async_setup_entry
+from custom_components.meteocat_community_edition.sensor import MeteocatLocationSensor, async_setup_entry
 
 
 @pytest.fixture
@@ -71,17 +71,21 @@ async def test_external_mode_creates_all_geographic_sensors_when_data_available(
         await async_setup_entry(mock_hass, entry, mock_add_entities)
     
     # Verify all geographic sensors were created
-    sensor_classes = [type(entity).__name__ for entity in entities_added]
+    location_keys = [
+        entity.entity_description.key
+        for entity in entities_added
+        if isinstance(entity, MeteocatLocationSensor)
+    ]
     
     # Should have comarca (always), municipality (conditional), and provincia (conditional)
-    assert "MeteocatStationComarcaNameSensor" in sensor_classes
-    assert "MeteocatStationMunicipalityNameSensor" in sensor_classes
-    assert "MeteocatStationProvinciaNameSensor" in sensor_classes
+    assert "station_comarca_name" in location_keys
+    assert "station_municipality_name" in location_keys
+    assert "station_provincia_name" in location_keys
     
     # Should also have coordinate sensors
-    assert "MeteocatAltitudeSensor" in sensor_classes
-    assert "MeteocatLatitudeSensor" in sensor_classes
-    assert "MeteocatLongitudeSensor" in sensor_classes
+    assert "altitude" in location_keys
+    assert "latitude" in location_keys
+    assert "longitude" in location_keys
 
 
 @pytest.mark.asyncio
@@ -110,14 +114,18 @@ async def test_external_mode_skips_municipality_when_not_available(mock_hass, mo
     with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=MagicMock()):
         await async_setup_entry(mock_hass, entry, mock_add_entities)
     
-    sensor_classes = [type(entity).__name__ for entity in entities_added]
+    location_keys = [
+        entity.entity_description.key
+        for entity in entities_added
+        if isinstance(entity, MeteocatLocationSensor)
+    ]
     
     # Should have comarca (always)
-    assert "MeteocatStationComarcaNameSensor" in sensor_classes
+    assert "station_comarca_name" in location_keys
     
     # Should NOT have municipality or provincia
-    assert "MeteocatStationMunicipalityNameSensor" not in sensor_classes
-    assert "MeteocatStationProvinciaNameSensor" not in sensor_classes
+    assert "station_municipality_name" not in location_keys
+    assert "station_provincia_name" not in location_keys
 
 
 @pytest.mark.asyncio
@@ -147,18 +155,22 @@ async def test_local_mode_creates_all_sensors_when_data_available(mock_hass, moc
     
     await async_setup_entry(mock_hass, entry, mock_add_entities)
     
-    sensor_classes = [type(entity).__name__ for entity in entities_added]
+    location_keys = [
+        entity.entity_description.key
+        for entity in entities_added
+        if isinstance(entity, MeteocatLocationSensor)
+    ]
     
     # Should have municipality and comarca (always)
-    assert "MeteocatMunicipalityNameSensor" in sensor_classes
-    assert "MeteocatComarcaNameSensor" in sensor_classes
+    assert "municipality_name" in location_keys
+    assert "comarca_name" in location_keys
     
     # Should have coordinates (conditional)
-    assert "MeteocatMunicipalityLatitudeSensor" in sensor_classes
-    assert "MeteocatMunicipalityLongitudeSensor" in sensor_classes
+    assert "municipality_latitude" in location_keys
+    assert "municipality_longitude" in location_keys
     
     # Should have provincia (conditional)
-    assert "MeteocatProvinciaNameSensor" in sensor_classes
+    assert "provincia_name" in location_keys
 
 
 @pytest.mark.asyncio
@@ -185,16 +197,20 @@ async def test_local_mode_skips_coordinates_when_not_available(mock_hass, mock_c
     
     await async_setup_entry(mock_hass, entry, mock_add_entities)
     
-    sensor_classes = [type(entity).__name__ for entity in entities_added]
+    location_keys = [
+        entity.entity_description.key
+        for entity in entities_added
+        if isinstance(entity, MeteocatLocationSensor)
+    ]
     
     # Should have municipality and comarca (always)
-    assert "MeteocatMunicipalityNameSensor" in sensor_classes
-    assert "MeteocatComarcaNameSensor" in sensor_classes
+    assert "municipality_name" in location_keys
+    assert "comarca_name" in location_keys
     
     # Should NOT have coordinates or provincia
-    assert "MeteocatMunicipalityLatitudeSensor" not in sensor_classes
-    assert "MeteocatMunicipalityLongitudeSensor" not in sensor_classes
-    assert "MeteocatProvinciaNameSensor" not in sensor_classes
+    assert "municipality_latitude" not in location_keys
+    assert "municipality_longitude" not in location_keys
+    assert "provincia_name" not in location_keys
 
 
 @pytest.mark.asyncio
@@ -222,10 +238,14 @@ async def test_local_mode_creates_lat_without_lon(mock_hass, mock_coordinator):
     
     await async_setup_entry(mock_hass, entry, mock_add_entities)
     
-    sensor_classes = [type(entity).__name__ for entity in entities_added]
+    location_keys = [
+        entity.entity_description.key
+        for entity in entities_added
+        if isinstance(entity, MeteocatLocationSensor)
+    ]
     
     # Should have latitude
-    assert "MeteocatMunicipalityLatitudeSensor" in sensor_classes
+    assert "municipality_latitude" in location_keys
     
     # Should NOT have longitude
-    assert "MeteocatMunicipalityLongitudeSensor" not in sensor_classes
+    assert "municipality_longitude" not in location_keys
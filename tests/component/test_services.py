@@ -0,0 +1,124 @@
+"""Tests for the services and the attributes kept out of the recorder.
+
+Bulky and diagnostic attributes are unrecorded; get_forecast and
+get_quotes return the full data from the last update instead.
+"""
+import sys
+import os
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.meteocat_community_edition import async_setup
+from custom_components.meteocat_community_edition.binary_sensor import MeteocatUpdateStatusBinarySensor
+from custom_components.meteocat_community_edition.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_FORECAST_TYPE,
+    DOMAIN,
+    SERVICE_GET_FORECAST,
+    SERVICE_GET_QUOTES,
+)
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatEstimatedDaysRemainingSensor,
+    MeteocatForecastSensor,
+    MeteocatQuotaSensor,
+    MeteocatXemaSensor,
+)
+
+PLANS = [{"nom": "Prediccio_100", "maxConsultes": 1000, "consultesRealitzades": 10,
+          "consultesRestants": 990, "periode": "Mensual"}]
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance with one loaded entry."""
+    hass = MagicMock()
+    coordinator = MagicMock()
+    coordinator.data = {
+        "forecast": {"dies": [{"data": "2026-10-19Z", "variables": {
+            "tmin": {"valor": 8}, "tmax": {"valor": 19}, "estatCel": {"valor": 1},
+        }}]},
+        "forecast_hourly": None,
+        "quotes": {"plans": PLANS},
+    }
+    coordinator.last_successful_update_time = datetime(2026, 10, 19, 6, 0, tzinfo=timezone.utc)
+    coordinator.async_request_hourly_forecast = AsyncMock()
+    hass.data = {DOMAIN: {"entry_id": coordinator}}
+    return hass
+
+
+async def _services(hass):
+    """Set up the integration and return the registered service handlers."""
+    assert await async_setup(hass, {}) is True
+    handlers = {}
+    for call in hass.services.async_register.call_args_list:
+        assert call.args[0] == DOMAIN
+        assert call.kwargs["supports_response"] is SupportsResponse.ONLY
+        handlers[call.args[1]] = call.args[2]
+    return handlers
+
+
+def _call(**data):
+    """Create a service call."""
+    call = MagicMock()
+    call.data = data
+    return call
+
+
+@pytest.mark.asyncio
+async def test_get_forecast(mock_hass):
+    """Test that the forecast is returned in HA format from the last update."""
+    handlers = await _services(mock_hass)
+
+    response = await handlers[SERVICE_GET_FORECAST](
+        _call(**{ATTR_CONFIG_ENTRY_ID: "entry_id", ATTR_FORECAST_TYPE: "daily"})
+    )
+
+    assert response == {
+        "forecast": [{"datetime": "2026-10-19Z", "templow": 8.0, "temperature": 19.0, "condition": "sunny"}],
+        "fetched_at": "2026-10-19T06:00:00+00:00",
+    }
+    coordinator = mock_hass.data[DOMAIN]["entry_id"]
+    coordinator.async_request_hourly_forecast.assert_not_awaited()
+    hourly = await handlers[SERVICE_GET_FORECAST](
+        _call(**{ATTR_CONFIG_ENTRY_ID: "entry_id", ATTR_FORECAST_TYPE: "hourly"})
+    )
+    assert hourly["forecast"] == []
+    # Hourly requests count as demand, like the weather entity
+    coordinator.async_request_hourly_forecast.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_quotes(mock_hass):
+    """Test that the full quota plans are returned."""
+    handlers = await _services(mock_hass)
+
+    response = await handlers[SERVICE_GET_QUOTES](_call(**{ATTR_CONFIG_ENTRY_ID: "entry_id"}))
+
+    assert response["plans"] == PLANS
+
+
+@pytest.mark.asyncio
+async def test_unknown_entry(mock_hass):
+    """Test that a call for an entry that is not loaded is rejected."""
+    handlers = await _services(mock_hass)
+
+    with pytest.raises(ServiceValidationError):
+        await handlers[SERVICE_GET_QUOTES](_call(**{ATTR_CONFIG_ENTRY_ID: "missing"}))
+
+
+def test_bulky_attributes_are_unrecorded():
+    """Test the attributes kept out of the recorder."""
+    assert "forecast_ha" in MeteocatForecastSensor._unrecorded_attributes
+    assert "forecast_compact" not in MeteocatForecastSensor._unrecorded_attributes
+    assert "data_age_seconds" in MeteocatForecastSensor._unrecorded_attributes
+    assert "data_age_seconds" in MeteocatXemaSensor._unrecorded_attributes
+    assert {"max_consultes", "periode", "plan"} <= MeteocatQuotaSensor._unrecorded_attributes
+    assert "plan" in MeteocatEstimatedDaysRemainingSensor._unrecorded_attributes
+    assert {"error", "failed_count"} <= MeteocatUpdateStatusBinarySensor._unrecorded_attributes
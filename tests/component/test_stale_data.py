@@ -0,0 +1,162 @@
+"""Tests for serving stale data after failed refreshes.
+
+With a maximum age configured, entities keep the last good data through
+API outages, report how old it is and only become unavailable once it is
+older than the maximum age.
+"""
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_STALE_DATA_MAX_AGE,
+    CONF_STATION_CODE,
+    MAX_STALE_DATA_MAX_AGE,
+    MODE_EXTERNAL,
+)
+from custom_components.meteocat_community_edition.binary_sensor import MeteocatUpdateStatusBinarySensor
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatLastUpdateSensor,
+    MeteocatNextUpdateSensor,
+    MeteocatQuotaSensor,
+    MeteocatXemaSensor,
+)
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+DATA = {"measurements": [{"codi": "YM", "variables": [
+    {"codi": 32, "lectures": [{"data": "2026-10-19T11:00Z", "valor": 15.5}]}
+]}]}
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+def _entry(options):
+    """Create a mock external entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+    }
+    entry.options = options
+    return entry
+
+
+@pytest.fixture
+def coordinator(mock_hass):
+    """Create a coordinator serving data up to 60 minutes old, last updated 40 minutes ago."""
+    coordinator = MeteocatCoordinator(mock_hass, _entry({CONF_STALE_DATA_MAX_AGE: 60}))
+    coordinator.data = DATA
+    coordinator.last_successful_update_time = NOW - timedelta(minutes=40)
+    return coordinator
+
+
+def test_option_parsing(mock_hass):
+    """Test the default, the clamp and invalid values."""
+    assert MeteocatCoordinator(mock_hass, _entry({})).serve_stale is False
+    assert MeteocatCoordinator(mock_hass, _entry({CONF_STALE_DATA_MAX_AGE: "x"})).serve_stale is False
+    coordinator = MeteocatCoordinator(mock_hass, _entry({CONF_STALE_DATA_MAX_AGE: 100000}))
+    assert coordinator.stale_data_max_age == timedelta(minutes=MAX_STALE_DATA_MAX_AGE)
+
+
+def test_entity_available_until_max_age(coordinator, mock_hass):
+    """Test that a failed refresh keeps the last value until it is too old."""
+    sensor = MeteocatXemaSensor(coordinator, _entry({}), "Granollers", 32)
+    coordinator.last_update_success = False
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        assert coordinator.serving_stale_data is True
+        assert sensor.available is True
+        assert sensor.native_value == 15.5
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow",
+               return_value=NOW + timedelta(minutes=21)):
+        assert coordinator.serving_stale_data is False
+        assert sensor.available is False
+
+
+def test_entity_unavailable_without_option(mock_hass):
+    """Test that without the option a failed refresh still makes entities unavailable."""
+    coordinator = MeteocatCoordinator(mock_hass, _entry({}))
+    coordinator.data = DATA
+    coordinator.last_successful_update_time = NOW
+    coordinator.last_update_success = False
+    sensor = MeteocatXemaSensor(coordinator, _entry({}), "Granollers", 32)
+
+    assert sensor.available is False
+    assert sensor.extra_state_attributes == {}
+
+
+def test_entity_reports_data_age(coordinator):
+    """Test the staleness attributes."""
+    sensor = MeteocatXemaSensor(coordinator, _entry({}), "Granollers", 32)
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        assert sensor.extra_state_attributes == {
+            "data_age_seconds": 2400,
+            "data_fetched_at": "2026-10-19T11:20:00+00:00",
+        }
+
+
+def test_diagnostic_entities_report_data_age(coordinator):
+    """Test that the status, update time and quota entities report it too."""
+    entry = _entry({})
+    coordinator.data = {**DATA, "quotes": {"plans": [{"nom": "XEMA_75", "consultesRestants": 700}]}}
+    entities = [
+        MeteocatUpdateStatusBinarySensor(coordinator, entry, "Granollers YM", "Granollers YM", MODE_EXTERNAL, "YM"),
+        MeteocatLastUpdateSensor(coordinator, entry, "Granollers YM", "Granollers YM", MODE_EXTERNAL, "YM"),
+        MeteocatNextUpdateSensor(coordinator, entry, "Granollers YM", "Granollers YM", MODE_EXTERNAL, "YM"),
+        MeteocatQuotaSensor(coordinator, entry, {"nom": "XEMA_75"}, "Granollers YM", "Granollers YM", MODE_EXTERNAL, "YM"),
+    ]
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        for entity in entities:
+            assert entity.extra_state_attributes["data_age_seconds"] == 2400
+            assert "data_fetched_at" in entity._unrecorded_attributes
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_schedules_expiry(coordinator):
+    """Test that entities are updated when the stale data expires, and not after a success."""
+    coordinator._async_fetch_data = AsyncMock(side_effect=UpdateFailed("API down"))
+    remover = MagicMock()
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW), \
+         patch("custom_components.meteocat_community_edition.coordinator.async_track_point_in_utc_time",
+               return_value=remover) as mock_track:
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+        assert mock_track.call_args[0][2] == NOW + timedelta(minutes=20)
+
+        coordinator._async_fetch_data = AsyncMock(return_value=DATA)
+        await coordinator._async_update_data()
+
+    remover.assert_called_once()
+    assert coordinator._stale_expiry_remover is None
+
+
+def test_expiry_updates_entities(coordinator):
+    """Test that the expiry refreshes the entity states."""
+    coordinator.async_update_listeners = MagicMock()
+
+    coordinator._async_stale_data_expired(NOW + timedelta(minutes=20))
+
+    coordinator.async_update_listeners.assert_called_once()
@@ -0,0 +1,250 @@
+"""Tests for the failover to the nearest working station.
+
+When a variable of the configured station stops reporting, its value is
+served from the nearest operational station that still reports it, tagged
+with the source station so the entity shows where the value comes from.
+"""
+import sys
+import os
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.api import MeteocatAPIError
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_STATION_CODE,
+    CONF_STATION_FAILOVER,
+    FAILOVER_MAX_CALLS,
+    MODE_EXTERNAL,
+    XEMA_VARIABLES,
+)
+from custom_components.meteocat_community_edition.sensor import MeteocatXemaSensor
+from custom_components.meteocat_community_edition.utils import (
+    build_station_index,
+    get_distance_km,
+    get_latest_reading_time,
+    nearest_stations,
+)
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+STATIONS = [
+    {"codi": "YM", "nom": "Granollers", "coordenades": {"latitud": 41.6, "longitud": 2.29},
+     "estats": [{"codi": 2, "dataInici": "2000-01-01T00:00Z", "dataFi": None}]},
+    {"codi": "CC", "nom": "Cardedeu", "coordenades": {"latitud": 41.64, "longitud": 2.36},
+     "estats": [{"codi": 2, "dataInici": "2000-01-01T00:00Z", "dataFi": None}]},
+    {"codi": "X4", "nom": "Barcelona", "coordenades": {"latitud": 41.45, "longitud": 2.2},
+     "estats": [{"codi": 2, "dataInici": "2000-01-01T00:00Z", "dataFi": None}]},
+    {"codi": "ZZ", "nom": "Closed", "coordenades": {"latitud": 41.61, "longitud": 2.3},
+     "estats": [{"codi": 2, "dataInici": "2000-01-01T00:00Z", "dataFi": "2020-01-01T00:00Z"}]},
+]
+
+
+def _variable(code, data, value=15.0):
+    """Build a measurements variable with one reading."""
+    return {"codi": code, "lectures": [{"data": data, "valor": value, "estat": "V"}]}
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry with failover enabled."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+        "_station_data": STATIONS[0],
+    }
+    entry.options = {CONF_STATION_FAILOVER: True}
+    return entry
+
+
+@pytest.fixture
+def coordinator(mock_hass, mock_entry):
+    """Create a coordinator with a mocked API and an already known station index."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator._failover_candidates = nearest_stations(
+        build_station_index(STATIONS), 41.6, 2.29, 5, 25, exclude="YM"
+    )
+    coordinator.api.get_variable_measurements = AsyncMock(return_value=[
+        {"codi": "X4", "variables": [_variable(32, "2026-10-19T11:30Z", 18.0)]},
+        {"codi": "CC", "variables": [_variable(32, "2026-10-19T06:00Z", 12.0)]},
+    ])
+    return coordinator
+
+
+def test_station_index_and_nearest():
+    """Test that closed stations are skipped and candidates are sorted by distance."""
+    index = build_station_index(STATIONS)
+    assert [station["codi"] for station in index] == ["YM", "CC", "X4"]
+
+    candidates = nearest_stations(index, 41.6, 2.29, 5, 25, exclude="YM")
+    assert [station["codi"] for station in candidates] == ["CC", "X4"]
+    assert candidates[0]["distance_km"] == round(get_distance_km(41.6, 2.29, 41.64, 2.36), 1)
+
+    assert nearest_stations(index, 41.6, 2.29, 5, 10, exclude="YM") == candidates[:1]
+
+
+def test_latest_reading_time_ignores_missing_values():
+    """Test that readings without a value do not count as reporting."""
+    variable = {"codi": 32, "lectures": [
+        {"data": "2026-10-19T10:00Z", "valor": 15.0},
+        {"data": "2026-10-19T10:30Z", "valor": None},
+    ]}
+    assert get_latest_reading_time(variable) == datetime(2026, 10, 19, 10, 0, tzinfo=timezone.utc)
+    assert get_latest_reading_time(None) is None
+
+
+@pytest.mark.asyncio
+async def test_fresh_station_is_untouched(coordinator):
+    """Test that no extra call is made while the station reports."""
+    measurements = [{"codi": "YM", "variables": [_variable(32, "2026-10-19T11:30Z")]}]
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        result = await coordinator._async_apply_failover(measurements)
+
+    assert result is measurements
+    coordinator.api.get_variable_measurements.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stale_variable_uses_nearest_fresh_station(coordinator):
+    """Test that the nearest station with a fresh reading replaces a stale variable."""
+    measurements = [{"codi": "YM", "variables": [
+        _variable(32, "2026-10-19T08:00Z"),
+        _variable(33, "2026-10-19T11:30Z", 60.0),
+    ]}]
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        result = await coordinator._async_apply_failover(measurements)
+
+    # One bulk call for the stale variable only
+    coordinator.api.get_variable_measurements.assert_called_once_with(32)
+    variables = {variable["codi"]: variable for variable in result[0]["variables"]}
+    # CC is nearer but stale too, X4 is used
+    assert variables[32]["source_station"] == "X4"
+    assert variables[32]["source_station_name"] == "Barcelona"
+    assert variables[32]["lectures"][-1]["valor"] == 18.0
+    assert "source_station" not in variables[33]
+
+
+@pytest.mark.asyncio
+async def test_failover_errors_keep_measurements(coordinator):
+    """Test that a failed bulk call keeps the station's own data."""
+    coordinator.api.get_variable_measurements.side_effect = MeteocatAPIError("Server error", status=500)
+    measurements = [{"codi": "YM", "variables": [_variable(32, "2026-10-19T08:00Z")]}]
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        result = await coordinator._async_apply_failover(measurements)
+
+    assert result is measurements
+
+
+@pytest.mark.asyncio
+async def test_failover_calls_are_capped_and_cached(coordinator):
+    """Test that a silent station costs a bounded number of calls per refresh."""
+    measurements = [{"codi": "YM", "variables": []}]
+    api = coordinator.api.get_variable_measurements
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        await coordinator._async_apply_failover(measurements)
+        assert api.call_count == FAILOVER_MAX_CALLS
+
+        # Same hour: cached payloads are reused, only the remaining variables are fetched
+        await coordinator._async_apply_failover(measurements)
+        assert api.call_count == min(2 * FAILOVER_MAX_CALLS, len(XEMA_VARIABLES))
+
+    fetched = [call.args[0] for call in api.call_args_list]
+    assert len(set(fetched)) == len(fetched)
+    assert set(fetched) <= set(XEMA_VARIABLES.values())
+
+
+@pytest.mark.asyncio
+async def test_station_index_is_shared_and_cached(coordinator):
+    """Test that the station list is read from the shared store while it is recent."""
+    coordinator._failover_candidates = None
+    coordinator.api.get_stations = AsyncMock()
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value={
+        "updated": "2026-10-18T00:00:00+00:00",
+        "stations": build_station_index(STATIONS),
+    })
+
+    with patch("custom_components.meteocat_community_edition.coordinator.Store", return_value=store), \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        candidates = await coordinator._async_get_failover_candidates()
+        assert await coordinator._async_get_failover_candidates() is candidates
+
+    coordinator.api.get_stations.assert_not_called()
+    store.async_load.assert_called_once()
+    assert [station["codi"] for station in candidates] == ["CC", "X4"]
+
+
+@pytest.mark.asyncio
+async def test_station_index_is_refreshed_when_old(coordinator):
+    """Test that an outdated station list is fetched again and saved."""
+    coordinator._failover_candidates = None
+    coordinator.api.get_stations = AsyncMock(return_value=STATIONS)
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value={"updated": "2026-10-01T00:00:00+00:00", "stations": []})
+    store.async_save = AsyncMock()
+
+    with patch("custom_components.meteocat_community_edition.coordinator.Store", return_value=store), \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        candidates = await coordinator._async_get_failover_candidates()
+
+    coordinator.api.get_stations.assert_called_once()
+    store.async_save.assert_called_once()
+    assert len(candidates) == 2
+
+
+@pytest.mark.asyncio
+async def test_failover_values_are_not_merged_back(coordinator):
+    """Test that the next fetch drops neighbour values before merging."""
+    coordinator.data = {"measurements": [{"codi": "YM", "variables": [
+        {**_variable(32, "2026-10-19T11:30Z", 18.0), "source_station": "X4"},
+    ]}]}
+    coordinator.api.get_station_measurements = AsyncMock(return_value=[
+        {"codi": "YM", "variables": [_variable(33, "2026-10-19T11:30Z", 60.0)]}
+    ])
+
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.utcnow", return_value=NOW):
+        measurements = await coordinator._async_fetch_measurements()
+
+    assert [variable["codi"] for variable in measurements[0]["variables"]] == [33]
+
+
+def test_sensor_reports_source_station(coordinator, mock_entry):
+    """Test that the entity exposes where a failover value comes from."""
+    coordinator.data = {"measurements": [{"codi": "YM", "variables": [
+        {**_variable(32, "2026-10-19T11:30Z", 18.0),
+         "source_station": "X4", "source_station_name": "Barcelona", "source_distance_km": 24.5},
+        _variable(33, "2026-10-19T11:30Z", 60.0),
+    ]}]}
+
+    temperature = MeteocatXemaSensor(coordinator, mock_entry, "Granollers", 32)
+    humidity = MeteocatXemaSensor(coordinator, mock_entry, "Granollers", 33)
+
+    assert temperature.native_value == 18.0
+    assert temperature.extra_state_attributes == {
+        "source_station": "X4",
+        "source_station_name": "Barcelona",
+        "source_distance_km": 24.5,
+    }
+    assert humidity.extra_state_attributes == {}
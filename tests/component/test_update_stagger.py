@@ -0,0 +1,179 @@
+"""Tests for staggered update scheduling.
+
+Each entry gets a deterministic offset (derived from its entry id) within a
+configurable window, so entries don't all call the API at the same second.
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_MUNICIPALITY_CODE,
+    CONF_STATION_CODE,
+    CONF_UPDATE_STAGGER_WINDOW,
+    DEFAULT_UPDATE_STAGGER_WINDOW,
+    MAX_UPDATE_STAGGER_WINDOW,
+    MODE_EXTERNAL,
+    MODE_LOCAL,
+)
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatNextUpdateSensor,
+)
+from custom_components.meteocat_community_edition.utils import get_update_offset
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry with a 10 minute stagger window."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+        "update_time_1": "06:00",
+        "update_time_2": "14:00",
+    }
+    entry.options = {CONF_UPDATE_STAGGER_WINDOW: 10}
+    return entry
+
+
+def test_offset_is_deterministic():
+    """Test that the same entry always gets the same offset."""
+    assert get_update_offset("entry_a", 10) == get_update_offset("entry_a", 10)
+
+
+def test_offset_within_window():
+    """Test that offsets never exceed the window."""
+    for index in range(200):
+        offset = get_update_offset(f"entry_{index}", 10)
+        assert 0 <= offset <= 600
+
+
+def test_offsets_spread_between_entries():
+    """Test that different entries get different offsets."""
+    offsets = {get_update_offset(f"entry_{index}", 10) for index in range(20)}
+    assert len(offsets) > 10
+
+
+def test_offset_zero_window():
+    """Test that a zero window disables staggering."""
+    assert get_update_offset("entry_a", 0) == 0
+
+
+def test_coordinator_window_defaults_and_bounds(mock_hass, mock_entry):
+    """Test that invalid or out of range windows are sanitised."""
+    mock_entry.options = {}
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    assert coordinator.update_stagger_window == DEFAULT_UPDATE_STAGGER_WINDOW
+    # Opt-in: the exact update times are kept by default
+    assert coordinator.update_offset == timedelta(0)
+
+    mock_entry.options = {CONF_UPDATE_STAGGER_WINDOW: 999}
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    assert coordinator.update_stagger_window == MAX_UPDATE_STAGGER_WINDOW
+
+    mock_entry.options = {CONF_UPDATE_STAGGER_WINDOW: "abc"}
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    assert coordinator.update_stagger_window == DEFAULT_UPDATE_STAGGER_WINDOW
+
+    mock_entry.options = {CONF_UPDATE_STAGGER_WINDOW: 0}
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    assert coordinator.update_offset == timedelta(0)
+
+
+@pytest.mark.asyncio
+async def test_external_schedule_uses_offset(mock_hass, mock_entry):
+    """Test that hourly updates are shifted by the entry offset."""
+    now = dt_util.as_local(datetime(2026, 10, 19, 10, 30, 0))
+    with patch("custom_components.meteocat_community_edition.coordinator.async_track_point_in_utc_time"), \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.now", return_value=now):
+        coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+        coordinator._schedule_next_update()
+
+    expected = now.replace(hour=11, minute=0) + coordinator.update_offset
+    assert coordinator.next_scheduled_update == expected
+
+
+@pytest.mark.asyncio
+async def test_external_schedule_same_hour_before_offset(mock_hass, mock_entry):
+    """Test that an offset still ahead in the current hour is used."""
+    mock_entry.options = {CONF_UPDATE_STAGGER_WINDOW: 30}
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.update_offset = timedelta(minutes=20)
+    now = dt_util.as_local(datetime(2026, 10, 19, 10, 5, 0))
+    with patch("custom_components.meteocat_community_edition.coordinator.async_track_point_in_utc_time"), \
+         patch("custom_components.meteocat_community_edition.coordinator.dt_util.now", return_value=now):
+        coordinator._schedule_next_update()
+
+    assert coordinator.next_scheduled_update == now.replace(minute=20)
+
+
+@pytest.mark.asyncio
+async def test_local_schedule_uses_offset(mock_hass, mock_entry):
+    """Test that fixed update times are shifted by the entry offset."""
+    mock_entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_LOCAL,
+        CONF_MUNICIPALITY_CODE: "081131",
+        "update_time_1": "06:00",
+        "update_time_2": "14:00",
+    }
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.update_offset = timedelta(minutes=7)
+
+    # Between the configured time and the shifted time, the slot is still pending
+    now = dt_util.as_local(datetime(2026, 10, 19, 14, 3, 0))
+    next_time = coordinator._get_next_scheduled_time(now)
+    assert next_time.hour == 14
+    assert next_time.minute == 7
+
+    # After the last slot, roll over to tomorrow keeping the offset
+    now = dt_util.as_local(datetime(2026, 10, 19, 22, 0, 0))
+    next_time = coordinator._get_next_scheduled_time(now)
+    assert next_time.day == 20
+    assert next_time.hour == 6
+    assert next_time.minute == 7
+
+
+@pytest.mark.asyncio
+async def test_forecast_slot_matches_with_offset(mock_hass, mock_entry):
+    """Test that a shifted update still fetches the forecast of its slot."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    coordinator.update_offset = timedelta(minutes=25)
+    coordinator._is_first_refresh = False
+    coordinator.data = {"forecast": {"dies": []}}
+
+    now = dt_util.as_local(datetime(2026, 10, 19, 14, 25, 0))
+    with patch("custom_components.meteocat_community_edition.coordinator.dt_util.now", return_value=now):
+        assert coordinator._should_fetch_forecast() is True
+
+
+def test_next_update_sensor_exposes_offset(mock_hass, mock_entry):
+    """Test that the next update sensor shows the chosen offset."""
+    coordinator = MeteocatCoordinator(mock_hass, mock_entry)
+    sensor = MeteocatNextUpdateSensor(
+        coordinator, mock_entry, "Granollers", "Granollers YM", MODE_EXTERNAL, "YM"
+    )
+
+    attributes = sensor.extra_state_attributes
+    assert attributes["update_offset_seconds"] == get_update_offset("test_entry_id", 10)
+    assert attributes["update_stagger_window_minutes"] == 10
@@ -0,0 +1,152 @@
+"""Tests for the discovery of the XEMA variables a station reports.
+
+Variables outside the fixed sensor table get a sensor named from the XEMA
+variables metadata, which is fetched once and kept in a shared Store.
+"""
+import sys
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+import pytest
+
+from custom_components.meteocat_community_edition.api import MeteocatAPIError
+from custom_components.meteocat_community_edition.const import (
+    CONF_API_KEY,
+    CONF_MODE,
+    CONF_STATION_CODE,
+    DOMAIN,
+    MODE_EXTERNAL,
+)
+from custom_components.meteocat_community_edition.coordinator import MeteocatCoordinator
+from custom_components.meteocat_community_edition.sensor import (
+    MeteocatXemaSensor,
+    async_setup_entry,
+    get_variable_sensor_config,
+)
+from custom_components.meteocat_community_edition.utils import build_variable_index
+
+METADATA = [
+    {"codi": 50, "nom": "Ratxa màxima del vent a 10 m", "unitat": "m/s", "acronim": "VVx10", "decimals": 1},
+    {"codi": 38, "nom": "Gruix de neu a terra", "unitat": "cm", "acronim": "GN", "decimals": 0},
+    {"codi": "bad", "nom": "Invalid"},
+]
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock external entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {
+        CONF_API_KEY: "test_api_key",
+        CONF_MODE: MODE_EXTERNAL,
+        CONF_STATION_CODE: "YM",
+        "station_name": "Granollers",
+    }
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def coordinator(mock_entry):
+    """Create a coordinator with a mocked API."""
+    hass = MagicMock()
+    hass.data = {}
+    coordinator = MeteocatCoordinator(hass, mock_entry)
+    coordinator.api.get_variables_metadata = AsyncMock(return_value=METADATA)
+    return coordinator
+
+
+def test_build_variable_index():
+    """Test that metadata is indexed by code and invalid entries skipped."""
+    index = build_variable_index(METADATA)
+
+    assert set(index) == {50, 38}
+    assert index[50] == {"codi": 50, "nom": "Ratxa màxima del vent a 10 m", "unitat": "m/s", "decimals": 1}
+    assert build_variable_index(None) == {}
+
+
+def test_variable_sensor_config():
+    """Test that known units get a device class and others are kept as reported."""
+    index = build_variable_index(METADATA)
+
+    config = get_variable_sensor_config(50, index[50])
+    assert config["key"] == "variable_50"
+    assert config["device_class"] == "wind_speed"
+    assert get_variable_sensor_config(38, index[38])["unit"] == "cm"
+    assert get_variable_sensor_config(99, {"unitat": "mm/h"})["device_class"] is None
+
+
+@pytest.mark.asyncio
+async def test_metadata_fetched_once_and_stored(coordinator):
+    """Test that the first call fetches and stores the metadata, later ones reuse it."""
+    with patch("custom_components.meteocat_community_edition.coordinator.Store") as mock_store:
+        mock_store.return_value.async_load = AsyncMock(return_value=None)
+        mock_store.return_value.async_save = AsyncMock()
+        first = await coordinator.async_get_variable_metadata()
+        second = await coordinator.async_get_variable_metadata()
+
+    assert first is second
+    coordinator.api.get_variables_metadata.assert_called_once()
+    saved = mock_store.return_value.async_save.call_args[0][0]
+    assert build_variable_index(saved["variables"]) == first
+
+
+@pytest.mark.asyncio
+async def test_stored_metadata_needs_no_call(coordinator):
+    """Test that stored metadata is used without calling the API."""
+    with patch("custom_components.meteocat_community_edition.coordinator.Store") as mock_store:
+        mock_store.return_value.async_load = AsyncMock(return_value={"variables": METADATA[:1]})
+        metadata = await coordinator.async_get_variable_metadata()
+
+    coordinator.api.get_variables_metadata.assert_not_called()
+    assert list(metadata) == [50]
+
+
+@pytest.mark.asyncio
+async def test_metadata_error_retried_next_time(coordinator):
+    """Test that a failed fetch is neither stored nor kept."""
+    coordinator.api.get_variables_metadata.side_effect = MeteocatAPIError("500")
+    with patch("custom_components.meteocat_community_edition.coordinator.Store") as mock_store:
+        mock_store.return_value.async_load = AsyncMock(return_value=None)
+        mock_store.return_value.async_save = AsyncMock()
+        assert await coordinator.async_get_variable_metadata() == {}
+        await coordinator.async_get_variable_metadata()
+
+    assert coordinator.api.get_variables_metadata.call_count == 2
+    mock_store.return_value.async_save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_setup_creates_sensors_for_reported_variables(mock_entry):
+    """Test that reported variables with metadata get a sensor."""
+    coordinator = MagicMock()
+    coordinator.data = {"measurements": [{"codi": "YM", "variables": [
+        {"codi": 32, "lectures": [{"data": "2026-10-19T10:00Z", "valor": 15.2}]},
+        {"codi": 50, "lectures": [{"data": "2026-10-19T10:00Z", "valor": 12.4}]},
+        {"codi": 97, "lectures": [{"data": "2026-10-19T10:00Z", "valor": 1.0}]},
+    ]}]}
+    coordinator.async_get_variable_metadata = AsyncMock(return_value=build_variable_index(METADATA))
+    hass = MagicMock()
+    hass.data = {DOMAIN: {mock_entry.entry_id: coordinator}}
+    entities = []
+
+    with patch("custom_components.meteocat_community_edition.sensor.er.async_get", return_value=MagicMock()):
+        await async_setup_entry(hass, mock_entry, entities.extend)
+
+    coordinator.async_get_variable_metadata.assert_called_once()
+    discovered = [
+        entity for entity in entities
+        if isinstance(entity, MeteocatXemaSensor) and entity.unique_id.endswith("variable_50")
+    ]
+    assert len(discovered) == 1
+    sensor = discovered[0]
+    assert sensor.name == "Ratxa màxima del vent a 10 m"
+    assert sensor.native_unit_of_measurement == "m/s"
+    assert sensor.suggested_display_precision == 1
+    assert sensor.native_value == 12.4
+    # No metadata for 97: no sensor
+    assert not any(entity.unique_id.endswith("variable_97") for entity in entities)
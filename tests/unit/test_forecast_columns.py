@@ -0,0 +1,82 @@
+"""Tests for the columnar encoding of forecast attributes."""
+import sys
+import os
+import json
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from custom_components.meteocat_community_edition.utils import encode_forecast_columns
+
+START = datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc)
+CONDITIONS = ["sunny", "partlycloudy", "cloudy", "rainy"]
+
+
+def _hourly(hours=72):
+    """Build an hourly forecast in HA format."""
+    return [{
+        "datetime": (START + timedelta(hours=hour)).strftime("%Y-%m-%dT%H:%MZ"),
+        "temperature": 12.5 + hour % 7,
+        "condition": CONDITIONS[hour // 18 % 4],
+        "precipitation": 0.0,
+    } for hour in range(hours)]
+
+
+def test_hourly_columns():
+    """Test the start, step, value arrays and condition indexes."""
+    encoded = encode_forecast_columns(_hourly(), 8192)
+
+    assert encoded["start"] == "2026-10-19T00:00Z"
+    assert encoded["step"] == 3600
+    assert "datetime" not in encoded
+    assert len(encoded["temperature"]) == 72
+    assert encoded["precipitation"][0] == 0.0
+    assert encoded["conditions"] == CONDITIONS
+    assert encoded["condition"][:2] == [0, 0]
+    assert encoded["condition"][-1] == 3
+    assert encoded["size_bytes"] == len(json.dumps(encoded, separators=(",", ":")))
+
+
+def test_daily_columns_keep_missing_values():
+    """Test daily steps and missing fields."""
+    forecast = [
+        {"datetime": "2026-10-19Z", "templow": 8.0, "temperature": 19.0, "condition": "sunny"},
+        {"datetime": "2026-10-20Z", "templow": 9.0, "temperature": 18.0},
+    ]
+
+    encoded = encode_forecast_columns(forecast, 8192)
+
+    assert encoded["step"] == 86400
+    assert encoded["templow"] == [8.0, 9.0]
+    assert encoded["condition"] == [0, None]
+    assert encoded["conditions"] == ["sunny"]
+
+
+def test_uneven_times_are_listed():
+    """Test that a gap in the forecast keeps every time."""
+    forecast = _hourly(4)
+    del forecast[1]
+
+    encoded = encode_forecast_columns(forecast, 8192)
+
+    assert "start" not in encoded
+    assert encoded["datetime"] == ["2026-10-19T00:00Z", "2026-10-19T02:00Z", "2026-10-19T03:00Z"]
+
+
+def test_size_is_capped():
+    """Test that items are dropped from the end to fit the cap."""
+    encoded = encode_forecast_columns(_hourly(), 400)
+
+    assert encoded["size_bytes"] <= 400
+    assert 0 < len(encoded["temperature"]) < 72
+    assert encode_forecast_columns([], 400)["size_bytes"] <= 400
+
+
+def test_columns_smaller_than_items():
+    """Test that the attribute written on each state change shrinks."""
+    forecast = _hourly()
+    items_json = json.dumps({"forecast_ha": forecast})
+    compact_json = json.dumps({"forecast_compact": encode_forecast_columns(forecast, 8192)})
+
+    assert len(compact_json) * 3 < len(items_json)
@@ -0,0 +1,190 @@
+"""Tests for the rolling in-memory history of station readings."""
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from custom_components.meteocat_community_edition.history import ReadingHistory
+
+START = datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc)
+
+
+def _series(count, value=lambda index: float(index), start=START):
+    """Build half-hourly readings."""
+    return [(start + timedelta(minutes=30 * index), value(index)) for index in range(count)]
+
+
+def test_capacity_is_fixed():
+    """Test that the ring size follows the window, not the data."""
+    history = ReadingHistory(24)
+    assert history.capacity == 48
+    history.add_readings({32: _series(500)})
+    ring = history._variables[32]
+    assert len(ring.timestamps) == 48
+    assert len(ring.values) == 48
+    assert len(history.get(32)) == 48
+
+
+def test_merge_without_duplicates():
+    """Test that overlapping fetches don't duplicate readings."""
+    history = ReadingHistory(24)
+    assert history.add_readings({32: _series(10)}) == 10
+    # Same day fetched again with two new readings
+    assert history.add_readings({32: _series(12)}) == 2
+    assert len(history.get(32)) == 12
+    assert history.latest == START + timedelta(hours=5, minutes=30)
+
+
+def test_window_keeps_most_recent():
+    """Test that only readings inside the window are returned."""
+    history = ReadingHistory(24)
+    history.add_readings({32: _series(60)})
+    readings = history.get(32)
+    assert readings[0][0] == START + timedelta(hours=6)
+    assert readings[-1][0] == START + timedelta(hours=29, minutes=30)
+
+
+def test_old_readings_ignored():
+    """Test that readings older than the window don't overwrite newer ones."""
+    history = ReadingHistory(24)
+    history.add_readings({32: _series(4, start=START + timedelta(days=2))})
+    assert history.add_readings({32: _series(4)}) == 0
+    assert len(history.get(32)) == 4
+
+
+def test_total_extremes_and_trend():
+    """Test aggregations over a sub-window."""
+    history = ReadingHistory(48)
+    history.add_readings({
+        35: _series(8, value=lambda index: 0.2),
+        32: _series(8, value=lambda index: 10.0 + index),
+    })
+    assert history.total(35) == 1.6
+    assert history.total(35, hours=1) == 0.4
+    assert history.extremes(32) == (10.0, 17.0)
+    # Last 3 hours: 12.0 -> 17.0 over 2.5 h
+    assert history.trend(32, hours=3) == 2.0
+    assert history.total(99) is None
+    assert history.trend(99) is None
+
+
+def test_float_precision_rounded():
+    """Test that 32-bit storage is rounded back."""
+    history = ReadingHistory(24)
+    history.add_readings({34: [(START, 1013.2)]})
+    assert history.get(34) == [(START, 1013.2)]
+
+
+def test_variables():
+    """Test the list of variables with history."""
+    history = ReadingHistory(24)
+    assert history.variables == []
+    assert history.latest is None
+    history.add_readings({33: _series(1), 32: _series(1)})
+    assert history.variables == [32, 33]
+
+
+def test_daily_aggregate_incremental():
+    """Test that refetched readings are accounted once in the daily aggregate."""
+    history = ReadingHistory(24)
+    values = [12.0, 9.5, 14.0, 9.5, 11.0]
+    history.add_readings({32: _series(3, lambda index: values[index])})
+    history.add_readings({32: _series(5, lambda index: values[index])})
+
+    aggregate = history.daily(32, START.date())
+    assert aggregate.count == 5
+    assert aggregate.mean == sum(values) / 5
+    assert (aggregate.minimum, aggregate.minimum_time) == (9.5, START + timedelta(minutes=30))
+    assert (aggregate.maximum, aggregate.maximum_time) == (14.0, START + timedelta(hours=1))
+    assert history.daily(32, START.date() + timedelta(days=1)) is None
+    assert history.daily(33, START.date()) is None
+
+
+def test_daily_aggregate_local_day_boundary():
+    """Test that the aggregate restarts at midnight of the configured time zone."""
+    local = timezone(timedelta(hours=2))
+    history = ReadingHistory(48, local)
+    # 21:00-22:30 UTC: 23:00-00:30 local, the last two readings start the local day
+    history.add_readings({32: _series(4, start=START.replace(hour=21))})
+
+    assert history.daily(32, START.date()) is None
+    aggregate = history.daily(32, START.date() + timedelta(days=1))
+    assert aggregate.count == 2
+    assert aggregate.minimum == 2.0
+
+    # Backfilled readings of the previous day don't change it
+    history.add_readings({32: _series(4, start=START)})
+    assert history.daily(32, START.date() + timedelta(days=1)).count == 2
+
+
+def test_window_sums_across_midnight():
+    """Test rolling sums fed day by day, without summing the history again."""
+    history = ReadingHistory(24, sum_windows={35: (30, 60, 180, 1440)})
+    evening = START.replace(hour=22)
+    history.add_readings({35: _series(4, lambda index: 1.0 + index, start=evening)})
+    # Next UTC day: the payload only holds the readings after midnight
+    history.add_readings({35: _series(2, lambda index: 0.5, start=START + timedelta(days=1))})
+
+    assert history.window_total(35, 30) == 0.5
+    assert history.window_total(35, 60) == 1.0
+    assert history.window_total(35, 120) is None
+    assert history.window_total(35, 180) == 1.0 + 2.0 + 3.0 + 4.0 + 1.0
+    # Only three hours known: the 24-hour sum would be partial
+    assert history.window_total(35, 1440) is None
+    assert history.window_total(35, 15) is None
+    assert history.window_total(32, 60) is None
+
+
+def test_window_sum_backfilled_and_repeated_readings():
+    """Test that only new readings inside the window change the sum."""
+    history = ReadingHistory(24, sum_windows={35: (60,)})
+    history.add_readings({35: _series(4, lambda index: 1.0)})
+    history.add_readings({35: _series(4, lambda index: 1.0)})
+    assert history.window_total(35, 60) == 2.0
+
+    # A reading missing from the window arrives late
+    history = ReadingHistory(24, sum_windows={35: (60,)})
+    readings = _series(4, lambda index: 1.0 + index)
+    history.add_readings({35: [readings[0], readings[1], readings[3]]})
+    assert history.window_total(35, 60) == 4.0
+    history.add_readings({35: [readings[2]]})
+    assert history.window_total(35, 60) == 3.0 + 4.0
+
+
+def test_window_sum_expires_without_new_readings():
+    """Test that the sums decay when the station stops reporting."""
+    history = ReadingHistory(24, sum_windows={35: (60, 180)})
+    # Dry hours before, so the windows are complete
+    history.add_readings({35: _series(6, lambda index: 0.0, start=START - timedelta(hours=3))})
+    history.add_readings({35: _series(4, lambda index: 1.0)})
+    newest = START + timedelta(minutes=90)
+
+    # The newest reading is published up to an hour late
+    assert history.window_total(35, 60, now=newest + timedelta(hours=1)) == 2.0
+    assert history.window_total(35, 60, now=newest + timedelta(minutes=90)) == 1.0
+    assert history.window_total(35, 180, now=newest + timedelta(minutes=90)) == 4.0
+
+    # No reading for longer than the windows
+    later = newest + timedelta(hours=5)
+    assert history.window_total(35, 60, now=later) is None
+    assert history.window_total(35, 180, now=later) is None
+
+    # The station reports again
+    history.add_readings({35: [(later, 0.5)]})
+    assert history.window_total(35, 60, now=later) == 0.5
+    assert history.window_total(35, 180, now=later) == 0.5
+
+
+def test_window_sum_partial_until_history_reaches_back():
+    """Test that a sum is unknown until the readings cover the whole window."""
+    history = ReadingHistory(24, sum_windows={35: (180, 1440)})
+    # Restart at 12:00: only the readings of the current UTC day are known
+    history.add_readings({35: _series(24, lambda index: 0.5)})
+    assert history.window_total(35, 180) == 3.0
+    assert history.window_total(35, 1440) is None
+
+    # The previous day is fetched: the window ending at 11:30 starts at 12:00 the day before
+    history.add_readings({35: _series(48, lambda index: 0.25, start=START - timedelta(days=1))})
+    assert history.window_total(35, 1440) == 18.0
@@ -0,0 +1,150 @@
+"""Tests for the projection of API payloads kept in coordinator data."""
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from custom_components.meteocat_community_edition.const import (
+    FORECAST_DAILY_VARIABLES,
+    FORECAST_HOURLY_VARIABLES,
+    XEMA_VARIABLES,
+)
+from custom_components.meteocat_community_edition.utils import (
+    project_forecast,
+    project_measurements,
+)
+
+START = datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc)
+# A XEMA station reports many more variables than the ones with an entity
+STATION_VARIABLES = list(XEMA_VARIABLES.values()) + [3, 40, 42, 44, 46, 47, 48, 50, 56, 72, 97]
+DAILY_EXTRA = ["humitatMin", "humitatMax", "velVent", "dirVent", "probPrecipitacio",
+               "precipitacioMati", "precipitacioTarda", "uvi", "ventMax"]
+HOURLY_EXTRA = ["humitat", "velVent", "dirVent", "ratxaMax", "tempXafogor", "probPrecipitacio"]
+
+
+def _measurements():
+    """Build a full-day XEMA payload with every field the API returns."""
+    return [{
+        "codi": "YM",
+        "variables": [{
+            "codi": code,
+            "lectures": [{
+                "data": (START + timedelta(minutes=30 * index)).strftime("%Y-%m-%dT%H:%MZ"),
+                "valor": 10.0 + index / 10,
+                "estat": "V",
+                "baseHoraria": "SH",
+            } for index in range(48)],
+        } for code in STATION_VARIABLES],
+    }]
+
+
+def _daily_forecast():
+    """Build an 8-day municipal forecast."""
+    names = ["tmin", "tmax", "estatCel", "precipitacio"] + DAILY_EXTRA
+    return {
+        "codiMunicipi": "081131",
+        "dies": [{
+            "data": f"2026-10-{19 + day}Z",
+            "variables": {name: {"valor": 12, "unitat": "°C"} for name in names},
+        } for day in range(8)],
+    }
+
+
+def _hourly_forecast():
+    """Build a 72-hour municipal forecast."""
+    names = ["temp", "estatCel", "precipitacio"] + HOURLY_EXTRA
+    return {
+        "codiMunicipi": "081131",
+        "dies": [{
+            "data": f"2026-10-{19 + day}Z",
+            "variables": {name: {
+                "unitat": "°C",
+                "valors": [{"valor": 12.5, "data": f"2026-10-{19 + day}T{hour:02d}:00Z"}
+                           for hour in range(24)],
+            } for name in names},
+        } for day in range(3)],
+    }
+
+
+def _deep_size(value, seen=None):
+    """Return the bytes held by a JSON-like object and everything it holds."""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(key, seen) + _deep_size(item, seen) for key, item in value.items())
+    elif isinstance(value, list):
+        size += sum(_deep_size(item, seen) for item in value)
+    return size
+
+
+def test_measurements_keep_entity_variables_and_fields():
+    """Test that only the variables with an entity and their time and value remain."""
+    projected = project_measurements(_measurements(), XEMA_VARIABLES.values())
+
+    assert [station["codi"] for station in projected] == ["YM"]
+    variables = projected[0]["variables"]
+    assert [variable["codi"] for variable in variables] == list(XEMA_VARIABLES.values())
+    assert len(variables[0]["lectures"]) == 48
+    assert variables[0]["lectures"][0] == {"data": "2026-10-19T00:00Z", "valor": 10.0}
+
+
+def test_measurements_other_payloads_unchanged():
+    """Test that missing or malformed payloads are kept as they are."""
+    assert project_measurements(None, XEMA_VARIABLES.values()) is None
+    assert project_measurements({"error": "x"}, XEMA_VARIABLES.values()) == {"error": "x"}
+    assert project_measurements([{"codi": "YM"}], [32]) == [{"codi": "YM", "variables": []}]
+
+
+def test_daily_forecast_keeps_read_variables():
+    """Test that daily variables keep their value only."""
+    projected = project_forecast(_daily_forecast(), FORECAST_DAILY_VARIABLES)
+
+    assert projected["codiMunicipi"] == "081131"
+    day = projected["dies"][0]
+    assert day["data"] == "2026-10-19Z"
+    assert set(day["variables"]) == {"tmin", "tmax", "estatCel", "precipitacio"}
+    assert day["variables"]["tmin"] == {"valor": 12}
+
+
+def test_hourly_forecast_keeps_values():
+    """Test that hourly variables keep their list of values."""
+    forecast = _hourly_forecast()
+    forecast["dies"][0]["variables"]["estat"] = {"valor": [{"codi": 2, "data": "2026-10-19T00:00Z", "x": 1}]}
+
+    projected = project_forecast(forecast, FORECAST_HOURLY_VARIABLES)
+
+    variables = projected["dies"][0]["variables"]
+    assert set(variables) == {"temp", "estatCel", "estat", "precipitacio", "humitat", "velVent"}
+    assert variables["temp"]["valors"][0] == {"valor": 12.5, "data": "2026-10-19T00:00Z"}
+    assert variables["estat"] == {"valor": [{"codi": 2, "data": "2026-10-19T00:00Z"}]}
+
+
+def test_forecast_without_days_unchanged():
+    """Test that empty forecasts are still reported as empty."""
+    assert project_forecast({}, FORECAST_DAILY_VARIABLES) == {}
+    assert project_forecast(None, FORECAST_DAILY_VARIABLES) is None
+    assert project_forecast({"dies": []}, FORECAST_DAILY_VARIABLES) == {"dies": []}
+    assert project_forecast({"dies": [{"data": "2026-10-19Z"}]}, FORECAST_DAILY_VARIABLES) == {
+        "dies": [{"data": "2026-10-19Z"}]
+    }
+
+
+def test_projection_halves_entry_data():
+    """Test that the projection at least halves the coordinator data of an entry."""
+    raw = {
+        "measurements": _measurements(),
+        "forecast": _daily_forecast(),
+        "forecast_hourly": _hourly_forecast(),
+    }
+    projected = {
+        "measurements": project_measurements(raw["measurements"], XEMA_VARIABLES.values()),
+        "forecast": project_forecast(raw["forecast"], FORECAST_DAILY_VARIABLES),
+        "forecast_hourly": project_forecast(raw["forecast_hourly"], FORECAST_HOURLY_VARIABLES),
+    }
+
+    assert _deep_size(projected) < _deep_size(raw) / 2
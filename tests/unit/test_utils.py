@@ -4,11 +4,19 @@ import os
 from unittest.mock import patch
 import math
 
+import pytest
+
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 from custom_components.meteocat_community_edition.utils import (
+    calculate_absolute_humidity,
+    calculate_derived_metrics,
+    calculate_dew_point,
+    calculate_heat_index,
     calculate_utci,
+    calculate_wind_chill,
+    derive_station_metrics,
     get_utci_category_key,
     get_utci_icon,
 )
@@ -80,3 +88,38 @@ def test_get_utci_icon_coverage():
     """Test icon generation for coverage if logic exists."""
     # Assuming get_utci_icon mirrors logic or has ranges
     assert get_utci_icon(30) is not None
+
+def test_thermodynamic_reference_values():
+    """Test the derived metrics against published reference values."""
+    assert calculate_dew_point(20, 50) == 9.3
+    assert calculate_dew_point(30, 100) == 30.0
+    # NOAA table: 90 F and 70 % -> 106 F
+    assert calculate_heat_index(32.2, 70) == pytest.approx(41.1, abs=0.2)
+    assert calculate_heat_index(20, 50) == 20.0
+    # Environment Canada table: 0 C and 20 km/h -> -5.2
+    assert calculate_wind_chill(0, 20) == -5.2
+    assert calculate_wind_chill(15, 20) == 15.0
+    assert calculate_wind_chill(5, 3) == 5.0
+    assert calculate_absolute_humidity(20, 50) == 8.6
+
+def test_derived_metrics_need_their_inputs():
+    """Test that only the metrics with inputs are returned."""
+    assert calculate_derived_metrics(None, 50, 10) == {}
+    assert set(calculate_derived_metrics(20, None, 10)) == {"wind_chill", "apparent_temperature"}
+    metrics = calculate_derived_metrics(32.2, 70, None)
+    assert metrics["apparent_temperature"] == metrics["heat_index"]
+    assert calculate_derived_metrics(0, 80, 20)["apparent_temperature"] == -5.2
+
+def test_derive_station_metrics_latest_readings():
+    """Test one pass over the station variables, with wind in m/s."""
+    variables = [
+        {"codi": 32, "lectures": [{"valor": 12.0}, {"valor": 0.0}]},
+        {"codi": 33, "lectures": [{"valor": 80}]},
+        {"codi": 30, "lectures": [{"valor": 20 / 3.6}]},
+        {"codi": 34, "lectures": [{"valor": 1013}]},
+        {"codi": 35, "lectures": []},
+    ]
+    metrics = derive_station_metrics(variables)
+    assert metrics["wind_chill"] == -5.2
+    assert metrics["dew_point"] == calculate_dew_point(0.0, 80)
+    assert derive_station_metrics(None) == {}